@@ -0,0 +1,302 @@
+"""Benchmark: end-to-end install/update/diff/list against a fake registry.
+
+Each scenario creates a fresh project and an empty user cache, points
+``multikit.toml`` at an in-process ``FakeRegistry`` (see ``fake_registry.py``)
+and runs the real command handlers in order:
+
+* ``install`` — cold install of the first N kits
+* ``update``  — update every installed kit (nothing changed upstream)
+* ``diff``    — diff every installed kit against the registry
+* ``list``    — list available and installed kits
+
+Scenarios span kit counts x ``network.max_concurrency`` settings, under the
+injected latency/bandwidth/error faults. Wall time is the median of
+``--repeat`` runs; server-side request/connection counts come from the last
+run. Results are written as JSON so two commits can be compared:
+
+    python benchmarks/bench_commands.py --output before.json
+    git checkout <other> && python benchmarks/bench_commands.py \\
+        --output after.json --compare before.json
+
+Usage:
+    python benchmarks/bench_commands.py [--kit-counts 1,4,8]
+        [--concurrency 1,8] [--latency-ms 20] [--bandwidth-kbps 512]
+        [--error-rate 0.05] [--rate-limit-rate 0.05 --retry-after 0.1]
+        [--commands install,update,diff,list] [--repeat 3] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from fake_registry import KITS_DIR, REPO_ROOT, Faults, FakeRegistry
+
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from multikit.commands import diff as diff_cmd  # noqa: E402
+from multikit.commands import install as install_cmd  # noqa: E402
+from multikit.commands import list_cmd  # noqa: E402
+from multikit.commands import update as update_cmd  # noqa: E402
+from multikit.utils.toml_io import (  # noqa: E402
+    create_default_config,
+    load_config,
+    save_config,
+)
+
+COMMANDS = ("install", "update", "diff", "list")
+RESULTS_VERSION = 1
+
+
+def _installable_kits() -> list[str]:
+    """Kits in registry order whose declared files all exist under kits/."""
+    registry = json.loads((KITS_DIR / "registry.json").read_text(encoding="utf-8"))
+    names: list[str] = []
+    for entry in registry["kits"]:
+        manifest_path = KITS_DIR / entry["name"] / "manifest.json"
+        if not manifest_path.is_file():
+            continue
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        declared = [f"agents/{n}" for n in manifest.get("agents", [])]
+        declared += [f"prompts/{n}" for n in manifest.get("prompts", [])]
+        declared += [
+            f"templates/{t['agent']}/{t['src']}" for t in manifest.get("templates", [])
+        ]
+        if all((manifest_path.parent / key).is_file() for key in declared):
+            names.append(entry["name"])
+    return names
+
+
+def _select_all(config, action: str) -> list[str]:  # type: ignore[no-untyped-def]
+    """Non-interactive stand-in for the installed-kit picker."""
+    return list(config.kits)
+
+
+async def _run_handler(handler: Callable[[], Awaitable[None]]) -> bool:
+    """Run a command handler quietly; return whether it succeeded."""
+    sink = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+            await handler()
+    except SystemExit as exc:
+        return not exc.code
+    return True
+
+
+async def _run_scenario(
+    server: FakeRegistry,
+    kits: list[str],
+    concurrency: int,
+    commands: list[str],
+    work_dir: Path,
+) -> dict[str, tuple[float, bool, dict[str, int]]]:
+    """Run ``commands`` once in a fresh project; return per-command results."""
+    project_dir = work_dir / "project"
+    project_dir.mkdir()
+    os.environ["MULTIKIT_CACHE_DIR"] = str(work_dir / "cache")
+    create_default_config(project_dir)
+    config = load_config(project_dir)
+    config.registry_url = server.base_url
+    config.network.max_concurrency = concurrency
+    save_config(project_dir, config)
+
+    steps: dict[str, Callable[[], Awaitable[None]]] = {
+        "install": lambda: install_cmd.handler(*kits, force=True),
+        "update": lambda: update_cmd.handler(force=True),
+        "diff": lambda: diff_cmd.handler(),
+        "list": lambda: list_cmd.handler(),
+    }
+
+    results: dict[str, tuple[float, bool, dict[str, int]]] = {}
+    previous = Path.cwd()
+    os.chdir(project_dir)
+    try:
+        for command in COMMANDS:
+            if command not in commands and command != "install":
+                continue
+            server.reset()
+            started = time.perf_counter()
+            ok = await _run_handler(steps[command])
+            elapsed = time.perf_counter() - started
+            # install always runs: the other commands need installed kits
+            if command in commands:
+                results[command] = (elapsed, ok, server.counters())
+    finally:
+        os.chdir(previous)
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    available = _installable_kits()
+    faults = Faults(
+        latency=args.latency_ms / 1000,
+        bandwidth=args.bandwidth_kbps * 1024 if args.bandwidth_kbps else None,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    # update/diff would otherwise stop at the interactive kit picker
+    update_cmd.select_installed_kits = _select_all
+    diff_cmd.select_installed_kits = _select_all
+
+    results: list[dict[str, Any]] = []
+    print(
+        f"{'command':<8} {'kits':>4} {'conc':>4} {'median s':>9} {'req':>5} {'conn':>5}"
+    )
+    async with FakeRegistry(faults) as server:
+        for kit_count in args.kit_counts:
+            kits = available[:kit_count]
+            for concurrency in args.concurrency:
+                runs: dict[str, list[tuple[float, bool, dict[str, int]]]] = {}
+                for _ in range(args.repeat):
+                    with tempfile.TemporaryDirectory(prefix="multikit-bench-") as tmp:
+                        scenario = await _run_scenario(
+                            server, kits, concurrency, args.commands, Path(tmp)
+                        )
+                    for command, outcome in scenario.items():
+                        runs.setdefault(command, []).append(outcome)
+
+                for command, outcomes in runs.items():
+                    seconds = [elapsed for elapsed, _, _ in outcomes]
+                    counters = outcomes[-1][2]
+                    record = {
+                        "command": command,
+                        "kits": len(kits),
+                        "concurrency": concurrency,
+                        "seconds": [round(s, 6) for s in seconds],
+                        "median": round(statistics.median(seconds), 6),
+                        "failures": sum(not ok for _, ok, _ in outcomes),
+                        **counters,
+                    }
+                    results.append(record)
+                    print(
+                        f"{command:<8} {len(kits):>4} {concurrency:>4} "
+                        f"{record['median']:>9.3f} {counters['requests']:>5} "
+                        f"{counters['connections']:>5}"
+                        + (
+                            f"  ({record['failures']} failed)"
+                            if record["failures"]
+                            else ""
+                        )
+                    )
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": _metadata(),
+        "faults": asdict(faults),
+        "results": results,
+    }
+
+
+def _metadata() -> dict[str, str]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(current: dict[str, Any], baseline_path: Path) -> None:
+    """Print median-time ratios of ``current`` against a saved results file."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    def key(record: dict[str, Any]) -> tuple[str, int, int]:
+        return record["command"], record["kits"], record["concurrency"]
+
+    before = {key(r): r for r in baseline["results"]}
+    print(f"\nvs {baseline_path} (commit {baseline['meta']['commit']}):")
+    print(
+        f"{'command':<8} {'kits':>4} {'conc':>4} {'before':>9} {'after':>9} {'ratio':>7}"
+    )
+    for record in current["results"]:
+        old = before.get(key(record))
+        if old is None:
+            continue
+        ratio = record["median"] / old["median"] if old["median"] else float("inf")
+        print(
+            f"{record['command']:<8} {record['kits']:>4} {record['concurrency']:>4} "
+            f"{old['median']:>9.3f} {record['median']:>9.3f} {ratio:>6.2f}x"
+        )
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def _command_list(value: str) -> list[str]:
+    commands = [part for part in value.split(",") if part]
+    unknown = set(commands) - set(COMMANDS)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown command(s): {', '.join(unknown)}")
+    return commands
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--kit-counts", type=_int_list, default=[1, 4], help="Kits per scenario"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_int_list,
+        default=[1, 8],
+        help="network.max_concurrency values",
+    )
+    parser.add_argument(
+        "--commands",
+        type=_command_list,
+        default=list(COMMANDS),
+        help="Commands to time (install always runs first)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 fraction")
+    parser.add_argument(
+        "--rate-limit-rate", type=float, default=0.0, help="429 fraction"
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=0.1, help="Retry-After seconds on 429"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Fault injection seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--output", type=Path, help="Write JSON results here")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare to")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
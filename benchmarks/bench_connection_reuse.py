@@ -0,0 +1,80 @@
+"""Benchmark: TCP connections opened per kit download, pooled vs. per-call.
+
+Boots an in-process aiohttp server that serves the repository's ``kits/``
+directory and counts every inbound connection. The same kit is then fetched
+twice:
+
+* ``per-call`` — module-level helpers without a client, so every fetch builds
+  (and tears down) its own ``RemoteClient`` and session. This is how every
+  command behaved before sessions were pooled.
+* ``pooled`` — one ``RemoteClient`` shared by every fetch, as the commands
+  now do.
+
+Against a real HTTPS registry each new connection is also a TLS handshake.
+
+The server is the shared fake registry from ``fake_registry.py``.
+
+Usage:
+    python benchmarks/bench_connection_reuse.py [--kit dockit] [--rounds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+
+from fake_registry import REPO_ROOT, FakeRegistry
+
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from multikit.registry.remote import (  # noqa: E402
+    RemoteClient,
+    fetch_file,
+    fetch_manifest,
+)
+
+
+async def _download_kit(
+    registry_url: str, kit_name: str, client: RemoteClient | None
+) -> int:
+    """Fetch a kit's manifest and every file it declares. Returns file count."""
+    manifest = await fetch_manifest(registry_url, kit_name, client=client)
+    files = [(subdir, filename) for subdir, filename in manifest.all_files]
+    files += [(subdir, filename) for subdir, filename, _ in manifest.template_files]
+    for subdir, filename in files:
+        await fetch_file(registry_url, kit_name, subdir, filename, client=client)
+    return len(files)
+
+
+async def run(kit_name: str, rounds: int) -> None:
+    async with FakeRegistry() as server:
+        print(f"kit={kit_name} rounds={rounds} server={server.base_url}")
+        print(f"{'mode':<10} {'requests':>9} {'connections':>12} {'seconds':>9}")
+        for mode in ("per-call", "pooled"):
+            server.reset()
+            started = time.perf_counter()
+            for _ in range(rounds):
+                if mode == "pooled":
+                    async with RemoteClient() as client:
+                        await _download_kit(server.base_url, kit_name, client)
+                else:
+                    await _download_kit(server.base_url, kit_name, None)
+            elapsed = time.perf_counter() - started
+            print(
+                f"{mode:<10} {server.requests:>9} {server.connections:>12} "
+                f"{elapsed:>9.3f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kit", default="dockit", help="Kit under kits/ to fetch")
+    parser.add_argument("--rounds", type=int, default=3, help="Install repetitions")
+    args = parser.parse_args()
+    asyncio.run(run(args.kit, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark: diff engines on synthetic 10k-100k line generated files.
+
+Builds large YAML-like documents of the kind generated templates contain
+(many repeated keys and blank lines, a few unique values per record), edits
+a fraction of their lines and times ``generate_diff`` with every engine.
+``difflib``'s ``SequenceMatcher`` goes quadratic on such repetitive input, so
+runs above ``--difflib-max-lines`` skip it unless the limit is raised.
+
+Usage:
+    python benchmarks/bench_diff.py [--sizes 10000,50000,100000]
+        [--edit-rate 0.01] [--engines patience,difflib] [--output diff.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from fake_registry import REPO_ROOT
+
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from multikit.utils.diff import DIFF_ENGINES, generate_diff  # noqa: E402
+
+
+def _document(lines: int, rng: random.Random) -> list[str]:
+    """A YAML-like list of records: repeated keys, few unique values."""
+    doc: list[str] = []
+    record = 0
+    while len(doc) < lines:
+        doc += [
+            f"- name: item-{record}\n",
+            "  kind: generated\n",
+            "  enabled: true\n",
+            f"  weight: {rng.randint(0, 9)}\n",
+            "  tags:\n",
+            "    - default\n",
+            "\n",
+        ]
+        record += 1
+    return doc[:lines]
+
+
+def _edit(doc: list[str], rate: float, rng: random.Random) -> list[str]:
+    """Replace, delete or insert roughly ``rate`` of the lines."""
+    edited = list(doc)
+    for _ in range(max(1, int(len(doc) * rate))):
+        at = rng.randrange(len(edited))
+        op = rng.choice(("replace", "delete", "insert"))
+        if op == "replace":
+            edited[at] = f"  note: changed-{at}\n"
+        elif op == "delete":
+            del edited[at]
+        else:
+            edited.insert(at, "  enabled: false\n")
+    return edited
+
+
+def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    rng = random.Random(args.seed)
+    results: list[dict[str, Any]] = []
+    print(f"{'lines':>8} {'engine':<10} {'diff lines':>10} {'seconds':>9}")
+    for size in args.sizes:
+        old = _document(size, rng)
+        new = _edit(old, args.edit_rate, rng)
+        old_text, new_text = "".join(old), "".join(new)
+        for engine in args.engines:
+            if engine == "difflib" and size > args.difflib_max_lines:
+                print(f"{size:>8} {engine:<10} {'skipped':>10}")
+                continue
+            started = time.perf_counter()
+            diff = generate_diff(old_text, new_text, engine=engine)
+            elapsed = time.perf_counter() - started
+            print(f"{size:>8} {engine:<10} {len(diff):>10} {elapsed:>9.3f}")
+            results.append(
+                {
+                    "lines": size,
+                    "engine": engine,
+                    "diff_lines": len(diff),
+                    "seconds": elapsed,
+                }
+            )
+    return results
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def _engine_list(value: str) -> list[str]:
+    engines = [part for part in value.split(",") if part]
+    unknown = [name for name in engines if name not in DIFF_ENGINES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown engine(s): {', '.join(unknown)}")
+    return engines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=_int_list, default=[10_000, 50_000, 100_000])
+    parser.add_argument(
+        "--edit-rate", type=float, default=0.01, help="Fraction of lines edited"
+    )
+    parser.add_argument("--engines", type=_engine_list, default=list(DIFF_ENGINES))
+    parser.add_argument(
+        "--difflib-max-lines",
+        type=int,
+        default=20_000,
+        help="Skip the difflib engine above this many lines",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+    results = run(args)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""In-process fake registry server for benchmarks.
+
+Serves the repository's ``kits/`` directory over real loopback HTTP, so the
+client's connection pool, concurrency limits and retry logic are exercised
+for real (unlike ``aioresponses`` mocks). Faults are injectable:
+
+* ``latency`` — seconds added before every response
+* ``bandwidth`` — bytes/second cap applied to every response body
+* ``error_rate`` — fraction of requests answered with ``503``
+* ``rate_limit_rate`` — fraction answered with ``429`` + ``Retry-After``
+
+Responses carry an ``ETag`` and honour ``If-None-Match`` like a static CDN.
+Accepted connections and requests are counted per run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from aiohttp import web
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+KITS_DIR = REPO_ROOT / "kits"
+
+# Body write size when a bandwidth cap is set
+_CHUNK = 16 * 1024
+
+
+@dataclass
+class Faults:
+    """Injected server behaviour; the defaults serve files as fast as possible."""
+
+    latency: float = 0.0
+    bandwidth: float | None = None
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 0.1
+    seed: int = 0
+
+
+class FakeRegistry:
+    """Static file server over ``kits/`` with fault injection and counters."""
+
+    def __init__(self, faults: Faults | None = None, root: Path = KITS_DIR) -> None:
+        self.faults = faults or Faults()
+        self.root = root.resolve()
+        self.connections = 0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.not_modified = 0
+        self._rng = random.Random(self.faults.seed)
+        self._runner: web.AppRunner | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self.base_url = ""
+
+    async def _serve(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        faults = self.faults
+        if faults.latency:
+            await asyncio.sleep(faults.latency)
+
+        roll = self._rng.random()
+        if roll < faults.rate_limit_rate:
+            self.rate_limited += 1
+            return web.Response(
+                status=429, headers={"Retry-After": f"{faults.retry_after:g}"}
+            )
+        if roll < faults.rate_limit_rate + faults.error_rate:
+            self.errors += 1
+            return web.Response(status=503)
+
+        path = (self.root / request.match_info["path"]).resolve()
+        if not path.is_file() or self.root not in path.parents:
+            raise web.HTTPNotFound()
+        body = path.read_bytes()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        if faults.bandwidth is None:
+            return web.Response(body=body, headers={"ETag": etag})
+
+        resp = web.StreamResponse(headers={"ETag": etag})
+        resp.content_length = len(body)
+        await resp.prepare(request)
+        for offset in range(0, len(body), _CHUNK):
+            chunk = body[offset : offset + _CHUNK]
+            await asyncio.sleep(len(chunk) / faults.bandwidth)
+            await resp.write(chunk)
+        await resp.write_eof()
+        return resp
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._serve)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        handler_factory = self._runner.server
+        assert handler_factory is not None
+
+        def protocol_factory():  # type: ignore[no-untyped-def]
+            self.connections += 1
+            return handler_factory()
+
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(protocol_factory, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def __aenter__(self) -> FakeRegistry:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    def reset(self) -> None:
+        """Zero the counters (the RNG keeps its sequence)."""
+        self.connections = 0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.not_modified = 0
+
+    def counters(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "errors_injected": self.errors,
+            "rate_limited": self.rate_limited,
+            "not_modified": self.not_modified,
+        }
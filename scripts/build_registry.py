@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Write per-file hashes, sizes and archive bundles for every kit under kits/.
+
+``multikit install``/``update`` skip downloading any file whose local copy
+already matches the manifest hash, and fetch everything else from the kit's
+single ``<version>.tar.gz`` bundle when the manifest references one. Both
+must be regenerated whenever a kit file changes.
+
+Usage:
+    python scripts/build_registry.py          # rewrite manifests and archives
+    python scripts/build_registry.py --check  # exit 1 if anything is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import sys
+import tarfile
+from pathlib import Path
+
+KITS_DIR = Path(__file__).resolve().parent.parent / "kits"
+
+
+def _declared_files(manifest: dict) -> list[str]:
+    """Return 'subdir/filename' keys for every file the manifest declares."""
+    keys = [f"agents/{name}" for name in manifest.get("agents", [])]
+    keys += [f"prompts/{name}" for name in manifest.get("prompts", [])]
+    keys += [
+        f"templates/{entry['agent']}/{entry['src']}"
+        for entry in manifest.get("templates", [])
+    ]
+    return keys
+
+
+def _read_files(kit_dir: Path, manifest: dict) -> dict[str, bytes]:
+    """Read every declared file that exists, warning about missing ones."""
+    files: dict[str, bytes] = {}
+    for key in _declared_files(manifest):
+        path = kit_dir / key
+        if not path.is_file():
+            print(f"⚠ {kit_dir.name}: missing {key}, not hashed", file=sys.stderr)
+            continue
+        files[key] = path.read_bytes()
+    return files
+
+
+def build_archive(files: dict[str, bytes]) -> bytes:
+    """Return a reproducible tar.gz of ``files`` (fixed mtimes and owners)."""
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", filename="", mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            for key, data in files.items():
+                info = tarfile.TarInfo(key)
+                info.size = len(data)
+                info.mode = 0o644
+                tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _archive_members(path: Path) -> dict[str, bytes] | None:
+    """Return the members of an existing archive, or None if unreadable."""
+    try:
+        with tarfile.open(path, mode="r:gz") as tar:
+            members: dict[str, bytes] = {}
+            for member in tar:
+                extracted = tar.extractfile(member)
+                if extracted is not None:
+                    members[member.name] = extracted.read()
+            return members
+    except (OSError, tarfile.TarError, EOFError):
+        return None
+
+
+def build_manifest(manifest: dict, files: dict[str, bytes], archive: bytes) -> dict:
+    """Return ``manifest`` with ``hashes``/``sizes``/``archive`` recomputed."""
+    return {
+        **manifest,
+        "hashes": {
+            key: hashlib.sha256(data).hexdigest() for key, data in files.items()
+        },
+        "sizes": {key: len(data) for key, data in files.items()},
+        "archive": {
+            "path": f"{manifest['version']}.tar.gz",
+            "sha256": hashlib.sha256(archive).hexdigest(),
+            "size": len(archive),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit 1 if any manifest or archive is out of date",
+    )
+    args = parser.parse_args()
+
+    stale: list[str] = []
+    for manifest_path in sorted(KITS_DIR.glob("*/manifest.json")):
+        kit_dir = manifest_path.parent
+        current = manifest_path.read_text(encoding="utf-8")
+        manifest = json.loads(current)
+        files = _read_files(kit_dir, manifest)
+
+        # Reuse the existing archive when its members are unchanged so the
+        # published bytes (and their hash) stay stable across rebuilds.
+        archive_path = kit_dir / f"{manifest['version']}.tar.gz"
+        if _archive_members(archive_path) == files:
+            archive = archive_path.read_bytes()
+        else:
+            archive = build_archive(files)
+            stale.append(f"{kit_dir.name} (archive)")
+            if not args.check:
+                archive_path.write_bytes(archive)
+                print(f"✓ Wrote {archive_path.relative_to(KITS_DIR.parent)}")
+
+        rendered = json.dumps(
+            build_manifest(manifest, files, archive), indent=2, ensure_ascii=False
+        )
+        if rendered + "\n" != current:
+            stale.append(kit_dir.name)
+            if not args.check:
+                manifest_path.write_text(rendered + "\n", encoding="utf-8")
+                print(f"✓ Updated {manifest_path.relative_to(KITS_DIR.parent)}")
+
+        if not args.check:
+            for old in kit_dir.glob("*.tar.gz"):
+                if old != archive_path:
+                    old.unlink()
+                    print(f"✓ Removed {old.relative_to(KITS_DIR.parent)}")
+
+    if args.check and stale:
+        print(
+            f"✗ Stale kit metadata: {', '.join(stale)} "
+            "(run python scripts/build_registry.py)",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
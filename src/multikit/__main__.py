@@ -1,5 +1,5 @@
 """Allow running multikit as a module: python -m multikit."""
 
-from multikit.cli import app
+from multikit.cli import main
 
-app()
+main()
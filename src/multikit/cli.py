@@ -1,33 +1,94 @@
 """Multikit CLI — root application entry point."""
 
+import sys
+from pathlib import Path
+from typing import Annotated
+
 import cyclopts
+from cyclopts import Parameter
 
 from multikit import __version__
 
-app = cyclopts.App(
-    name="multikit",
-    help="Kit manager for VS Code Copilot agents.",
-    version=__version__,
+APP_HELP = "Kit manager for VS Code Copilot agents."
+
+# (command, module, help). The help text repeats each command app's own so
+# the root help can be rendered without importing any command module:
+# cyclopts resolves every lazy spec to build it, which would pull in
+# aiohttp, pydantic, questionary, ... just to print a list of names.
+COMMANDS = (
+    ("init", "init", "Initialize a new multikit project."),
+    ("install", "install", "Install a kit from the registry."),
+    ("uninstall", "uninstall", "Uninstall a kit."),
+    ("update", "update", "Update installed kit(s) to latest remote version."),
+    ("list", "list_cmd", "List available and installed kits."),
+    ("diff", "diff", "Show diff between local and remote kit files."),
+    ("cache", "cache", "Inspect and manage the local download cache."),
+    ("sync", "sync", "Reconcile installed kits with multikit.lock."),
+    ("status", "status", "Show installed kit files that changed locally."),
+    ("outdated", "outdated", "List installed kits with newer versions available."),
+    ("recover", "recover", "Finish or roll back an operation interrupted by a crash."),
 )
 
+app = cyclopts.App(name="multikit", help=APP_HELP, version=__version__)
+
 
 @app.default
 def default_action() -> None:
     """Show help when no command is specified."""
-    app.help_print()
-
-
-# Register sub-command apps
-from multikit.commands.init import app as init_app  # noqa: E402
-from multikit.commands.install import app as install_app  # noqa: E402
-from multikit.commands.uninstall import app as uninstall_app  # noqa: E402
-from multikit.commands.update import app as update_app  # noqa: E402
-from multikit.commands.list_cmd import app as list_app  # noqa: E402
-from multikit.commands.diff import app as diff_app  # noqa: E402
-
-app.command(init_app)
-app.command(install_app)
-app.command(uninstall_app)
-app.command(update_app)
-app.command(list_app)
-app.command(diff_app)
+    _help_app().help_print()
+
+
+# Register sub-command apps lazily: each command module (and the heavy
+# dependencies it pulls in, e.g. aiohttp) is imported only when dispatched.
+for _name, _module, _help in COMMANDS:
+    app.command(f"multikit.commands.{_module}:app", name=_name)
+
+
+@app.meta.default
+def launcher(
+    *tokens: Annotated[str, Parameter(show=False, allow_leading_hyphen=True)],
+    profile: Annotated[
+        bool,
+        Parameter(
+            negative="", help="Print a phase breakdown and per-host request latency"
+        ),
+    ] = False,
+    profile_trace: Annotated[
+        Path | None,
+        Parameter(help="Also write a Chrome trace-event JSON (Perfetto) here"),
+    ] = None,
+) -> None:
+    """Run a command, optionally under the hot-path profiler."""
+    if not profile and profile_trace is None:
+        app(tokens)
+        return
+
+    from multikit.utils import profiling
+
+    profiling.enable()
+    try:
+        app(tokens)
+    finally:
+        profiler = profiling.disable()
+        if profiler is not None:
+            profiler.print_report(sys.stderr)
+            if profile_trace is not None:
+                profiler.write_chrome_trace(profile_trace)
+                print(f"Trace written to {profile_trace}", file=sys.stderr)
+
+
+def _help_app() -> cyclopts.App:
+    """Stand-in for ``app`` whose commands carry only their static help."""
+    help_app = cyclopts.App(name="multikit", help=APP_HELP, version=__version__)
+    for name, _module, text in COMMANDS:
+        help_app.command(cyclopts.App(name=name, help=text))
+    help_app.meta.default(launcher)
+    return help_app
+
+
+def main() -> None:
+    """Console-script entry point: global options, then the command."""
+    if sys.argv[1:] in (["--help"], ["-h"]):
+        _help_app().meta()
+        return
+    app.meta()
@@ -0,0 +1,81 @@
+"""multikit cache — Inspect and manage the local download cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Annotated
+
+from cyclopts import App, Parameter
+from pydantic import ValidationError
+
+from multikit.registry.cache import BlobCache
+from multikit.utils.toml_io import load_config
+
+app = App(name="cache", help="Inspect and manage the local download cache.")
+
+
+def _format_size(num_bytes: int) -> str:
+    """Human-readable byte count (KiB/MiB/GiB)."""
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _open_cache() -> BlobCache:
+    """Open the user cache the way commands build it from the project config.
+
+    A disabled cache (``cache.enabled = false``) can still be inspected and
+    cleaned up.
+    """
+    try:
+        config = load_config(Path(".").resolve())
+    except (OSError, ValidationError) as exc:
+        print(f"✗ Config corrupted: {exc}", file=sys.stderr)
+        sys.exit(1)
+    cache = BlobCache.from_config(config.cache.model_copy(update={"enabled": True}))
+    assert cache is not None
+    return cache
+
+
+@app.default
+def handler() -> None:
+    """Show help for the cache command group."""
+    app.help_print()
+
+
+@app.command(name="info")
+def info() -> None:
+    """Show cache location, blob count and size."""
+    cache = _open_cache()
+    stats = cache.info()
+    print(f"Cache directory: {stats.root}")
+    print(f"Blobs: {stats.blob_count}")
+    print(f"Size: {_format_size(stats.total_bytes)} / {_format_size(stats.max_bytes)}")
+    print(f"Link mode: {cache.link}")
+
+
+@app.command(name="prune")
+def prune(
+    *,
+    max_size_mb: Annotated[
+        int | None,
+        Parameter(help="Target size in MiB (defaults to the configured cap)"),
+    ] = None,
+) -> None:
+    """Evict least recently used blobs until the cache fits its size cap."""
+    cache = _open_cache()
+    limit = None if max_size_mb is None else max_size_mb * 1024 * 1024
+    removed, freed = cache.prune(limit)
+    print(f"✓ Pruned {removed} blob(s), freed {_format_size(freed)}")
+
+
+@app.command(name="clear")
+def clear() -> None:
+    """Delete every cached blob."""
+    cache = _open_cache()
+    cache.clear()
+    print(f"✓ Cleared cache at {cache.root}")
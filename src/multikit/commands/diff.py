@@ -2,150 +2,411 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import json
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Annotated, TextIO
 
 import aiohttp
-from cyclopts import App
-
-from multikit.registry.remote import RemoteFetchError, fetch_file, fetch_manifest
-from multikit.utils.diff import generate_diff, print_colored_diff
+from cyclopts import App, Parameter
+from pydantic import ValidationError
+
+from multikit.models.kit import Manifest
+from multikit.registry.remote import (
+    HostUnreachableError,
+    RemoteClient,
+    RemoteFetchError,
+    create_client,
+    fetch_file,
+    fetch_manifest,
+)
+from multikit.utils.diff import diff_stat, format_colored_diff, generate_diff
+from multikit.utils.files import file_matches
 from multikit.utils.prompt import select_installed_kits
-from multikit.utils.toml_io import load_config
+from multikit.utils.toml_io import ConfigSession
 
 app = App(name="diff", help="Show diff between local and remote kit files.")
 
 
+# Output modes; only "patch" renders hunks
+PATCH = "patch"
+STAT = "stat"
+NAME_ONLY = "name-only"
+JSON = "json"
+
+MODIFIED = "modified"
+MISSING = "missing"
+UNCHANGED = "unchanged"
+ERROR = "error"
+
+# Widest +/- bar in --stat output
+_STAT_WIDTH = 40
+
+
+@dataclass
+class _FileDiff:
+    """Outcome of comparing one file, with its output held back for ordering."""
+
+    path: str
+    status: str
+    insertions: int = 0
+    deletions: int = 0
+    out: str = ""  # colored patch or missing-file line (patch mode)
+    error: str = ""
+
+    @property
+    def changed(self) -> bool:
+        return self.status in (MODIFIED, MISSING)
+
+
+class _OrderedOutput(io.StringIO):
+    """Holds a kit's output until the kits before it finish, then streams it.
+
+    Writes are buffered until :meth:`release`, which copies them to
+    ``target``; later writes go straight through, so the kit at the head of
+    the queue prints live.
+    """
+
+    def __init__(self, target: TextIO) -> None:
+        super().__init__()
+        self._target = target
+        self._released = False
+
+    def write(self, text: str) -> int:
+        if self._released:
+            return self._target.write(text)
+        return super().write(text)
+
+    def flush(self) -> None:
+        if self._released:
+            self._target.flush()
+
+    def release(self) -> None:
+        self._released = True
+        self._target.write(self.getvalue())
+        self._target.flush()
+
+
+async def _diff_file(
+    registry_url: str,
+    kit_name: str,
+    manifest: Manifest,
+    subdir: str,
+    filename: str,
+    local_path: Path,
+    path: str,
+    semaphore: asyncio.Semaphore,
+    client: RemoteClient | None = None,
+    template_dest: str | None = None,
+    output: str = PATCH,
+) -> _FileDiff:
+    """Compare one installed file with the registry, cheapest check first.
+
+    A missing local file needs no request, and one matching the sha256
+    published in the manifest is unchanged without fetching it. Only the
+    rest are fetched, and a unified diff is built only if the contents
+    actually differ and ``output`` shows hunks; ``stat``/``json`` only count
+    lines, and ``name-only`` skips the fetch whenever the published hash
+    already tells the file differs.
+    """
+    if not local_path.exists():
+        if template_dest is not None:
+            message = f"Template missing: {template_dest}"
+        else:
+            message = f"Local file missing: {subdir}/{filename}"
+        return _FileDiff(path, MISSING, out=f"  ✗ {message}\n")
+    sha256 = manifest.file_hash(subdir, filename)
+    if sha256 is not None:
+        if await asyncio.to_thread(
+            file_matches, local_path, sha256, manifest.file_size(subdir, filename)
+        ):
+            return _FileDiff(path, UNCHANGED)
+        if output == NAME_ONLY:
+            return _FileDiff(path, MODIFIED)
+
+    try:
+        async with semaphore:
+            remote_content = await fetch_file(
+                registry_url, kit_name, subdir, filename, client=client, sha256=sha256
+            )
+    except (RemoteFetchError, HostUnreachableError, aiohttp.ClientError) as exc:
+        # Concurrent fetches share the host's failure streak, so an
+        # unreachable host is reported per file like any fetch failure
+        if template_dest is not None:
+            message = f"Could not fetch remote template {subdir}/{filename}"
+        elif isinstance(exc, aiohttp.ClientError) and not isinstance(
+            exc, aiohttp.ClientResponseError
+        ):
+            message = f"Network error fetching {subdir}/{filename}"
+        else:
+            message = f"Could not fetch remote {subdir}/{filename}"
+        return _FileDiff(path, ERROR, error=message)
+
+    local_content = await asyncio.to_thread(local_path.read_text, encoding="utf-8")
+    if local_content == remote_content:
+        return _FileDiff(path, UNCHANGED)
+    if output == NAME_ONLY:
+        return _FileDiff(path, MODIFIED)
+    if output != PATCH:
+        insertions, deletions = diff_stat(local_content, remote_content)
+        return _FileDiff(path, MODIFIED, insertions, deletions)
+    diff_lines = generate_diff(
+        local_content,
+        remote_content,
+        old_label=f"local/{template_dest or filename}",
+        new_label=f"remote/{filename}",
+    )
+    return _FileDiff(path, MODIFIED, out=format_colored_diff(diff_lines))
+
+
+def _stat_line(result: _FileDiff, name_width: int, max_changes: int) -> str:
+    """One ``git diff --stat`` style row: path, line count and a +/- bar."""
+    if result.status == MISSING:
+        return f" {result.path:<{name_width}} | missing"
+    total = result.insertions + result.deletions
+    scale = min(1.0, _STAT_WIDTH / max_changes) if max_changes else 1.0
+    plus = round(result.insertions * scale)
+    minus = round(result.deletions * scale)
+    return f" {result.path:<{name_width}} | {total:>4} {'+' * plus}{'-' * minus}"
+
+
 async def _diff_single_kit(
     kit_name: str,
     project_dir: Path,
     github_dir: Path,
+    client: RemoteClient | None = None,
+    session: ConfigSession | None = None,
+    output: str = PATCH,
+    semaphore: asyncio.Semaphore | None = None,
+    out: TextIO | None = None,
+    err: TextIO | None = None,
+    strict: bool = False,
 ) -> bool:
-    """Diff a single kit. Returns True if no changes, False if changes found."""
-    config = load_config(project_dir)
+    """Diff a single kit. Returns True if no changes, False if changes found.
+
+    With ``strict`` a file that could not be fetched to compare also counts
+    as a failure; otherwise it is only reported.
+
+    ``output`` is ``patch`` (colored unified diffs), ``stat`` (changed line
+    counts), ``name-only`` (paths of changed files) or ``json`` (one JSON
+    object per file, printed as soon as it and the files before it are done).
+    ``semaphore`` caps in-flight fetches and may be shared between kits;
+    ``out``/``err`` default to the process's stdout/stderr.
+    """
+    config = (session or ConfigSession(project_dir)).config
+    out = out or sys.stdout
+    err = err or sys.stderr
 
     if not config.is_installed(kit_name):
-        print(f"✗ Kit '{kit_name}' is not installed", file=sys.stderr)
+        print(f"✗ Kit '{kit_name}' is not installed", file=err)
         return False
 
     installed_kit = config.get_kit(kit_name)
     assert installed_kit is not None
 
     try:
-        manifest = await fetch_manifest(config.registry_url, kit_name)
+        manifest = await fetch_manifest(config.registry_url, kit_name, client=client)
     except RemoteFetchError as exc:
         print(
             f"✗ Failed to fetch manifest after {exc.attempts} attempts: {exc}",
-            file=sys.stderr,
+            file=err,
         )
         return False
     except aiohttp.ClientResponseError as exc:
         if exc.status == 404:
-            print(f"✗ Kit '{kit_name}' not found in remote registry", file=sys.stderr)
+            print(f"✗ Kit '{kit_name}' not found in remote registry", file=err)
         else:
             print(
                 f"✗ HTTP error {exc.status} fetching manifest",
-                file=sys.stderr,
+                file=err,
             )
         return False
     except aiohttp.ClientError as exc:
-        print(f"✗ Network error: {exc}", file=sys.stderr)
+        print(f"✗ Network error: {exc}", file=err)
         return False
 
-    print(
-        f"Comparing {kit_name} "
-        f"(local v{installed_kit.version} ↔ remote v{manifest.version})"
-    )
-    print()
-
-    changed = 0
-    unchanged = 0
-
-    for subdir, filename in manifest.all_files:
-        local_path = github_dir / subdir / filename
-
-        try:
-            remote_content = await fetch_file(
-                config.registry_url, kit_name, subdir, filename
-            )
-        except RemoteFetchError:
-            print(f"  ⚠ Could not fetch remote {subdir}/{filename}", file=sys.stderr)
-            continue
-        except aiohttp.ClientResponseError:
-            print(f"  ⚠ Could not fetch remote {subdir}/{filename}", file=sys.stderr)
-            continue
-        except aiohttp.ClientError:
-            print(f"  ⚠ Network error fetching {subdir}/{filename}", file=sys.stderr)
-            continue
-
-        if not local_path.exists():
-            print(f"  ✗ Local file missing: {subdir}/{filename}")
-            changed += 1
-            continue
-
-        local_content = local_path.read_text(encoding="utf-8")
-
-        diff_lines = generate_diff(
-            local_content,
-            remote_content,
-            old_label=f"local/{filename}",
-            new_label=f"remote/{filename}",
+    if output in (PATCH, STAT):
+        print(
+            f"Comparing {kit_name} "
+            f"(local v{installed_kit.version} ↔ remote v{manifest.version})",
+            file=out,
         )
-
-        if diff_lines:
-            print_colored_diff(diff_lines)
-            changed += 1
-        else:
-            unchanged += 1
-
-    # Diff template files
-    for subdir, filename, entry in manifest.template_files:
-        local_path = project_dir / entry.dest
-
-        try:
-            remote_content = await fetch_file(
-                config.registry_url, kit_name, subdir, filename
-            )
-        except (RemoteFetchError, aiohttp.ClientResponseError, aiohttp.ClientError):
+        print(file=out)
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(config.network.max_concurrency)
+    diffs = [
+        _diff_file(
+            config.registry_url,
+            kit_name,
+            manifest,
+            subdir,
+            filename,
+            github_dir / subdir / filename,
+            f".github/{subdir}/{filename}",
+            semaphore,
+            client=client,
+            output=output,
+        )
+        for subdir, filename in manifest.all_files
+    ]
+    diffs += [
+        _diff_file(
+            config.registry_url,
+            kit_name,
+            manifest,
+            subdir,
+            filename,
+            project_dir / entry.dest,
+            entry.dest,
+            semaphore,
+            client=client,
+            template_dest=entry.dest,
+            output=output,
+        )
+        for subdir, filename, entry in manifest.template_files
+    ]
+    # All fetches run concurrently through the command's pooled client;
+    # results are written in manifest order as soon as each one is ready
+    tasks = [asyncio.ensure_future(diff) for diff in diffs]
+    results: list[_FileDiff] = []
+    try:
+        for task in tasks:
+            result = await task
+            results.append(result)
+            if output == JSON:
+                record: dict[str, str | int] = {
+                    "kit": kit_name,
+                    "path": result.path,
+                    "status": result.status,
+                    "insertions": result.insertions,
+                    "deletions": result.deletions,
+                }
+                if result.error:
+                    record["error"] = result.error
+                print(json.dumps(record, ensure_ascii=False), file=out, flush=True)
+                continue
+            if result.error:
+                print(f"  ⚠ {result.error}", file=err)
+            if output == PATCH:
+                out.write(result.out)
+            elif output == NAME_ONLY and result.changed:
+                print(result.path, file=out)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    changed = [result for result in results if result.changed]
+    unchanged = sum(result.status == UNCHANGED for result in results)
+    failed = sum(result.status == ERROR for result in results)
+    if output == STAT and changed:
+        name_width = max(len(result.path) for result in changed)
+        max_changes = max(r.insertions + r.deletions for r in changed)
+        for result in changed:
+            print(_stat_line(result, name_width, max_changes), file=out)
+        insertions = sum(result.insertions for result in changed)
+        deletions = sum(result.deletions for result in changed)
+        print(
+            f" {len(changed)} file(s) changed, "
+            f"{insertions} insertion(s)(+), {deletions} deletion(s)(-)",
+            file=out,
+        )
+    if output in (PATCH, STAT):
+        print(file=out)
+        if failed:
             print(
-                f"  ⚠ Could not fetch remote template {subdir}/{filename}",
-                file=sys.stderr,
+                f"✗ {failed} file(s) could not be compared, "
+                f"{len(changed)} changed, {unchanged} unchanged",
+                file=out,
             )
-            continue
-
-        if not local_path.exists():
-            print(f"  ✗ Template missing: {entry.dest}")
-            changed += 1
-            continue
+        elif not changed:
+            print(f"✓ No changes detected for {kit_name}", file=out)
+        else:
+            print(f"✓ {len(changed)} file(s) changed, {unchanged} unchanged", file=out)
+    return not changed and not (strict and failed)
 
-        local_content = local_path.read_text(encoding="utf-8")
 
-        diff_lines = generate_diff(
-            local_content,
-            remote_content,
-            old_label=f"local/{entry.dest}",
-            new_label=f"remote/{filename}",
+async def _diff_kits(
+    kit_names: list[str],
+    project_dir: Path,
+    github_dir: Path,
+    client: RemoteClient,
+    session: ConfigSession,
+    output: str = PATCH,
+) -> list[str]:
+    """Diff several kits concurrently; return the names that differ or failed.
+
+    Every kit shares the command's client and one fetch semaphore, so the
+    whole run stays within ``network.max_concurrency``. Reports keep the
+    given order and never interleave: the first unfinished kit prints live
+    (JSON records included), and a later kit's output is held only until
+    every kit before it is done.
+    """
+    semaphore = asyncio.Semaphore(session.config.network.max_concurrency)
+    buffers = [
+        (_OrderedOutput(sys.stdout), _OrderedOutput(sys.stderr)) for _ in kit_names
+    ]
+    tasks = [
+        asyncio.ensure_future(
+            _diff_single_kit(
+                name,
+                project_dir,
+                github_dir,
+                client=client,
+                session=session,
+                output=output,
+                semaphore=semaphore,
+                out=out,
+                err=err,
+                strict=True,
+            )
         )
-
-        if diff_lines:
-            print_colored_diff(diff_lines)
-            changed += 1
-        else:
-            unchanged += 1
-
-    print()
-    if changed == 0:
-        print(f"✓ No changes detected for {kit_name}")
-        return True
-    else:
-        print(f"✓ {changed} file(s) changed, {unchanged} unchanged")
-        return False
+        for name, (out, err) in zip(kit_names, buffers)
+    ]
+    changed: list[str] = []
+    try:
+        for name, task, (out, err) in zip(kit_names, tasks, buffers):
+            out.release()
+            err.release()
+            if not await task:
+                changed.append(name)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return changed
 
 
 @app.default
-async def handler(kit_name: str | None = None) -> None:
+async def handler(
+    kit_name: str | None = None,
+    *,
+    stat: Annotated[
+        bool, Parameter(negative="", help="Show changed line counts per file")
+    ] = False,
+    name_only: Annotated[
+        bool, Parameter(negative="", help="Show only the paths of changed files")
+    ] = False,
+    json_output: Annotated[
+        bool,
+        Parameter(name="--json", negative="", help="Print one JSON object per file"),
+    ] = False,
+    all_kits: Annotated[
+        bool,
+        Parameter(
+            name="--all", negative="", help="Diff every installed kit without prompting"
+        ),
+    ] = False,
+) -> None:
     """Show differences for an installed kit.
 
+    Several kits (``--all`` or an interactive selection) are diffed
+    concurrently and followed by a summary. Exits 1 when any file differs,
+    in every output mode; with several kits a file that could not be fetched
+    to compare also counts.
+
     Parameters
     ----------
     kit_name
@@ -154,31 +415,75 @@ async def handler(kit_name: str | None = None) -> None:
     project_dir = Path(".").resolve()
     github_dir = project_dir / ".github"
 
-    # Load config
+    modes = [
+        mode
+        for mode, enabled in ((STAT, stat), (NAME_ONLY, name_only), (JSON, json_output))
+        if enabled
+    ]
+    if len(modes) > 1:
+        print(
+            "✗ --stat, --name-only and --json are mutually exclusive",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    output = modes[0] if modes else PATCH
+    if all_kits and kit_name is not None:
+        print("✗ Pass either a kit name or --all, not both", file=sys.stderr)
+        sys.exit(1)
+
+    # Parse config once for every kit diffed below
     try:
-        config = load_config(project_dir)
-    except Exception as exc:
+        session = ConfigSession(project_dir)
+    except (OSError, ValidationError) as exc:
         print(f"✗ Config corrupted: {exc}", file=sys.stderr)
         sys.exit(1)
-
-    # Interactive multi-select when kit_name is not provided
-    if kit_name is None:
+    config = session.config
+
+    if kit_name is not None:
+        async with create_client(config) as client:
+            if not await _diff_single_kit(
+                kit_name,
+                project_dir,
+                github_dir,
+                client=client,
+                session=session,
+                output=output,
+            ):
+                sys.exit(1)
+        return
+
+    if all_kits:
+        kit_names = list(config.kits)
+        if not kit_names:
+            if output in (PATCH, STAT):
+                print("No kits installed.")
+            return
+    else:
+        # Interactive multi-select when kit_name is not provided
         kit_names = select_installed_kits(config, action="diff")
         if not kit_names:
             sys.exit(0)
-        has_changes = False
-        for name in kit_names:
-            if not await _diff_single_kit(name, project_dir, github_dir):
-                has_changes = True
-        if has_changes:
-            sys.exit(1)
-    else:
-        if not await _diff_single_kit(kit_name, project_dir, github_dir):
-            sys.exit(1)
+
+    async with create_client(config) as client:
+        changed = await _diff_kits(
+            kit_names, project_dir, github_dir, client, session, output
+        )
+    if output in (PATCH, STAT) and len(kit_names) > 1:
+        print()
+        if changed:
+            print(
+                f"✗ {len(changed)} of {len(kit_names)} kit(s) differ or failed: "
+                f"{', '.join(changed)}",
+                file=sys.stderr,
+            )
+        else:
+            print(f"✓ All {len(kit_names)} kit(s) match the registry")
+    if changed:
+        sys.exit(1)
 
 
-def diff_handler(kit_name: str | None = None) -> None:
+def diff_handler(kit_name: str | None = None, all_kits: bool = False) -> None:
     """Sync wrapper for diff handler."""
     import asyncio
 
-    asyncio.run(handler(kit_name))
+    asyncio.run(handler(kit_name, all_kits=all_kits))
@@ -2,48 +2,240 @@
 
 from __future__ import annotations
 
+import asyncio
+import shutil
 import sys
-from pathlib import Path
-from typing import Annotated
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path, PurePosixPath
+from typing import Annotated, Literal
 
 import aiohttp
 from cyclopts import App, Parameter
 
 from multikit.models.config import InstalledKit
+from multikit.models.kit import KitArchive, Manifest
+from multikit.models.lock import LockedFile, LockedKit
 from multikit.registry.remote import (
+    RemoteClient,
     RemoteFetchError,
-    fetch_file,
+    cached_registry,
+    create_client,
+    download_archive,
+    download_file,
     fetch_manifest,
     fetch_registry,
+    local_registry_path,
 )
+from multikit.utils.archive import ArchiveError, extract_archive_members
 from multikit.utils.diff import prompt_overwrite, show_diff
-from multikit.utils.files import atomic_staging, move_staged_files, stage_file
+from multikit.utils.files import file_matches, file_sha256, stage_copy
+from multikit.utils.journal import RECOVER_HINT, Transaction, has_pending_journal
 from multikit.utils.prompt import select_installable_kits
-from multikit.utils.toml_io import load_config, save_config
+from multikit.utils.toml_io import ConfigSession
 
 app = App(name="install", help="Install a kit from the registry.")
 
 
-async def _install_single_kit(
+async def _stage_from_archive(
+    staging_dir: Path,
+    registry_url: str,
     kit_name: str,
-    project_dir: Path,
-    github_dir: Path,
+    archive: KitArchive,
+    pending: list[tuple[str, str, str | None]],
+    client: RemoteClient | None = None,
+) -> tuple[list[tuple[str, str, str | None]], dict[str, str]]:
+    """Stage ``pending`` files from the kit's archive bundle in one request.
+
+    Returns the files that still need a per-file download (all of them when
+    the archive is unavailable, otherwise any member it lacks or whose
+    content does not match the manifest hash) and the verified sha256 of
+    each file staged, keyed by 'subdir/filename'. Files already in the
+    client's blob cache are materialised from it first, and verified
+    members are added to it, so the next project on the machine links them
+    instead of extracting the archive again.
+    """
+    cache = client.cache if client is not None else None
+    digests: dict[str, str] = {}
+    if cache is not None:
+        remaining = []
+        for subdir, filename, sha256 in pending:
+            dest = staging_dir / subdir / filename
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if sha256 is None or not await asyncio.to_thread(
+                cache.materialize, sha256, dest
+            ):
+                remaining.append((subdir, filename, sha256))
+            else:
+                digests[f"{subdir}/{filename}"] = sha256
+        pending = remaining
+        if not pending:
+            return [], digests
+
+    print(f"  Downloading {archive.path} ({len(pending)} files)...")
+    # The bundle itself lives beside the staged files but is never moved
+    # into the project; it is removed as soon as its members are extracted.
+    bundle = staging_dir / ".archive" / PurePosixPath(archive.path).name
+    try:
+        await download_archive(registry_url, kit_name, archive, bundle, client=client)
+        extracted = await asyncio.to_thread(
+            extract_archive_members,
+            bundle,
+            staging_dir,
+            {f"{subdir}/{filename}" for subdir, filename, _ in pending},
+        )
+    except (RemoteFetchError, aiohttp.ClientError, ArchiveError) as exc:
+        print(
+            f"⚠ Archive {archive.path} unavailable ({exc}); "
+            "downloading files individually",
+            file=sys.stderr,
+        )
+        return pending, digests
+    finally:
+        bundle.unlink(missing_ok=True)
+
+    missing = []
+    for subdir, filename, sha256 in pending:
+        if f"{subdir}/{filename}" not in extracted or (
+            sha256 is not None
+            and not await asyncio.to_thread(
+                file_matches, staging_dir / subdir / filename, sha256
+            )
+        ):
+            missing.append((subdir, filename, sha256))
+        elif sha256 is not None:
+            digests[f"{subdir}/{filename}"] = sha256
+    # Like per-file downloads, local registries are read in place, not cached
+    if cache is not None and local_registry_path(registry_url) is None:
+        for subdir, filename, sha256 in set(pending) - set(missing):
+            if sha256 is not None:
+                await asyncio.to_thread(
+                    cache.put_file, staging_dir / subdir / filename, sha256
+                )
+    return missing, digests
+
+
+async def _download_to_staging(
+    staging_dir: Path,
     registry_url: str,
-    force: bool,
-) -> bool:
-    """Install a single kit. Returns True on success, False on failure."""
-    config = load_config(project_dir)
+    kit_name: str,
+    files: list[tuple[str, str]],
+    semaphore: asyncio.Semaphore,
+    client: RemoteClient | None = None,
+    manifest: Manifest | None = None,
+    local_paths: dict[tuple[str, str], Path] | None = None,
+) -> dict[str, str] | None:
+    """Download files concurrently and stream them into the staging dir.
+
+    Each response is written to its staging path chunk by chunk and hashed
+    as it arrives, so memory stays flat regardless of file size. Requests
+    are bounded by ``semaphore``, which a batch install shares across kits.
+    Results are checked in ``files`` order, so the first failing file (as
+    listed) is reported with the same message a sequential download would
+    print.
+
+    When ``manifest`` publishes a sha256 for a file and its ``local_paths``
+    entry already has that hash, the local copy is staged instead and no
+    request is made. When it references an archive bundle, the remaining
+    files come from that single download; per-file fetches are only the
+    fallback.
+
+    Returns the sha256 of every staged file whose content was verified on
+    the way in, keyed by 'subdir/filename', or None on a download error.
+    """
+    local_paths = local_paths or {}
+    digests: dict[str, str] = {}
+
+    async def fetch_one(subdir: str, filename: str, sha256: str | None) -> str:
+        async with semaphore:
+            return await download_file(
+                registry_url,
+                kit_name,
+                subdir,
+                filename,
+                staging_dir / subdir / filename,
+                client=client,
+                sha256=sha256,
+            )
 
-    # Fetch manifest
+    pending: list[tuple[str, str, str | None]] = []
+    for subdir, filename in files:
+        sha256 = manifest.file_hash(subdir, filename) if manifest else None
+        local = local_paths.get((subdir, filename))
+        if (
+            manifest is not None
+            and sha256 is not None
+            and local is not None
+            and await asyncio.to_thread(
+                file_matches, local, sha256, manifest.file_size(subdir, filename)
+            )
+        ):
+            await asyncio.to_thread(stage_copy, staging_dir, subdir, filename, local)
+            digests[f"{subdir}/{filename}"] = sha256
+            continue
+        pending.append((subdir, filename, sha256))
+
+    if manifest is not None and manifest.archive is not None and pending:
+        async with semaphore:
+            pending, extracted = await _stage_from_archive(
+                staging_dir, registry_url, kit_name, manifest.archive, pending, client
+            )
+        digests.update(extracted)
+    for subdir, filename, _ in pending:
+        print(f"  Downloading {subdir}/{filename}...")
+
+    results = await asyncio.gather(
+        *(fetch_one(subdir, filename, sha256) for subdir, filename, sha256 in pending),
+        return_exceptions=True,
+    )
+
+    for (subdir, filename, _), result in zip(pending, results):
+        if isinstance(result, RemoteFetchError):
+            print(
+                f"✗ Failed to download {subdir}/{filename} after {result.attempts} attempts: {result}",
+                file=sys.stderr,
+            )
+            return None
+        if isinstance(result, aiohttp.ClientResponseError):
+            if result.status == 404:
+                print(
+                    f"✗ File not found: {subdir}/{filename}",
+                    file=sys.stderr,
+                )
+            else:
+                print(
+                    f"✗ HTTP error {result.status} downloading {subdir}/{filename}",
+                    file=sys.stderr,
+                )
+            return None
+        if isinstance(result, aiohttp.ClientError):
+            print(
+                f"✗ Network error downloading {subdir}/{filename}: {result}",
+                file=sys.stderr,
+            )
+            return None
+        if isinstance(result, BaseException):
+            raise result
+        digests[f"{subdir}/{filename}"] = result
+
+    return digests
+
+
+async def _fetch_kit_manifest(
+    kit_name: str,
+    registry_url: str,
+    client: RemoteClient | None = None,
+) -> Manifest | None:
+    """Fetch a kit's manifest, reporting failures. Returns None on error."""
     print(f"Fetching manifest for '{kit_name}'...")
     try:
-        manifest = await fetch_manifest(registry_url, kit_name)
+        manifest = await fetch_manifest(registry_url, kit_name, client=client)
     except RemoteFetchError as exc:
         print(
             f"✗ Failed to fetch manifest after {exc.attempts} attempts: {exc}",
             file=sys.stderr,
         )
-        return False
+        return None
     except aiohttp.ClientResponseError as exc:
         if exc.status == 404:
             print(f"✗ Kit '{kit_name}' not found", file=sys.stderr)
@@ -52,263 +244,524 @@ async def _install_single_kit(
                 f"✗ HTTP error {exc.status} fetching manifest",
                 file=sys.stderr,
             )
-        return False
+        return None
     except aiohttp.ClientError as exc:
         print(f"✗ Network error: {exc}", file=sys.stderr)
-        return False
+        return None
 
     if not manifest.agents and not manifest.prompts and not manifest.templates:
         print(f"⚠ Kit '{kit_name}' declares no files to install", file=sys.stderr)
+    return manifest
 
-    # Download all files atomically to temp dir
-    print(f"Downloading {kit_name} v{manifest.version}...")
-    try:
-        with atomic_staging() as staging_dir:
-            for subdir, filename in manifest.all_files:
-                print(f"  Downloading {subdir}/{filename}...")
-                try:
-                    content = await fetch_file(registry_url, kit_name, subdir, filename)
-                except RemoteFetchError as exc:
-                    print(
-                        f"✗ Failed to download {subdir}/{filename} after {exc.attempts} attempts: {exc}",
-                        file=sys.stderr,
-                    )
-                    return False
-                except aiohttp.ClientResponseError as exc:
-                    if exc.status == 404:
-                        print(
-                            f"✗ File not found: {subdir}/{filename}",
-                            file=sys.stderr,
-                        )
-                    else:
-                        print(
-                            f"✗ HTTP error {exc.status} downloading "
-                            f"{subdir}/{filename}",
-                            file=sys.stderr,
-                        )
-                    return False
-                except aiohttp.ClientError as exc:
-                    print(
-                        f"✗ Network error downloading {subdir}/{filename}: {exc}",
-                        file=sys.stderr,
-                    )
-                    return False
-
-                stage_file(staging_dir, subdir, filename, content)
-
-            # Download template files
-            for subdir, filename, _entry in manifest.template_files:
-                print(f"  Downloading {subdir}/{filename}...")
-                try:
-                    content = await fetch_file(registry_url, kit_name, subdir, filename)
-                except RemoteFetchError as exc:
-                    print(
-                        f"✗ Failed to download {subdir}/{filename} after {exc.attempts} attempts: {exc}",
-                        file=sys.stderr,
-                    )
-                    return False
-                except aiohttp.ClientResponseError as exc:
-                    if exc.status == 404:
-                        print(
-                            f"✗ File not found: {subdir}/{filename}",
-                            file=sys.stderr,
-                        )
-                    else:
-                        print(
-                            f"✗ HTTP error {exc.status} downloading "
-                            f"{subdir}/{filename}",
-                            file=sys.stderr,
-                        )
-                    return False
-                except aiohttp.ClientError as exc:
-                    print(
-                        f"✗ Network error downloading {subdir}/{filename}: {exc}",
-                        file=sys.stderr,
-                    )
-                    return False
-
-                stage_file(staging_dir, subdir, filename, content)
-
-            # Compare with local and resolve conflicts
-            files_to_install: list[tuple[str, str]] = []
-            overwrite_all = force
-            skip_all = False
-
-            for subdir, filename in manifest.all_files:
-                rel_path = f"{subdir}/{filename}"
-                local_file = github_dir / subdir / filename
-                staged_file = staging_dir / subdir / filename
-
-                if not local_file.exists():
-                    # New file — always install
-                    files_to_install.append((subdir, filename))
-                    continue
-
-                if overwrite_all:
-                    files_to_install.append((subdir, filename))
-                    continue
-
-                local_content = local_file.read_text(encoding="utf-8")
-                remote_content = staged_file.read_text(encoding="utf-8")
-
-                if local_content == remote_content:
-                    print(f"  ✓ {rel_path} (unchanged)")
-                    files_to_install.append((subdir, filename))
-                    continue
-
-                # Actual conflict: local file exists with different content
-                if skip_all:
-                    print(f"  Skipped {rel_path}")
-                    continue
-
-                print(f"\n  Conflict: {rel_path}")
-                show_diff(local_content, remote_content, filename)
-
-                choice = prompt_overwrite(rel_path)
-                if choice == "y":
-                    files_to_install.append((subdir, filename))
-                elif choice == "n":
-                    print(f"  Skipped {rel_path}")
-                    continue
-                elif choice == "a":
-                    overwrite_all = True
-                    files_to_install.append((subdir, filename))
-                elif choice == "s":
-                    skip_all = True
-                    print(f"  Skipped {rel_path}")
-                    continue
-
-            # Move files from staging to .github/
-            if files_to_install:
-                installed_paths = move_staged_files(
-                    staging_dir, github_dir, files_to_install
-                )
-            else:
-                installed_paths = []
 
-            # Install templates to their dest paths
-            installed_template_paths: list[str] = []
-            for subdir, filename, entry in manifest.template_files:
-                staged_file = staging_dir / subdir / filename
-                dest_file = project_dir / entry.dest
+async def _stage_kit(
+    kit_name: str,
+    manifest: Manifest,
+    staging_dir: Path,
+    project_dir: Path,
+    github_dir: Path,
+    registry_url: str,
+    force: bool,
+    semaphore: asyncio.Semaphore,
+    client: RemoteClient | None = None,
+) -> dict[str, str] | None:
+    """Download every file the kit needs into ``staging_dir``.
+
+    Agents, prompts and templates are fetched together under ``semaphore``.
+    Templates that would be kept as-is (existing dest, overwrite=False) are
+    not fetched at all. Returns the staged files' known sha256 digests, as
+    ``_download_to_staging`` does, or None on failure.
+    """
+    downloads = list(manifest.all_files)
+    local_paths = {
+        (subdir, filename): github_dir / subdir / filename
+        for subdir, filename in manifest.all_files
+    }
+    for subdir, filename, entry in manifest.template_files:
+        dest_file = project_dir / entry.dest
+        if dest_file.exists() and not entry.overwrite and not force:
+            continue
+        downloads.append((subdir, filename))
+        local_paths[(subdir, filename)] = dest_file
+    return await _download_to_staging(
+        staging_dir,
+        registry_url,
+        kit_name,
+        downloads,
+        semaphore,
+        client=client,
+        manifest=manifest,
+        local_paths=local_paths,
+    )
+
+
+def _apply_kit(
+    manifest: Manifest,
+    staging_dir: Path,
+    project_dir: Path,
+    github_dir: Path,
+    force: bool,
+    transaction: Transaction,
+    staged: dict[str, tuple[str, int]],
+) -> InstalledKit:
+    """Resolve conflicts against the project and plan the staged moves.
+
+    ``staged`` maps each staged source to its ``(sha256, size)``, from
+    :func:`_staged_digests`. Nothing in the project changes until
+    ``transaction`` commits. Returns the ``InstalledKit`` record to store in
+    ``multikit.toml``.
+    """
+    # Compare with local and resolve conflicts
+    files_to_install: list[tuple[str, str]] = []
+    overwrite_all = force
+    skip_all = False
+
+    for subdir, filename in manifest.all_files:
+        rel_path = f"{subdir}/{filename}"
+        local_file = github_dir / subdir / filename
+        staged_file = staging_dir / subdir / filename
+
+        if not local_file.exists():
+            # New file — always install
+            files_to_install.append((subdir, filename))
+            continue
+
+        if overwrite_all:
+            files_to_install.append((subdir, filename))
+            continue
+
+        local_content = local_file.read_text(encoding="utf-8")
+        remote_content = staged_file.read_text(encoding="utf-8")
+
+        if local_content == remote_content:
+            print(f"  ✓ {rel_path} (unchanged)")
+            files_to_install.append((subdir, filename))
+            continue
+
+        # Actual conflict: local file exists with different content
+        if skip_all:
+            print(f"  Skipped {rel_path}")
+            continue
+
+        print(f"\n  Conflict: {rel_path}")
+        show_diff(local_content, remote_content, filename)
+
+        choice = prompt_overwrite(rel_path)
+        if choice == "y":
+            files_to_install.append((subdir, filename))
+        elif choice == "n":
+            print(f"  Skipped {rel_path}")
+            continue
+        elif choice == "a":
+            overwrite_all = True
+            files_to_install.append((subdir, filename))
+        elif choice == "s":
+            skip_all = True
+            print(f"  Skipped {rel_path}")
+            continue
+
+    # Plan moves from staging to .github/; hashes come from the staged copy
+    # that will land there, so `multikit status` can detect drift offline
+    installed_paths: list[str] = []
+    hashes: dict[str, str] = {}
+    for subdir, filename in files_to_install:
+        staged_file = staging_dir / subdir / filename
+        if not staged_file.exists():
+            continue
+        transaction.add(staged_file, github_dir / subdir / filename)
+        rel_path = f"{subdir}/{filename}"
+        installed_paths.append(rel_path)
+        hashes[rel_path] = staged[rel_path][0]
+
+    # Install templates to their dest paths. A staged template is renamed
+    # into place unless a later entry still needs the same source, in which
+    # case a private copy is staged for it.
+    installed_template_paths: list[str] = []
+    pending_sources = Counter(
+        (subdir, filename) for subdir, filename, _ in manifest.template_files
+    )
+    for index, (subdir, filename, entry) in enumerate(manifest.template_files):
+        pending_sources[(subdir, filename)] -= 1
+        staged_file = staging_dir / subdir / filename
+        dest_file = project_dir / entry.dest
+        installed_template_paths.append(entry.dest)
+
+        if dest_file.exists() and not entry.overwrite and not force:
+            print(f"  ✓ {entry.dest} (already exists, skipped)")
+            hashes[entry.dest] = file_sha256(dest_file)
+            continue
+
+        if dest_file.exists() and not force:
+            local_content = dest_file.read_text(encoding="utf-8")
+            remote_content = staged_file.read_text(encoding="utf-8")
+
+            if local_content == remote_content:
+                print(f"  ✓ {entry.dest} (unchanged)")
+                hashes[entry.dest] = file_sha256(dest_file)
+                continue
+
+            print(f"\n  Template conflict: {entry.dest}")
+            show_diff(local_content, remote_content, filename)
+
+            choice = prompt_overwrite(entry.dest)
+            if choice in ("n", "s"):
+                print(f"  Skipped {entry.dest}")
+                hashes[entry.dest] = file_sha256(dest_file)
+                continue
+
+        if pending_sources[(subdir, filename)]:
+            copy = staging_dir / ".copies" / f"{index}-{filename}"
+            copy.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(staged_file, copy)
+            staged_file = copy
+        transaction.add(staged_file, dest_file)
+        hashes[entry.dest] = staged[f"{subdir}/{filename}"][0]
+        print(f"  ✓ {entry.dest} (template installed)")
+
+    return InstalledKit(
+        version=manifest.version,
+        source="remote",
+        files=installed_paths,
+        templates=installed_template_paths,
+        hashes=hashes,
+    )
+
 
-                if dest_file.exists() and not entry.overwrite and not force:
-                    print(f"  ✓ {entry.dest} (already exists, skipped)")
-                    installed_template_paths.append(entry.dest)
-                    continue
+def _staged_digests(
+    manifest: Manifest, staging_dir: Path, known: dict[str, str]
+) -> dict[str, tuple[str, int]]:
+    """``(sha256, size)`` of every staged kit file, keyed by its source.
 
-                if dest_file.exists() and not force:
-                    local_content = dest_file.read_text(encoding="utf-8")
-                    remote_content = staged_file.read_text(encoding="utf-8")
+    ``known`` holds the digests verified while staging; only files missing
+    from it (no published hash) are read and hashed here.
+    """
+    digests: dict[str, tuple[str, int]] = {}
+    sources = list(manifest.all_files) + [
+        (subdir, filename) for subdir, filename, _ in manifest.template_files
+    ]
+    for subdir, filename in sources:
+        source = f"{subdir}/{filename}"
+        staged_file = staging_dir / subdir / filename
+        if source in digests or not staged_file.is_file():
+            continue
+        sha256 = known.get(source) or file_sha256(staged_file)
+        digests[source] = (sha256, staged_file.stat().st_size)
+    return digests
+
+
+def _lock_kit(
+    manifest: Manifest,
+    kit: InstalledKit,
+    staged: dict[str, tuple[str, int]],
+    registry_url: str,
+) -> LockedKit:
+    """Pin the files ``kit`` installed to their registry content hashes.
 
-                    if local_content == remote_content:
-                        print(f"  ✓ {entry.dest} (unchanged)")
-                        installed_template_paths.append(entry.dest)
-                        continue
+    Hashes come from the staged (remote) copy, falling back to the manifest
+    for templates that were never fetched. Files skipped on conflict, and
+    kept templates with no published hash, are left out.
+    """
+    files: list[LockedFile] = []
 
-                    print(f"\n  Template conflict: {entry.dest}")
-                    show_diff(local_content, remote_content, filename)
+    def pin(subdir: str, filename: str, path: str, overwrite: bool) -> None:
+        source = f"{subdir}/{filename}"
+        sha256, size = staged.get(source) or (
+            manifest.file_hash(subdir, filename),
+            manifest.file_size(subdir, filename),
+        )
+        if sha256 is None or size is None:
+            return
+        files.append(
+            LockedFile(
+                path=path, source=source, sha256=sha256, size=size, overwrite=overwrite
+            )
+        )
 
-                    choice = prompt_overwrite(entry.dest)
-                    if choice in ("n", "s"):
-                        print(f"  Skipped {entry.dest}")
-                        installed_template_paths.append(entry.dest)
-                        continue
+    installed_files = set(kit.files)
+    for subdir, filename in manifest.all_files:
+        if f"{subdir}/{filename}" in installed_files:
+            pin(subdir, filename, f".github/{subdir}/{filename}", True)
+    installed_templates = set(kit.templates)
+    for subdir, filename, entry in manifest.template_files:
+        if entry.dest in installed_templates:
+            pin(subdir, filename, entry.dest, entry.overwrite)
 
-                # Copy template to dest
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                import shutil
+    return LockedKit(version=manifest.version, registry_url=registry_url, files=files)
 
-                shutil.copy2(str(staged_file), str(dest_file))
-                print(f"  ✓ {entry.dest} (template installed)")
-                installed_template_paths.append(entry.dest)
 
-    except Exception as exc:
-        print(f"✗ Installation failed: {exc}", file=sys.stderr)
-        return False
+async def _install_kits(
+    kit_names: list[str],
+    project_dir: Path,
+    github_dir: Path,
+    registry_url: str,
+    force: bool,
+    client: RemoteClient | None = None,
+    session: ConfigSession | None = None,
+    transaction: Transaction | None = None,
+) -> list[str]:
+    """Install several kits as one batch. Returns the names that failed.
+
+    All manifests are fetched concurrently, then every kit's files are
+    downloaded concurrently under one shared ``max_concurrency`` budget.
+    Conflicts are resolved kit by kit (prompts stay sequential) and the
+    successful kits are recorded in ``session`` and pinned by content hash
+    in ``multikit.lock``.
+
+    The batch is all-or-nothing: files and config changes are committed by
+    one journaled :class:`Transaction`, and only if every kit succeeded.
+    When the caller passes ``transaction`` it commits it instead, e.g.
+    after updating more kits.
+    """
+    if session is None:
+        session = ConfigSession(project_dir)
+    config = session.config
 
-    # Update config
-    config.kits[kit_name] = InstalledKit(
-        version=manifest.version,
-        source="remote",
-        files=installed_paths,
-        templates=installed_template_paths,
+    manifests = await asyncio.gather(
+        *(_fetch_kit_manifest(name, registry_url, client) for name in kit_names)
     )
-    save_config(project_dir, config)
+    failed = {name for name, manifest in zip(kit_names, manifests) if manifest is None}
+    ready = [
+        (name, manifest)
+        for name, manifest in zip(kit_names, manifests)
+        if manifest is not None
+    ]
+
+    installed: dict[str, InstalledKit] = {}
+    semaphore = asyncio.Semaphore(config.network.max_concurrency)
+    # Download all files to the transaction's staging dir (inside .github/,
+    # so the commit renames instead of copying), one subdir per kit
+    with (
+        Transaction(project_dir, session) if transaction is None else nullcontext()
+    ) as own_transaction:
+        txn = transaction or own_transaction
+        staging_root = txn.staging_dir
+        for name, manifest in ready:
+            print(f"Downloading {name} v{manifest.version}...")
+        staged = await asyncio.gather(
+            *(
+                _stage_kit(
+                    name,
+                    manifest,
+                    staging_root / name,
+                    project_dir,
+                    github_dir,
+                    registry_url,
+                    force,
+                    semaphore,
+                    client=client,
+                )
+                for name, manifest in ready
+            ),
+            return_exceptions=True,
+        )
+
+        for (name, manifest), result in zip(ready, staged):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                print(f"✗ Installation failed: {result}", file=sys.stderr)
+                failed.add(name)
+                continue
+            if result is None:
+                failed.add(name)
+                continue
+            try:
+                digests = _staged_digests(manifest, staging_root / name, result)
+                installed[name] = _apply_kit(
+                    manifest,
+                    staging_root / name,
+                    project_dir,
+                    github_dir,
+                    force,
+                    txn,
+                    digests,
+                )
+                session.set_kit(
+                    name,
+                    installed[name],
+                    _lock_kit(manifest, installed[name], digests, registry_url),
+                )
+            except Exception as exc:
+                print(f"✗ Installation failed: {exc}", file=sys.stderr)
+                failed.add(name)
 
-    print(f"✓ Installed {kit_name} v{manifest.version}")
-    return True
+        if transaction is not None:
+            return [name for name in kit_names if name in failed]
+        if failed:
+            if installed:
+                print(
+                    f"✗ Not installed: {', '.join(installed)} "
+                    "(a batch is installed only if every kit succeeds)",
+                    file=sys.stderr,
+                )
+            return [name for name in kit_names if name in failed]
+        try:
+            txn.commit()
+        except Exception as exc:
+            print(f"✗ Installation failed, rolled back: {exc}", file=sys.stderr)
+            return list(kit_names)
+
+    for name, kit in installed.items():
+        print(f"✓ Installed {name} v{kit.version}")
+    return []
+
+
+async def _install_single_kit(
+    kit_name: str,
+    project_dir: Path,
+    github_dir: Path,
+    registry_url: str,
+    force: bool,
+    client: RemoteClient | None = None,
+    session: ConfigSession | None = None,
+    transaction: Transaction | None = None,
+) -> bool:
+    """Install a single kit. Returns True on success, False on failure.
+
+    ``client`` is the command's pooled RemoteClient; when omitted each fetch
+    uses a short-lived client of its own. ``session`` and ``transaction``
+    are the command's config session and pending commit; when omitted the
+    kit is committed on its own.
+    """
+    failed = await _install_kits(
+        [kit_name],
+        project_dir,
+        github_dir,
+        registry_url,
+        force,
+        client=client,
+        session=session,
+        transaction=transaction,
+    )
+    return not failed
 
 
 @app.default
 async def handler(
-    kit_name: Annotated[
-        str | None,
-        Parameter(help="Name of the kit to install (interactive if omitted)"),
-    ] = None,
-    *,
+    *kit_names: Annotated[
+        str,
+        Parameter(help="Names of the kits to install (interactive if omitted)"),
+    ],
     force: Annotated[
         bool, Parameter(help="Overwrite all without confirmation")
     ] = False,
     registry: Annotated[
         str | None,
-        Parameter(name="--registry", help="Custom registry base URL"),
+        Parameter(name="--registry", help="Custom registry base URL or local path"),
     ] = None,
+    link: Annotated[
+        Literal["auto", "reflink", "hardlink", "copy"] | None,
+        Parameter(
+            name="--link",
+            help="How files are materialised from the cache (default: cache.link)",
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        Parameter(
+            negative="", help="Revalidate registry.json before the interactive prompt"
+        ),
+    ] = False,
 ) -> None:
     """Async install handler.
 
     Parameters
     ----------
-    kit_name
-        Name of the kit to install. If omitted, shows an interactive selection.
+    kit_names
+        Names of the kits to install. If omitted, shows an interactive selection.
+        Several kits are installed as one batch with a single config write.
+    link
+        ``reflink`` or ``hardlink`` place files from the shared cache without
+        copying bytes; ``auto`` reflinks where the filesystem supports it and
+        copies otherwise. Hard-linked files share storage with the cache, so
+        edit them by replacing rather than rewriting in place.
+    refresh
+        The interactive prompt lists the cached registry.json at once and
+        revalidates a copy older than ``cache.registry_ttl`` in the
+        background; ``--refresh`` waits for the registry first.
     """
     project_dir = Path(".").resolve()
     github_dir = project_dir / ".github"
 
-    # Load config
+    if has_pending_journal(project_dir):
+        print(RECOVER_HINT, file=sys.stderr)
+        sys.exit(1)
+
+    # Parse config once; every kit below records into this session
     try:
-        config = load_config(project_dir)
+        session = ConfigSession(project_dir)
     except Exception as exc:
         print(f"✗ Config corrupted: {exc}", file=sys.stderr)
         sys.exit(1)
+    config = session.config
 
     registry_url = registry or config.registry_url
 
-    # Interactive multi-select when kit_name is not provided
-    if kit_name is None:
-        try:
-            remote_registry = await fetch_registry(registry_url)
-        except Exception:
-            print("✗ Cannot fetch registry for interactive selection.", file=sys.stderr)
-            sys.exit(1)
-        kit_names = select_installable_kits(config, remote_registry)
+    # One pooled client for the whole command: every manifest/file fetch
+    # below reuses its keep-alive connections.
+    async with create_client(config, link=link) as client:
+        # Interactive multi-select when no kit name is provided
         if not kit_names:
-            sys.exit(0)
-        failed = []
-        for name in kit_names:
+            try:
+                remote_registry = None
+                if not refresh:
+                    remote_registry = cached_registry(registry_url, client)
+                if remote_registry is None:
+                    remote_registry = await fetch_registry(registry_url, client=client)
+            except Exception:
+                print(
+                    "✗ Cannot fetch registry for interactive selection.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            selected = select_installable_kits(config, remote_registry)
+            if not selected:
+                sys.exit(0)
+        else:
+            selected = list(dict.fromkeys(kit_names))
+
+        if len(selected) == 1:
             if not await _install_single_kit(
-                name, project_dir, github_dir, registry_url, force
+                selected[0],
+                project_dir,
+                github_dir,
+                registry_url,
+                force,
+                client=client,
+                session=session,
             ):
-                failed.append(name)
+                sys.exit(1)
+            return
+
+        failed = await _install_kits(
+            selected,
+            project_dir,
+            github_dir,
+            registry_url,
+            force,
+            client=client,
+            session=session,
+        )
         if failed:
             print(f"\n✗ Failed to install: {', '.join(failed)}", file=sys.stderr)
             sys.exit(1)
-    else:
-        if not await _install_single_kit(
-            kit_name, project_dir, github_dir, registry_url, force
-        ):
-            sys.exit(1)
 
 
 def install_handler(
-    kit_name: Annotated[str | None, Parameter(help="Kit name to install")] = None,
-    *,
+    *kit_names: Annotated[str, Parameter(help="Kit names to install")],
     force: Annotated[
         bool, Parameter(help="Overwrite existing files without prompting")
     ] = False,
     registry: Annotated[str | None, Parameter(help="Custom registry URL")] = None,
+    link: Annotated[
+        Literal["auto", "reflink", "hardlink", "copy"] | None,
+        Parameter(help="Cache link mode"),
+    ] = None,
+    refresh: Annotated[bool, Parameter(help="Revalidate registry.json first")] = False,
 ) -> None:
     """Install handler wrapper for cyclopts."""
     import asyncio
 
-    asyncio.run(handler(kit_name, force=force, registry=registry))
+    asyncio.run(
+        handler(*kit_names, force=force, registry=registry, link=link, refresh=refresh)
+    )
@@ -4,22 +4,44 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Annotated
 
-from cyclopts import App
+from cyclopts import App, Parameter
 from tabulate import tabulate
 
+from multikit.models.config import MultikitConfig
 from multikit.models.kit import Registry
-from multikit.registry.remote import fetch_registry
+from multikit.registry.remote import cached_registry, create_client, fetch_registry
 from multikit.utils.toml_io import load_config
 
 app = App(name="list", help="List available and installed kits.")
 
 
 @app.default
-async def handler() -> None:
-    """List available and installed kits."""
+async def handler(
+    *,
+    refresh: Annotated[
+        bool,
+        Parameter(negative="", help="Revalidate registry.json before listing"),
+    ] = False,
+    offline: Annotated[
+        bool,
+        Parameter(negative="", help="List from the cached registry.json only"),
+    ] = False,
+) -> None:
+    """List available and installed kits.
+
+    The cached registry.json is listed at once. A copy older than
+    ``cache.registry_ttl`` is revalidated in the background after the table
+    is printed; ``--refresh`` waits for the registry first and ``--offline``
+    never contacts it.
+    """
     project_dir = Path(".").resolve()
 
+    if refresh and offline:
+        print("✗ --refresh and --offline are mutually exclusive", file=sys.stderr)
+        sys.exit(1)
+
     # Step 1: Load config
     try:
         config = load_config(project_dir)
@@ -27,17 +49,36 @@ async def handler() -> None:
         print(f"✗ Config corrupted: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    # Step 2: Fetch registry (graceful on failure)
-    remote_registry: Registry | None = None
-    try:
-        remote_registry = await fetch_registry(config.registry_url)
-    except Exception:
-        print(
-            "⚠ Could not fetch remote registry. Showing local kits only.",
-            file=sys.stderr,
-        )
-
-    # Step 3: Merge remote + local
+    # Step 2: Load registry (cache first, graceful on failure); the client
+    # stays open until the table is printed so a background revalidation
+    # never delays it
+    async with create_client(config) as client:
+        remote_registry: Registry | None = None
+        try:
+            if not refresh:
+                remote_registry = cached_registry(
+                    config.registry_url, client, revalidate=not offline
+                )
+            if remote_registry is None and offline:
+                print(
+                    "⚠ No cached registry. Showing local kits only.",
+                    file=sys.stderr,
+                )
+            elif remote_registry is None:
+                remote_registry = await fetch_registry(
+                    config.registry_url, client=client
+                )
+        except Exception:
+            print(
+                "⚠ Could not fetch remote registry. Showing local kits only.",
+                file=sys.stderr,
+            )
+        _print_kits(config, remote_registry)
+
+
+def _print_kits(config: MultikitConfig, remote_registry: Registry | None) -> None:
+    """Print remote kits merged with installed ones as a table."""
+    # Merge remote + local
     kits_table: list[dict[str, str]] = []
 
     if remote_registry:
@@ -98,7 +139,7 @@ async def handler() -> None:
                 }
             )
 
-    # Step 4: Print table
+    # Print table
     if not kits_table:
         print("No kits found.")
         return
@@ -108,11 +149,12 @@ async def handler() -> None:
         [row["name"], row["status"], row["version"], row["agents"], row["prompts"]]
         for row in kits_table
     ]
-    print(tabulate(rows, headers=headers, tablefmt="simple"))
+    # Flushed now: a background revalidation may still hold the process open
+    print(tabulate(rows, headers=headers, tablefmt="simple"), flush=True)
 
 
-def list_handler() -> None:
+def list_handler(refresh: bool = False, offline: bool = False) -> None:
     """Sync wrapper for list handler."""
     import asyncio
 
-    asyncio.run(handler())
+    asyncio.run(handler(refresh=refresh, offline=offline))
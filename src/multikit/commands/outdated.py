@@ -0,0 +1,138 @@
+"""multikit outdated — Report installed kits with a newer registry version."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Annotated
+
+import aiohttp
+from cyclopts import App, Parameter
+from pydantic import ValidationError
+from tabulate import tabulate
+
+from multikit.models.config import InstalledKit
+from multikit.models.kit import Registry
+from multikit.registry.remote import (
+    HostUnreachableError,
+    RemoteFetchError,
+    create_client,
+    fetch_registry,
+)
+from multikit.utils.semver import is_newer
+from multikit.utils.toml_io import load_config
+
+app = App(name="outdated", help="List installed kits with newer versions available.")
+
+
+def find_outdated(
+    kits: dict[str, InstalledKit], registry: Registry
+) -> tuple[list[tuple[str, str, str]], list[str]]:
+    """Compare installed versions with ``registry.json``.
+
+    Returns ``([(name, installed, latest), ...], [names not in registry])``
+    in install order. Only the registry listing is needed, no manifests.
+    """
+    latest = {entry.name: entry.version for entry in registry.kits}
+    outdated: list[tuple[str, str, str]] = []
+    unknown: list[str] = []
+    for name, kit in kits.items():
+        if name not in latest:
+            unknown.append(name)
+        elif is_newer(latest[name], kit.version):
+            outdated.append((name, kit.version, latest[name]))
+    return outdated, unknown
+
+
+@app.default
+async def handler(
+    *kit_names: Annotated[
+        str, Parameter(help="Installed kits to check (all if omitted)")
+    ],
+    json_output: Annotated[
+        bool,
+        Parameter(name="--json", negative="", help="Print JSON instead of a table"),
+    ] = False,
+    registry: Annotated[
+        str | None,
+        Parameter(name="--registry", help="Custom registry base URL or local path"),
+    ] = None,
+) -> None:
+    """Compare installed kits with registry.json; exit 1 if any is outdated.
+
+    Parameters
+    ----------
+    kit_names
+        Names of installed kits to check. If omitted, every installed kit is checked.
+    """
+    project_dir = Path(".").resolve()
+
+    try:
+        config = load_config(project_dir)
+    except (OSError, ValidationError) as exc:
+        print(f"✗ Config corrupted: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    for name in kit_names:
+        if not config.is_installed(name):
+            print(f"✗ Kit '{name}' is not installed", file=sys.stderr)
+            sys.exit(1)
+
+    kits = {
+        name: kit
+        for name, kit in config.kits.items()
+        if not kit_names or name in kit_names
+    }
+    if not kits:
+        print("[]" if json_output else "No kits installed.")
+        return
+
+    try:
+        async with create_client(config) as client:
+            remote_registry = await fetch_registry(
+                registry or config.registry_url, client=client
+            )
+    except (
+        RemoteFetchError,
+        HostUnreachableError,
+        aiohttp.ClientError,
+        ValidationError,
+    ) as exc:
+        print(f"✗ Cannot fetch registry: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    outdated, unknown = find_outdated(kits, remote_registry)
+    for name in unknown:
+        print(f"⚠ Kit '{name}' is not in the registry", file=sys.stderr)
+
+    if json_output:
+        print(
+            json.dumps(
+                [
+                    {"name": name, "installed": installed, "latest": latest}
+                    for name, installed, latest in outdated
+                ],
+                indent=2,
+            )
+        )
+    elif outdated:
+        print(
+            tabulate(
+                outdated, headers=["Kit", "Installed", "Latest"], tablefmt="simple"
+            )
+        )
+    else:
+        print(f"✓ All {len(kits) - len(unknown)} checked kit(s) are up to date")
+
+    if outdated:
+        sys.exit(1)
+
+
+def outdated_handler(
+    *kit_names: str, json_output: bool = False, registry: str | None = None
+) -> None:
+    """Sync wrapper for outdated handler."""
+    import asyncio
+
+    asyncio.run(handler(*kit_names, json_output=json_output, registry=registry))
@@ -0,0 +1,50 @@
+"""multikit recover — Finish or roll back an interrupted install/update."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Annotated
+
+from cyclopts import App, Parameter
+
+from multikit.utils.journal import recover, sweep_stale_files
+
+app = App(
+    name="recover",
+    help="Finish or roll back an operation interrupted by a crash.",
+)
+
+
+@app.default
+def handler(
+    *,
+    rollback: Annotated[
+        bool,
+        Parameter(
+            negative="", help="Undo the interrupted operation instead of finishing it"
+        ),
+    ] = False,
+) -> None:
+    """Replay .multikit/journal and remove leftovers of crashed runs.
+
+    An interrupted commit is finished when all of its staged files are
+    still there, and rolled back otherwise (or always, with --rollback).
+    Staging directories and temp files whose process is gone are removed.
+    """
+    project_dir = Path(".").resolve()
+
+    try:
+        result = recover(project_dir, rollback=rollback)
+    except ValueError as exc:
+        print(f"✗ {exc}", file=sys.stderr)
+        sys.exit(1)
+    swept = sweep_stale_files(project_dir)
+
+    if result is not None:
+        operation, outcome = result
+        print(f"✓ {outcome.capitalize()} the interrupted {operation}")
+    if swept:
+        print(f"✓ Removed {swept} leftover staging/temp item(s)")
+    if result is None and not swept:
+        print("Nothing to recover.")
@@ -0,0 +1,124 @@
+"""multikit status — Detect local drift from install-time hashes, offline."""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated
+
+from cyclopts import App, Parameter
+from pydantic import ValidationError
+
+from multikit.models.config import InstalledKit
+from multikit.utils.files import file_sha256
+from multikit.utils.toml_io import load_config
+
+app = App(name="status", help="Show installed kit files that changed locally.")
+
+CLEAN = "clean"
+MODIFIED = "modified"
+MISSING = "missing"
+UNVERIFIED = "unverified"
+
+
+def _kit_paths(
+    kit: InstalledKit, project_dir: Path, github_dir: Path
+) -> list[tuple[str, Path]]:
+    """Return (recorded key, absolute path) for every file the kit installed."""
+    paths = [(f, github_dir / f) for f in kit.files]
+    paths += [(t, project_dir / t) for t in kit.templates]
+    return paths
+
+
+def _file_state(path: Path, expected: str | None) -> str:
+    """Classify one installed file against its recorded hash."""
+    if not path.is_file():
+        return MISSING
+    if expected is None:
+        return UNVERIFIED
+    try:
+        actual = file_sha256(path)
+    except OSError:
+        return MISSING
+    return CLEAN if actual == expected else MODIFIED
+
+
+def check_kits(
+    kits: dict[str, InstalledKit], project_dir: Path
+) -> dict[str, list[tuple[str, str]]]:
+    """Hash every installed file in a thread pool.
+
+    Returns ``{kit: [(display path, state), ...]}`` in install order. No
+    network access is needed: states come from ``InstalledKit.hashes``.
+    """
+    github_dir = project_dir / ".github"
+    jobs: list[tuple[str, str, Path, str | None]] = []
+    for kit_name, kit in kits.items():
+        for key, path in _kit_paths(kit, project_dir, github_dir):
+            jobs.append((kit_name, key, path, kit.hashes.get(key)))
+
+    with ThreadPoolExecutor() as pool:
+        states = list(pool.map(lambda job: _file_state(job[2], job[3]), jobs))
+
+    report: dict[str, list[tuple[str, str]]] = {name: [] for name in kits}
+    for (kit_name, _, path, _), state in zip(jobs, states):
+        report[kit_name].append((path.relative_to(project_dir).as_posix(), state))
+    return report
+
+
+@app.default
+def handler(
+    *kit_names: Annotated[
+        str, Parameter(help="Installed kits to check (all if omitted)")
+    ],
+) -> None:
+    """Report modified and missing kit files; exit 1 if any drifted.
+
+    Parameters
+    ----------
+    kit_names
+        Names of installed kits to check. If omitted, every installed kit is checked.
+    """
+    project_dir = Path(".").resolve()
+
+    try:
+        config = load_config(project_dir)
+    except (OSError, ValidationError) as exc:
+        print(f"✗ Config corrupted: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    for name in kit_names:
+        if not config.is_installed(name):
+            print(f"✗ Kit '{name}' is not installed", file=sys.stderr)
+            sys.exit(1)
+
+    kits = {
+        name: kit
+        for name, kit in config.kits.items()
+        if not kit_names or name in kit_names
+    }
+    if not kits:
+        print("No kits installed.")
+        return
+
+    report = check_kits(kits, project_dir)
+
+    drifted = 0
+    for kit_name, files in report.items():
+        counts = {state: 0 for state in (MODIFIED, MISSING, UNVERIFIED, CLEAN)}
+        for _, state in files:
+            counts[state] += 1
+        summary = ", ".join(f"{n} {state}" for state, n in counts.items() if n)
+        marker = "✗" if counts[MODIFIED] or counts[MISSING] else "✓"
+        print(f"{marker} {kit_name} v{kits[kit_name].version}: {summary or 'no files'}")
+        for path, state in files:
+            if state != CLEAN:
+                print(f"  {state:<10} {path}")
+        drifted += counts[MODIFIED] + counts[MISSING]
+
+    if drifted:
+        print(
+            f"\n✗ {drifted} file(s) differ from the installed version", file=sys.stderr
+        )
+        sys.exit(1)
@@ -0,0 +1,302 @@
+"""multikit sync — Reproduce the kits pinned in multikit.lock."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+from pathlib import Path
+
+import aiohttp
+from cyclopts import App
+
+from multikit.commands.install import _stage_from_archive
+from multikit.models.config import InstalledKit
+from multikit.models.kit import Manifest
+from multikit.models.lock import LockedFile, LockedKit, Lockfile
+from multikit.registry.remote import (
+    HostUnreachableError,
+    RemoteClient,
+    RemoteFetchError,
+    create_client,
+    download_file,
+    fetch_manifest,
+)
+from multikit.utils.files import file_matches, file_sha256
+from multikit.utils.journal import RECOVER_HINT, Transaction, has_pending_journal
+from multikit.utils.toml_io import ConfigSession
+
+app = App(name="sync", help="Reconcile installed kits with multikit.lock.")
+
+
+async def _needs_restore(project_dir: Path, locked: LockedFile) -> bool:
+    """Whether ``locked`` is missing or differs from its pinned hash."""
+    target = project_dir / locked.path
+    if not locked.overwrite and target.exists():
+        return False
+    return not await asyncio.to_thread(file_matches, target, locked.sha256, locked.size)
+
+
+def _unavailable(kit_name: str, version: str, path: str, reason: str) -> None:
+    print(
+        f"✗ {kit_name} v{version}: pinned {path} is no longer available from "
+        f"the registry ({reason}). Run 'multikit update {kit_name}' to move to "
+        "the current version.",
+        file=sys.stderr,
+    )
+
+
+async def _stage_pinned(
+    kit_name: str,
+    locked_kit: LockedKit,
+    files: list[LockedFile],
+    staging_dir: Path,
+    semaphore: asyncio.Semaphore,
+    client: RemoteClient | None = None,
+) -> bool:
+    """Stage the pinned content of ``files`` at ``staging_dir/<source>``.
+
+    Content is looked up by its locked sha256: first in the blob cache,
+    then in the kit's archive while the registry still publishes the locked
+    version, and only then at the file's (unversioned) registry URL. A file
+    the registry now serves with a different hash is reported as no longer
+    available instead of being downloaded. Returns False on any failure.
+    """
+    cache = client.cache if client is not None else None
+    pending: list[LockedFile] = []
+    for locked in {f.source: f for f in files}.values():
+        dest = staging_dir / locked.source
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if cache is None or not await asyncio.to_thread(
+            cache.materialize, locked.sha256, dest
+        ):
+            pending.append(locked)
+    if not pending:
+        return True
+
+    registry_url = locked_kit.registry_url
+    manifest: Manifest | None = None
+    try:
+        async with semaphore:
+            manifest = await fetch_manifest(registry_url, kit_name, client=client)
+    except (RemoteFetchError, HostUnreachableError, aiohttp.ClientError, ValueError):
+        pass  # the per-file URLs may still serve the pinned content
+    if manifest is not None:
+        for locked in pending:
+            published = manifest.file_hash(*locked.split_source())
+            if published is not None and published != locked.sha256:
+                _unavailable(
+                    kit_name,
+                    locked_kit.version,
+                    locked.path,
+                    f"it now publishes v{manifest.version}",
+                )
+                return False
+        if manifest.archive is not None and manifest.version == locked_kit.version:
+            async with semaphore:
+                missing, _ = await _stage_from_archive(
+                    staging_dir,
+                    registry_url,
+                    kit_name,
+                    manifest.archive,
+                    [(*f.split_source(), f.sha256) for f in pending],
+                    client,
+                )
+            left = {f"{subdir}/{filename}" for subdir, filename, _ in missing}
+            pending = [f for f in pending if f.source in left]
+
+    async def fetch_one(locked: LockedFile) -> str:
+        subdir, filename = locked.split_source()
+        async with semaphore:
+            return await download_file(
+                registry_url,
+                kit_name,
+                subdir,
+                filename,
+                staging_dir / locked.source,
+                client=client,
+                sha256=locked.sha256,
+            )
+
+    results = await asyncio.gather(
+        *(fetch_one(locked) for locked in pending), return_exceptions=True
+    )
+    for locked, result in zip(pending, results):
+        if isinstance(result, RemoteFetchError):
+            if str(result).startswith("sha256 mismatch"):
+                _unavailable(kit_name, locked_kit.version, locked.path, str(result))
+            else:
+                print(f"✗ Failed to restore {locked.path}: {result}", file=sys.stderr)
+            return False
+        if isinstance(result, aiohttp.ClientResponseError):
+            if result.status == 404:
+                _unavailable(kit_name, locked_kit.version, locked.path, "not found")
+            else:
+                print(
+                    f"✗ HTTP error {result.status} restoring {locked.path}",
+                    file=sys.stderr,
+                )
+            return False
+        if isinstance(result, aiohttp.ClientError):
+            print(
+                f"✗ Network error restoring {locked.path}: {result}",
+                file=sys.stderr,
+            )
+            return False
+        if isinstance(result, BaseException):
+            raise result
+    return True
+
+
+async def _restore_files(
+    project_dir: Path,
+    lock: Lockfile,
+    restores: list[tuple[str, LockedFile]],
+    max_concurrency: int,
+    client: RemoteClient | None = None,
+    session: ConfigSession | None = None,
+) -> bool:
+    """Stage every ``(kit, file)`` pinned content and commit it with ``session``.
+
+    Nothing is fetched if any target would land outside ``project_dir``.
+    The files and the config changes go through one journaled
+    :class:`Transaction`, so nothing in the project changes unless every
+    file is staged and verified, and an interrupted sync is left for
+    ``multikit recover``.
+    """
+    root = project_dir.resolve()
+    for _, locked in restores:
+        if not (project_dir / locked.path).resolve().is_relative_to(root):
+            print(
+                f"✗ Refusing to restore {locked.path}: outside the project",
+                file=sys.stderr,
+            )
+            return False
+
+    by_kit: dict[str, list[LockedFile]] = {}
+    for kit_name, locked in restores:
+        by_kit.setdefault(kit_name, []).append(locked)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with Transaction(project_dir, session, operation="sync") as txn:
+        staged = await asyncio.gather(
+            *(
+                _stage_pinned(
+                    kit_name,
+                    lock.kits[kit_name],
+                    files,
+                    txn.staging_dir / kit_name,
+                    semaphore,
+                    client,
+                )
+                for kit_name, files in by_kit.items()
+            )
+        )
+        if not all(staged):
+            return False
+
+        # Two templates may share a source; each dest gets its own copy
+        claimed: set[Path] = set()
+        for index, (kit_name, locked) in enumerate(restores):
+            src = txn.staging_dir / kit_name / locked.source
+            if src in claimed:
+                copy = txn.staging_dir / ".copies" / f"{index}-{src.name}"
+                copy.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(src, copy)
+                src = copy
+            claimed.add(src)
+            txn.add(src, project_dir / locked.path)
+        try:
+            txn.commit()
+        except OSError as exc:
+            print(f"✗ Sync failed, rolled back: {exc}", file=sys.stderr)
+            return False
+    return True
+
+
+def _installed_from_lock(lock: Lockfile, project_dir: Path) -> dict[str, InstalledKit]:
+    """Build the multikit.toml kit records the lockfile implies."""
+    kits: dict[str, InstalledKit] = {}
+    for kit_name, locked_kit in lock.kits.items():
+        files: list[str] = []
+        templates: list[str] = []
+        hashes: dict[str, str] = {}
+        for f in locked_kit.files:
+            key = f.path if f.is_template else f.path.removeprefix(".github/")
+            (templates if f.is_template else files).append(key)
+            # Kept templates hold local customizations, not the locked content
+            kept = not f.overwrite and (project_dir / f.path).is_file()
+            hashes[key] = file_sha256(project_dir / f.path) if kept else f.sha256
+        kits[kit_name] = InstalledKit(
+            version=locked_kit.version,
+            source="remote",
+            files=files,
+            templates=templates,
+            hashes=hashes,
+        )
+    return kits
+
+
+@app.default
+async def handler() -> None:
+    """Make .github/ match multikit.lock, downloading only what differs."""
+    project_dir = Path(".").resolve()
+
+    if has_pending_journal(project_dir):
+        print(RECOVER_HINT, file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        session = ConfigSession(project_dir)
+        config = session.config
+        lock = session.lock
+    except (OSError, ValueError) as exc:
+        print(f"✗ Config corrupted: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    if lock is None:
+        print(
+            "✗ No multikit.lock found. Run 'multikit install' first.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    entries = [
+        (kit_name, locked_kit.registry_url, locked)
+        for kit_name, locked_kit in lock.kits.items()
+        for locked in locked_kit.files
+    ]
+    print(f"Syncing {len(lock.kits)} kit(s) from multikit.lock...")
+    stale = await asyncio.gather(
+        *(_needs_restore(project_dir, locked) for _, _, locked in entries)
+    )
+    restores = [
+        (kit_name, locked)
+        for (kit_name, _, locked), needed in zip(entries, stale)
+        if needed
+    ]
+    for _, locked in restores:
+        print(f"  Restoring {locked.path}...")
+
+    # Recorded now, written only with the restored files (or on their own)
+    for name, kit in _installed_from_lock(lock, project_dir).items():
+        if config.kits.get(name) != kit:
+            session.set_kit(name, kit)
+
+    if restores:
+        async with create_client(config) as client:
+            if not await _restore_files(
+                project_dir,
+                lock,
+                restores,
+                max_concurrency=config.network.max_concurrency,
+                client=client,
+                session=session,
+            ):
+                sys.exit(1)
+    else:
+        session.flush()
+
+    print(
+        f"✓ Synced: {len(entries) - len(restores)} up to date, {len(restores)} restored"
+    )
@@ -8,8 +8,9 @@ from pathlib import Path
 from cyclopts import App
 
 from multikit.utils.files import delete_kit_files
+from multikit.utils.journal import RECOVER_HINT, has_pending_journal
 from multikit.utils.prompt import select_installed_kits
-from multikit.utils.toml_io import load_config, save_config
+from multikit.utils.toml_io import ConfigSession
 
 app = App(name="uninstall", help="Uninstall a kit.")
 
@@ -18,9 +19,17 @@ def _uninstall_single_kit(
     kit_name: str,
     project_dir: Path,
     github_dir: Path,
+    session: ConfigSession | None = None,
 ) -> bool:
-    """Uninstall a single kit. Returns True on success."""
-    config = load_config(project_dir)
+    """Uninstall a single kit. Returns True on success.
+
+    The kit is dropped from ``session``; without one the removal is written
+    immediately.
+    """
+    own_session = session is None
+    if session is None:
+        session = ConfigSession(project_dir)
+    config = session.config
 
     if not config.is_installed(kit_name):
         print(f"✗ Kit '{kit_name}' is not installed", file=sys.stderr)
@@ -39,8 +48,9 @@ def _uninstall_single_kit(
             target.unlink()
             template_deleted += 1
 
-    del config.kits[kit_name]
-    save_config(project_dir, config)
+    session.remove_kit(kit_name)
+    if own_session:
+        session.flush()
 
     total_deleted = deleted + template_deleted
     print(f"✓ Uninstalled {kit_name} ({total_deleted} files removed)")
@@ -59,25 +69,34 @@ def handler(kit_name: str | None = None) -> None:
     project_dir = Path(".").resolve()
     github_dir = project_dir / ".github"
 
-    # Load config
+    if has_pending_journal(project_dir):
+        print(RECOVER_HINT, file=sys.stderr)
+        sys.exit(1)
+
+    # Parse config once; removals are written together on exit
     try:
-        config = load_config(project_dir)
+        session = ConfigSession(project_dir)
     except Exception as exc:
         print(f"✗ Config corrupted: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    # Interactive multi-select when kit_name is not provided
-    if kit_name is None:
-        kit_names = select_installed_kits(config, action="uninstall")
-        if not kit_names:
-            sys.exit(0)
-        failed = []
-        for name in kit_names:
-            if not _uninstall_single_kit(name, project_dir, github_dir):
-                failed.append(name)
-        if failed:
-            print(f"\n✗ Failed to uninstall: {', '.join(failed)}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        if not _uninstall_single_kit(kit_name, project_dir, github_dir):
-            sys.exit(1)
+    with session:
+        # Interactive multi-select when kit_name is not provided
+        if kit_name is None:
+            kit_names = select_installed_kits(session.config, action="uninstall")
+            if not kit_names:
+                sys.exit(0)
+            failed = []
+            for name in kit_names:
+                if not _uninstall_single_kit(
+                    name, project_dir, github_dir, session=session
+                ):
+                    failed.append(name)
+            if failed:
+                print(f"\n✗ Failed to uninstall: {', '.join(failed)}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            if not _uninstall_single_kit(
+                kit_name, project_dir, github_dir, session=session
+            ):
+                sys.exit(1)
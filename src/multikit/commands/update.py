@@ -9,8 +9,10 @@ from typing import Annotated
 from cyclopts import App, Parameter
 
 from multikit.commands.install import _install_single_kit
+from multikit.registry.remote import RemoteClient, create_client
+from multikit.utils.journal import RECOVER_HINT, Transaction, has_pending_journal
 from multikit.utils.prompt import select_installed_kits
-from multikit.utils.toml_io import load_config
+from multikit.utils.toml_io import ConfigSession
 
 app = App(name="update", help="Update installed kit(s) to latest remote version.")
 
@@ -21,11 +23,15 @@ async def _update_single_kit(
     github_dir: Path,
     registry_url: str,
     force: bool,
+    client: RemoteClient | None = None,
+    session: ConfigSession | None = None,
+    transaction: Transaction | None = None,
 ) -> bool:
     """Update a single installed kit. Returns True on success."""
-    config = load_config(project_dir)
+    if session is None:
+        session = ConfigSession(project_dir)
 
-    if not config.is_installed(kit_name):
+    if not session.config.is_installed(kit_name):
         print(f"✗ Kit '{kit_name}' is not installed", file=sys.stderr)
         return False
 
@@ -36,6 +42,9 @@ async def _update_single_kit(
         github_dir=github_dir,
         registry_url=registry_url,
         force=force,
+        client=client,
+        session=session,
+        transaction=transaction,
     )
 
 
@@ -51,18 +60,27 @@ async def handler(
     ] = False,
     registry: Annotated[
         str | None,
-        Parameter(name="--registry", help="Custom registry base URL"),
+        Parameter(name="--registry", help="Custom registry base URL or local path"),
     ] = None,
 ) -> None:
-    """Update installed kit(s) by re-installing from latest remote version."""
+    """Update installed kit(s) by re-installing from latest remote version.
+
+    Every selected kit is staged first and the updates are committed
+    together: if any kit fails, none of them is changed.
+    """
     project_dir = Path(".").resolve()
     github_dir = project_dir / ".github"
 
+    if has_pending_journal(project_dir):
+        print(RECOVER_HINT, file=sys.stderr)
+        sys.exit(1)
+
     try:
-        config = load_config(project_dir)
+        session = ConfigSession(project_dir)
     except Exception as exc:
         print(f"✗ Config corrupted: {exc}", file=sys.stderr)
         sys.exit(1)
+    config = session.config
 
     registry_url = registry or config.registry_url
 
@@ -70,27 +88,41 @@ async def handler(
         kit_names = select_installed_kits(config, action="update")
         if not kit_names:
             sys.exit(0)
-
-        failed: list[str] = []
-        for name in kit_names:
-            if not await _update_single_kit(
-                name,
-                project_dir=project_dir,
-                github_dir=github_dir,
-                registry_url=registry_url,
-                force=force,
-            ):
-                failed.append(name)
-
-        if failed:
-            print(f"\n✗ Failed to update: {', '.join(failed)}", file=sys.stderr)
-            sys.exit(1)
     else:
-        if not await _update_single_kit(
-            kit_name,
-            project_dir=project_dir,
-            github_dir=github_dir,
-            registry_url=registry_url,
-            force=force,
-        ):
-            sys.exit(1)
+        kit_names = [kit_name]
+
+    async with create_client(config) as client:
+        with Transaction(project_dir, session, operation="update") as transaction:
+            failed: list[str] = []
+            for name in kit_names:
+                if not await _update_single_kit(
+                    name,
+                    project_dir=project_dir,
+                    github_dir=github_dir,
+                    registry_url=registry_url,
+                    force=force,
+                    client=client,
+                    session=session,
+                    transaction=transaction,
+                ):
+                    failed.append(name)
+
+            if failed:
+                if kit_name is None:
+                    print(
+                        f"\n✗ Failed to update: {', '.join(failed)} "
+                        "(no kits were changed)",
+                        file=sys.stderr,
+                    )
+                sys.exit(1)
+
+            try:
+                transaction.commit()
+            except Exception as exc:
+                print(f"✗ Update failed, rolled back: {exc}", file=sys.stderr)
+                sys.exit(1)
+
+    for name in kit_names:
+        kit = session.config.get_kit(name)
+        if kit is not None:
+            print(f"✓ Updated {name} v{kit.version}")
@@ -1,7 +1,9 @@
-"""Configuration Pydantic models: InstalledKit, MultikitConfig."""
+"""Configuration Pydantic models: InstalledKit, NetworkConfig, CacheConfig, MultikitConfig."""
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -21,6 +23,13 @@ class InstalledKit(BaseModel):
         default_factory=list,
         description="List of installed template dest paths relative to project root",
     )
+    hashes: dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "sha256 of each installed file as written at install time, "
+            "keyed by its 'files' or 'templates' entry"
+        ),
+    )
 
 
 class NetworkConfig(BaseModel):
@@ -50,6 +59,61 @@ class NetworkConfig(BaseModel):
         le=30.0,
         description="Maximum delay (seconds) between retries",
     )
+    connect_timeout: float = Field(
+        default=10.0,
+        ge=1.0,
+        le=120.0,
+        description="Timeout (seconds) for establishing a connection",
+    )
+    request_timeout: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description="Total timeout (seconds) for a single request",
+    )
+    keepalive_timeout: float = Field(
+        default=15.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds an idle pooled connection is kept open for reuse",
+    )
+
+
+class CacheConfig(BaseModel):
+    """User-level download cache settings (blobs live under the XDG cache dir)."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Serve kit files from the local content-addressed cache",
+    )
+    max_size_mb: int = Field(
+        default=256,
+        ge=1,
+        le=65536,
+        description="Size cap (MiB); least recently used blobs are evicted beyond it",
+    )
+    ttl: int = Field(
+        default=300,
+        ge=0,
+        le=604800,
+        description="Seconds a cached URL is trusted without contacting the registry",
+    )
+    registry_ttl: int = Field(
+        default=3600,
+        ge=0,
+        le=604800,
+        description=(
+            "Seconds a cached registry.json is listed without revalidation; "
+            "older copies are shown at once and refreshed in the background"
+        ),
+    )
+    link: Literal["auto", "reflink", "hardlink", "copy"] = Field(
+        default="auto",
+        description=(
+            "How installed files are materialised from the cache; "
+            "auto uses reflink where supported, else copy"
+        ),
+    )
 
 
 class MultikitConfig(BaseModel):
@@ -58,11 +122,14 @@ class MultikitConfig(BaseModel):
     version: str = Field(default="0.1.0", description="Multikit config version")
     registry_url: str = Field(
         default=DEFAULT_REGISTRY_URL,
-        description="Base URL for the remote kit registry",
+        description="Base URL, local path or file:// URL of the kit registry",
     )
     network: NetworkConfig = Field(
         default_factory=NetworkConfig, description="Network configuration"
     )
+    cache: CacheConfig = Field(
+        default_factory=CacheConfig, description="Download cache configuration"
+    )
     kits: dict[str, InstalledKit] = Field(
         default_factory=dict, description="Installed kits"
     )
@@ -1,4 +1,4 @@
-"""Kit-related Pydantic models: Manifest, RegistryEntry, Registry."""
+"""Kit-related Pydantic models: Manifest, KitArchive, RegistryEntry, Registry."""
 
 from __future__ import annotations
 
@@ -25,6 +25,36 @@ class TemplateEntry(BaseModel):
     )
 
 
+class KitArchive(BaseModel):
+    """A single-archive bundle of every file in one kit version."""
+
+    path: str = Field(
+        description="Archive path relative to the kit directory (e.g., '1.0.0.tar.gz')"
+    )
+    sha256: str | None = Field(
+        default=None, description="sha256 hex digest of the archive bytes"
+    )
+    size: int | None = Field(default=None, description="Archive size in bytes")
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, v: str) -> str:
+        if not v.endswith((".tar.gz", ".tgz", ".zip")):
+            raise ValueError(
+                f"Archive must be a .tar.gz, .tgz or .zip file. Got: '{v}'"
+            )
+        if v.startswith("/") or ".." in v.split("/"):
+            raise ValueError(f"Archive path must stay inside the kit. Got: '{v}'")
+        return v
+
+    @field_validator("sha256")
+    @classmethod
+    def validate_sha256(cls, v: str | None) -> str | None:
+        if v is not None and not re.match(r"^[0-9a-f]{64}$", v):
+            raise ValueError(f"Archive sha256 must be lowercase hex. Got: '{v}'")
+        return v
+
+
 class Manifest(BaseModel):
     """A kit's manifest.json — declares files to install."""
 
@@ -43,6 +73,21 @@ class Manifest(BaseModel):
         default_factory=list,
         description="Template files to copy into consumer projects",
     )
+    hashes: dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "sha256 hex digest per file, keyed by path inside the kit "
+            "(e.g., 'agents/testkit.design.agent.md')"
+        ),
+    )
+    sizes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Byte size per file, keyed like 'hashes'",
+    )
+    archive: KitArchive | None = Field(
+        default=None,
+        description="Optional bundle of all kit files, preferred over per-file fetches",
+    )
 
     @field_validator("name")
     @classmethod
@@ -83,6 +128,24 @@ class Manifest(BaseModel):
                 )
         return v
 
+    @field_validator("hashes")
+    @classmethod
+    def validate_hashes(cls, v: dict[str, str]) -> dict[str, str]:
+        for path, digest in v.items():
+            if not re.match(r"^[0-9a-f]{64}$", digest):
+                raise ValueError(
+                    f"Hash for '{path}' must be a lowercase hex sha256. Got: '{digest}'"
+                )
+        return v
+
+    def file_hash(self, subdir: str, filename: str) -> str | None:
+        """Return the declared sha256 for a file, or None if not published."""
+        return self.hashes.get(f"{subdir}/{filename}")
+
+    def file_size(self, subdir: str, filename: str) -> int | None:
+        """Return the declared byte size for a file, or None if not published."""
+        return self.sizes.get(f"{subdir}/{filename}")
+
     @property
     def all_files(self) -> list[tuple[str, str]]:
         """Return list of (subdir, filename) pairs for agents and prompts."""
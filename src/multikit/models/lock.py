@@ -0,0 +1,81 @@
+"""Lockfile Pydantic models: LockedFile, LockedKit, Lockfile."""
+
+from __future__ import annotations
+
+import re
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+LOCKFILE_VERSION = 1
+
+
+class LockedFile(BaseModel):
+    """One installed file pinned by content hash in multikit.lock."""
+
+    path: str = Field(
+        description="Install path relative to project root (e.g., '.github/agents/x.agent.md')"
+    )
+    source: str = Field(
+        description="Path inside the kit on the registry (e.g., 'agents/x.agent.md')"
+    )
+    sha256: str = Field(description="sha256 hex digest of the file content")
+    size: int = Field(ge=0, description="File size in bytes")
+    overwrite: bool = Field(
+        default=True,
+        description="If False, an existing file is kept as-is (template customization)",
+    )
+
+    @field_validator("path")
+    @classmethod
+    def validate_path(cls, v: str) -> str:
+        parts = v.replace("\\", "/").split("/")
+        if not v or v.startswith(("/", "\\")) or re.match(r"^[A-Za-z]:", v):
+            raise ValueError(f"Locked path must be relative. Got: '{v}'")
+        if ".." in parts:
+            raise ValueError(f"Locked path must stay inside the project. Got: '{v}'")
+        return v
+
+    @field_validator("sha256")
+    @classmethod
+    def validate_sha256(cls, v: str) -> str:
+        if not re.match(r"^[0-9a-f]{64}$", v):
+            raise ValueError(f"sha256 must be lowercase hex. Got: '{v}'")
+        return v
+
+    @model_validator(mode="after")
+    def validate_location(self) -> LockedFile:
+        # Only templates declare their own dest; kit files live in .github/
+        if not self.is_template and not self.path.startswith(".github/"):
+            raise ValueError(
+                f"Locked kit file must be under .github/. Got: '{self.path}'"
+            )
+        return self
+
+    @property
+    def is_template(self) -> bool:
+        """Whether this file was installed from the kit's templates."""
+        return self.source.startswith("templates/")
+
+    def split_source(self) -> tuple[str, str]:
+        """Return the (subdir, filename) pair used to fetch this file."""
+        subdir, _, filename = self.source.rpartition("/")
+        return subdir, filename
+
+
+class LockedKit(BaseModel):
+    """A kit resolved to an exact version and file set."""
+
+    version: str = Field(description="Resolved kit version")
+    registry_url: str = Field(description="Registry base URL the kit came from")
+    files: list[LockedFile] = Field(
+        default_factory=list, description="Pinned files in install order"
+    )
+
+
+class Lockfile(BaseModel):
+    """multikit.lock — reproducible record of every installed kit."""
+
+    version: int = Field(default=LOCKFILE_VERSION, description="Lockfile format")
+    kits: dict[str, LockedKit] = Field(
+        default_factory=dict, description="Locked kits by name"
+    )
@@ -0,0 +1,446 @@
+"""User-level content-addressed cache for downloaded kit files.
+
+Layout under the cache root (``$MULTIKIT_CACHE_DIR`` or
+``$XDG_CACHE_HOME/multikit``, defaulting to ``~/.cache/multikit``)::
+
+    blobs/ab/ab12...ef      file bytes, named by their sha256
+    refs/cd/cd34...01.json  URL -> blob sha256, fetch time, HTTP validators
+                            and, for metadata, the blob of its validated model
+
+Blobs are immutable and shared by every project on the machine. Refs record
+which blob a URL last resolved to, plus the ``ETag``/``Last-Modified``
+validators it was served with so stale entries can be revalidated with a
+conditional GET. A ref younger than the TTL is trusted without contacting
+the registry. All writes go to a temp file followed by ``os.replace`` so
+concurrent processes never observe partial entries.
+
+Like a pnpm store, blobs can be materialised into a project without copying
+bytes: as a reflink (copy-on-write clone, Linux btrfs/XFS) or a hard link,
+per the ``link`` mode. A hard-linked file shares its inode with the blob, so
+an in-place edit changes the blob too; every read therefore re-hashes the
+blob and drops it on mismatch, and ``status``/``diff`` hash project files
+rather than trusting the link. ``auto`` uses reflinks where supported and
+copies otherwise; hard links are opt-in.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from multikit.models.config import CacheConfig
+
+CACHE_DIR_ENV = "MULTIKIT_CACHE_DIR"
+
+_COPY_CHUNK = 64 * 1024
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+# ``auto`` only uses reflinks: a hard link would let an in-place edit of
+# an installed file rewrite the shared blob, so it must be asked for
+_AUTO_LINKS = ("reflink",)
+# linux/fs.h: _IOW(0x94, 9, int); exported as fcntl.FICLONE since 3.12
+_FICLONE = 0x40049409
+
+
+def default_cache_dir() -> Path:
+    """Resolve the cache root from ``MULTIKIT_CACHE_DIR`` / ``XDG_CACHE_HOME``."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "multikit"
+
+
+def sha256_hex(data: bytes) -> str:
+    """Return the hex sha256 digest of ``data``."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    """Clone ``src`` to ``dest`` sharing extents (copy-on-write)."""
+    if sys.platform != "linux":
+        raise OSError(f"reflink is not supported on {sys.platform}")
+    import fcntl
+
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), getattr(fcntl, "FICLONE", _FICLONE), s.fileno())
+        except OSError:
+            d.close()
+            dest.unlink(missing_ok=True)
+            raise
+
+
+def _hash_file(path: Path) -> str | None:
+    """Return the sha256 of ``path`` read in chunks, or None if unreadable."""
+    hasher = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_COPY_CHUNK), b""):
+                hasher.update(chunk)
+    except OSError:
+        return None
+    return hasher.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Summary returned by ``BlobCache.info``."""
+
+    root: Path
+    blob_count: int
+    total_bytes: int
+    max_bytes: int
+
+
+class BlobCache:
+    """sha256-keyed blob store with URL refs and LRU size eviction."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 300,
+        link: str = "copy",
+        registry_ttl: float = 3600,
+    ):
+        if link not in LINK_MODES:
+            raise ValueError(
+                f"Unknown link mode {link!r}; expected one of {LINK_MODES}"
+            )
+        self.root = root or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.link = link
+        self.registry_ttl = registry_ttl
+        # Running total of blob bytes; computed on first write.
+        self._size: int | None = None
+        # Link methods that failed once (e.g. EXDEV); not retried
+        self._unsupported: set[str] = set()
+
+    @classmethod
+    def from_config(
+        cls, config: CacheConfig, link: str | None = None
+    ) -> BlobCache | None:
+        """Build a cache from config, or None when caching is disabled.
+
+        ``link`` overrides the configured link mode (``install --link``).
+        """
+        if not config.enabled:
+            return None
+        return cls(
+            max_bytes=config.max_size_mb * 1024 * 1024,
+            ttl=config.ttl,
+            link=link or config.link,
+            registry_ttl=config.registry_ttl,
+        )
+
+    @property
+    def blobs_dir(self) -> Path:
+        return self.root / "blobs"
+
+    @property
+    def refs_dir(self) -> Path:
+        return self.root / "refs"
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / digest
+
+    def _ref_path(self, url: str) -> Path:
+        key = sha256_hex(url.encode("utf-8"))
+        return self.refs_dir / key[:2] / f"{key}.json"
+
+    # -- blobs -------------------------------------------------------------
+
+    def get_blob(self, digest: str) -> bytes | None:
+        """Return blob bytes, or None if absent or corrupted.
+
+        A hit refreshes the blob's mtime, which is the LRU clock.
+        """
+        path = self.blob_path(digest)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if sha256_hex(data) != digest:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put_blob(self, data: bytes) -> str:
+        """Store ``data`` and return its sha256. Evicts LRU blobs over the cap."""
+        digest = sha256_hex(data)
+        path = self.blob_path(digest)
+        if path.exists():
+            os.utime(path)
+            return digest
+        _atomic_write(path, data)
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.prune()
+        return digest
+
+    def put_file(self, src: Path, digest: str) -> None:
+        """Store the file at ``src``, already hashed to ``digest``, as a blob.
+
+        The file is copied rather than read into memory, so large downloads
+        streamed to disk can be cached without buffering them.
+        """
+        path = self.blob_path(digest)
+        if path.exists():
+            os.utime(path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        os.close(fd)
+        try:
+            # Link rather than copy when the mode allows, so the freshly
+            # downloaded file and its blob share storage.
+            if self.link != "copy":
+                os.unlink(tmp)
+                if not self._try_link(src, Path(tmp)):
+                    shutil.copyfile(src, tmp)
+            else:
+                shutil.copyfile(src, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def copy_blob(self, digest: str, dest: Path) -> bool:
+        """Copy blob ``digest`` to ``dest`` in chunks, verifying its hash.
+
+        Returns False (leaving no ``dest``) when the blob is absent or
+        corrupted. A hit refreshes the blob's mtime like ``get_blob``.
+        """
+        path = self.blob_path(digest)
+        hasher = hashlib.sha256()
+        try:
+            with open(path, "rb") as src, open(dest, "wb") as out:
+                for chunk in iter(lambda: src.read(_COPY_CHUNK), b""):
+                    hasher.update(chunk)
+                    out.write(chunk)
+        except OSError:
+            dest.unlink(missing_ok=True)
+            return False
+        if hasher.hexdigest() != digest:
+            path.unlink(missing_ok=True)
+            dest.unlink(missing_ok=True)
+            return False
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def materialize(self, digest: str, dest: Path) -> bool:
+        """Place blob ``digest`` at ``dest`` using the configured link mode.
+
+        The blob is hashed before it is linked, so a blob modified through
+        an earlier hard link is dropped rather than spread. Falls back to
+        ``copy_blob`` when no link method works between the cache and
+        ``dest`` (e.g. different filesystems). Returns False when the blob
+        is absent or corrupted.
+        """
+        if self.link == "copy":
+            return self.copy_blob(digest, dest)
+        path = self.blob_path(digest)
+        actual = _hash_file(path)
+        if actual is None:
+            return False
+        if actual != digest:
+            path.unlink(missing_ok=True)
+            return False
+        dest.unlink(missing_ok=True)
+        if not self._try_link(path, dest):
+            return self.copy_blob(digest, dest)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def _try_link(self, src: Path, dest: Path) -> bool:
+        """Link ``src`` to the absent ``dest`` with the first working method."""
+        methods = _AUTO_LINKS if self.link == "auto" else (self.link,)
+        for method in methods:
+            if method in self._unsupported:
+                continue
+            try:
+                if method == "reflink":
+                    _reflink(src, dest)
+                else:
+                    os.link(src, dest)
+            except OSError:
+                self._unsupported.add(method)
+                continue
+            return True
+        return False
+
+    # -- url refs ----------------------------------------------------------
+
+    def read_ref(self, url: str) -> dict | None:
+        """Return the stored ref entry for ``url`` (fresh or not)."""
+        try:
+            entry = json.loads(self._ref_path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "sha256" in entry else None
+
+    def write_ref(
+        self,
+        url: str,
+        digest: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        validated: dict | None = None,
+    ) -> None:
+        """Point ``url`` at blob ``digest`` as of now, with optional validators.
+
+        ``validated`` records that the blob already passed model validation
+        (see ``RemoteClient._validate_cached``); it only stays valid while
+        the ref keeps pointing at the same blob.
+        """
+        entry: dict = {"url": url, "sha256": digest, "fetched_at": time.time()}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        if validated:
+            entry["validated"] = validated
+        _atomic_write(self._ref_path(url), json.dumps(entry).encode("utf-8"))
+
+    def mark_validated(self, url: str, entry: dict, validated: dict) -> None:
+        """Add a ``validated`` marker to ``url``'s ref, keeping its age."""
+        _atomic_write(
+            self._ref_path(url),
+            json.dumps({**entry, "validated": validated}).encode("utf-8"),
+        )
+
+    def is_fresh(self, entry: dict, ttl: float | None = None) -> bool:
+        """Whether a ref entry is still within ``ttl`` (default: the cache TTL)."""
+        ttl = self.ttl if ttl is None else ttl
+        return time.time() - float(entry.get("fetched_at", 0)) < ttl
+
+    def lookup(self, url: str) -> bytes | None:
+        """Return cached bytes for ``url`` if its ref is fresh and the blob exists."""
+        entry = self.read_ref(url)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return self.get_blob(entry["sha256"])
+
+    def store(
+        self,
+        url: str,
+        data: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> str:
+        """Cache ``data`` as the current content of ``url``. Returns its sha256."""
+        digest = self.put_blob(data)
+        self.write_ref(url, digest, etag=etag, last_modified=last_modified)
+        return digest
+
+    # -- maintenance -------------------------------------------------------
+
+    def _iter_blobs(self) -> list[Path]:
+        if not self.blobs_dir.is_dir():
+            return []
+        return [
+            p
+            for p in self.blobs_dir.glob("*/*")
+            if p.is_file() and not p.name.startswith(".tmp-")
+        ]
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self._iter_blobs())
+
+    def info(self) -> CacheStats:
+        """Return blob count and total size."""
+        blobs = self._iter_blobs()
+        return CacheStats(
+            root=self.root,
+            blob_count=len(blobs),
+            total_bytes=sum(p.stat().st_size for p in blobs),
+            max_bytes=self.max_bytes,
+        )
+
+    def prune(self, max_bytes: int | None = None) -> tuple[int, int]:
+        """Evict least recently used blobs until the total fits ``max_bytes``.
+
+        Also drops refs whose blob is gone. Returns (blobs removed, bytes freed).
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = []
+        for path in self._iter_blobs():
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort(key=lambda e: e[0])
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        freed = 0
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            freed += size
+            removed += 1
+        self._size = total
+
+        if self.refs_dir.is_dir():
+            for ref in self.refs_dir.glob("*/*.json"):
+                try:
+                    entry = json.loads(ref.read_text(encoding="utf-8"))
+                    digest = entry["sha256"]
+                except (OSError, ValueError, KeyError, TypeError):
+                    ref.unlink(missing_ok=True)
+                    continue
+                if not self.blob_path(digest).exists():
+                    ref.unlink(missing_ok=True)
+        return removed, freed
+
+    def clear(self) -> None:
+        """Delete every blob and ref."""
+        for sub in (self.blobs_dir, self.refs_dir):
+            if sub.exists():
+                shutil.rmtree(sub)
+        self._size = 0
@@ -1,21 +1,53 @@
-"""Remote registry client — fetches kits from raw.githubusercontent.com."""
+"""Registry client — fetches kits over HTTP(S) or from a local directory.
+
+``registry_url`` is normally an HTTP base such as raw.githubusercontent.com.
+A plain path or ``file://`` URL (e.g. a vendored ``kits/`` directory) is read
+straight from disk through the same API, without any HTTP session.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import random
+import shutil
 import socket
 import ssl
 from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, get_args, get_origin
 from urllib.parse import urlparse
+from urllib.request import url2pathname
 
+import aiofiles
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from pydantic import BaseModel
+from yarl import URL
+
+from multikit import __version__
+from multikit.models.config import MultikitConfig, NetworkConfig
+from multikit.models.kit import KitArchive, Manifest, Registry
+from multikit.registry.cache import BlobCache, sha256_hex
+from multikit.utils import profiling
+from multikit.utils.files import file_sha256
 
-from multikit.models.config import NetworkConfig
-from multikit.models.kit import Manifest, Registry
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 USER_AGENT = "multikit/0.1.0"
 
+# Read size for streamed downloads; bounds per-file memory use.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Longest close() waits for background revalidations before cancelling them
+REVALIDATE_GRACE = 1.0
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 
 class RemoteFetchError(Exception):
     """Raised when remote fetch fails after all retries."""
@@ -39,7 +71,16 @@ class HostUnreachableError(Exception):
 
 
 class RemoteClient:
-    """Async HTTP client with retry/backoff and bounded concurrency."""
+    """Async HTTP client with retry/backoff and bounded concurrency.
+
+    A single instance owns one pooled, keep-alive ``aiohttp.ClientSession``.
+    Commands create one client per invocation (``async with RemoteClient(...)``)
+    and pass it down so every fetch reuses the same TCP/TLS connections.
+
+    When a ``BlobCache`` is attached, ``fetch_file`` serves fresh cached
+    content from disk, registry/manifest metadata is revalidated with
+    conditional GETs, and every download is recorded in the cache.
+    """
 
     # Track consecutive DNS/TLS errors per host for early termination
     _host_error_tracker: dict[str, list[tuple[str, Exception]]] = defaultdict(list)
@@ -49,16 +90,40 @@ class RemoteClient:
         network_config: NetworkConfig | None = None,
         base_url: str | None = None,
         session: aiohttp.ClientSession | None = None,
+        cache: BlobCache | None = None,
     ):
         self.network = network_config or NetworkConfig()
         self.base_url = base_url
+        self.cache = cache
+        # Validated metadata models keyed by (model class, body sha256)
+        self._models: dict[tuple[type, str], BaseModel] = {}
         self._session: aiohttp.ClientSession | None = session
         self._external_session = session is not None
         # Per-instance error tracking
         self._host_errors: dict[str, list[tuple[str, Exception]]] = defaultdict(list)
+        # Background revalidations; close() waits for them
+        self._background: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
     async def close(self) -> None:
-        """Close the session if we created it."""
+        """Close the session if we created it.
+
+        Background revalidations get up to ``REVALIDATE_GRACE`` seconds to
+        finish and are cancelled after that, so a slow or unreachable
+        registry never holds up a command that was served from cache.
+        """
+        if self._background:
+            _, pending = await asyncio.wait(self._background, timeout=REVALIDATE_GRACE)
+            for task in pending:
+                task.cancel()
+            # Failures and cancellations only mean the cached copy stays stale
+            await asyncio.gather(*self._background, return_exceptions=True)
+            self._background.clear()
         if self._session and not self._session.closed and not self._external_session:
             await self._session.close()
 
@@ -148,15 +213,23 @@ class RemoteClient:
 
         # Create new session only if not provided externally
         if not self._external_session:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
+            timeout = aiohttp.ClientTimeout(
+                total=self.network.request_timeout,
+                connect=self.network.connect_timeout,
+            )
+            # Keep-alive pool: connections are reused across every fetch made
+            # through this client instead of one handshake per request.
             connector = aiohttp.TCPConnector(
                 limit=self.network.max_concurrency,
-                force_close=True,
+                limit_per_host=self.network.max_concurrency,
+                keepalive_timeout=self.network.keepalive_timeout,
+                ttl_dns_cache=300,
             )
             self._session = aiohttp.ClientSession(
                 timeout=timeout,
                 connector=connector,
                 headers={"User-Agent": USER_AGENT},
+                trace_configs=_profiling_trace_configs(),
             )
 
         if self._session is None:
@@ -174,7 +247,8 @@ class RemoteClient:
             try:
                 session = await self._get_session()
                 # Don't use async with - return response directly
-                resp = await session.request(method, url, **kwargs)
+                with _timed_request(url, method, attempt):
+                    resp = await session.request(method, url, **kwargs)
 
                 # Handle 429 with Retry-After header
                 if resp.status == 429:
@@ -191,13 +265,13 @@ class RemoteClient:
                         # Wait for Retry-After duration before retry
                         await resp.release()
                         if attempt < self.network.max_retries - 1:
-                            await asyncio.sleep(retry_after)
+                            await self._backoff(url, retry_after)
                         continue
                     # No valid Retry-After, treat as regular 429
                     await resp.release()
                     if attempt < self.network.max_retries - 1:
                         delay = self._calculate_delay(attempt)
-                        await asyncio.sleep(delay)
+                        await self._backoff(url, delay)
                     continue
 
                 # Check for other error statuses
@@ -238,7 +312,7 @@ class RemoteClient:
                 # Retry with backoff for 5xx and connection errors
                 if attempt < self.network.max_retries - 1:
                     delay = self._calculate_delay(attempt)
-                    await asyncio.sleep(delay)
+                    await self._backoff(url, delay)
 
         error_message = str(last_error) if last_error else "Unknown error"
         raise RemoteFetchError(
@@ -247,6 +321,11 @@ class RemoteClient:
             self.network.max_retries,
         )
 
+    async def _backoff(self, url: str, delay: float) -> None:
+        """Sleep before the next attempt (recorded as ``retry_wait``)."""
+        with profiling.span("retry_wait", self._get_host(url), delay=delay):
+            await asyncio.sleep(delay)
+
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay with jitter."""
         base_delay = self.network.retry_base_delay
@@ -258,30 +337,276 @@ class RemoteClient:
         result = min(delay + jitter, max_delay)
         return float(result)
 
+    async def _fetch_cached(self, url: str, trust_fresh: bool) -> bytes:
+        """GET ``url`` through the blob cache.
+
+        A ref within the TTL is returned without a request when
+        ``trust_fresh`` is set. Otherwise a ref carrying validators is
+        revalidated with ``If-None-Match`` / ``If-Modified-Since``; a 304
+        reuses the cached blob without transferring the body.
+        """
+        local = local_registry_path(url)
+        if local is not None:
+            return await asyncio.to_thread(_read_local, local, url)
+
+        if self.cache is None:
+            resp = await self._fetch_with_retry(url)
+            return await resp.read()
+
+        entry = await asyncio.to_thread(self.cache.read_ref, url)
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if trust_fresh and self.cache.is_fresh(entry):
+                cached = await asyncio.to_thread(self.cache.get_blob, entry["sha256"])
+                if cached is not None:
+                    return cached
+            headers = _conditional_headers(entry)
+
+        resp = await self._fetch_with_retry(url, headers=headers or None)
+        if resp.status == 304 and entry is not None:
+            await resp.release()
+            cached = await asyncio.to_thread(self.cache.get_blob, entry["sha256"])
+            if cached is not None:
+                await asyncio.to_thread(self._refresh_ref, url, entry, resp)
+                return cached
+            # Blob was evicted since the ref was written: fetch unconditionally
+            resp = await self._fetch_with_retry(url)
+
+        body = await resp.read()
+        await asyncio.to_thread(
+            self.cache.store,
+            url,
+            body,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        return body
+
+    async def _download_cached(self, url: str, dest: Path, trust_fresh: bool) -> str:
+        """Stream ``url`` to ``dest`` through the blob cache; return its sha256.
+
+        Mirrors ``_fetch_cached`` (TTL shortcut, conditional GET, 304 reuse)
+        but never holds the body in memory: cache hits are copied from the
+        blob store and downloads are written chunk by chunk.
+        """
+        local = local_registry_path(url)
+        if local is not None:
+            return await asyncio.to_thread(_copy_local, local, dest, url)
+
+        entry = None
+        if self.cache is not None:
+            entry = await asyncio.to_thread(self.cache.read_ref, url)
+        headers: dict[str, str] = {}
+        if self.cache is not None and entry is not None:
+            if (
+                trust_fresh
+                and self.cache.is_fresh(entry)
+                and await asyncio.to_thread(
+                    self.cache.materialize, entry["sha256"], dest
+                )
+            ):
+                return entry["sha256"]
+            headers = _conditional_headers(entry)
+
+        resp = await self._fetch_with_retry(url, headers=headers or None)
+        if resp.status == 304 and self.cache is not None and entry is not None:
+            await resp.release()
+            if await asyncio.to_thread(self.cache.materialize, entry["sha256"], dest):
+                await asyncio.to_thread(self._refresh_ref, url, entry, resp)
+                return entry["sha256"]
+            # Blob was evicted since the ref was written: fetch unconditionally
+            resp = await self._fetch_with_retry(url)
+
+        digest = await _stream_to_file(resp, dest)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.put_file, dest, digest)
+            await asyncio.to_thread(
+                self.cache.write_ref,
+                url,
+                digest,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+        return digest
+
+    def _refresh_ref(self, url: str, entry: dict, resp: aiohttp.ClientResponse) -> None:
+        """Re-stamp a ref after a 304, keeping or updating its validators."""
+        assert self.cache is not None
+        self.cache.write_ref(
+            url,
+            entry["sha256"],
+            etag=resp.headers.get("ETag") or entry.get("etag"),
+            last_modified=resp.headers.get("Last-Modified")
+            or entry.get("last_modified"),
+            validated=entry.get("validated"),
+        )
+
+    def _validate_cached(
+        self, model: type[_ModelT], body: bytes, url: str | None = None
+    ) -> _ModelT:
+        """Validate JSON ``body`` into ``model``, memoized per content hash.
+
+        A 304 hands back the same bytes as before, so the already-validated
+        model is reused instead of running pydantic again. Within a client
+        the model object itself is reused; across runs the cache ref for
+        ``url`` remembers that its blob validated and points at the model's
+        own dump, which is rebuilt without validators.
+        """
+        digest = sha256_hex(body)
+        key = (model, digest)
+        cached = self._models.get(key)
+        if cached is None:
+            entry = self._metadata_ref(url, digest)
+            cached = _load_validated(self.cache, model, entry)
+            if cached is None:
+                with profiling.span("validate", model.__name__, bytes=len(body)):
+                    cached = model.model_validate_json(body)
+                if entry is not None and url is not None:
+                    _save_validated(self.cache, url, entry, cached)
+            self._models[key] = cached
+        return cached  # type: ignore[return-value]
+
+    def _metadata_ref(self, url: str | None, digest: str) -> dict | None:
+        """The cache ref of ``url`` if it points at the blob ``digest``."""
+        if self.cache is None or url is None or local_registry_path(url):
+            return None
+        entry = self.cache.read_ref(url)
+        if entry is None or entry["sha256"] != digest:
+            return None
+        return entry
+
     async def fetch_registry(self, registry_url: str) -> Registry:
-        """Fetch registry.json from remote."""
+        """Fetch registry.json from remote (conditional GET when cached)."""
+        url = f"{registry_url}/registry.json"
+        # raw.githubusercontent.com returns text/plain; parse the raw bytes
+        body = await self._fetch_cached(url, trust_fresh=False)
+        return self._validate_cached(Registry, body, url)
+
+    def cached_registry(
+        self, registry_url: str, revalidate: bool = True
+    ) -> Registry | None:
+        """Return registry.json without waiting on the network, or None.
+
+        A local registry is read from disk; otherwise the cached copy is
+        returned whatever its age (stale-while-revalidate). One older than
+        ``cache.registry_ttl`` is refreshed in the background when
+        ``revalidate`` is set; ``close()`` gives the refresh a short grace
+        period, and once it lands the next call sees the update.
+        """
         url = f"{registry_url}/registry.json"
-        resp = await self._fetch_with_retry(url)
-        # raw.githubusercontent.com returns text/plain; skip mimetype check
-        data = await resp.json(content_type=None)
-        return Registry.model_validate(data)
+        local = local_registry_path(url)
+        if local is not None:
+            return self._validate_cached(Registry, _read_local(local, url))
+        if self.cache is None:
+            return None
+        entry = self.cache.read_ref(url)
+        if entry is None:
+            return None
+        body = self.cache.get_blob(entry["sha256"])
+        if body is None:
+            return None
+        try:
+            registry = self._validate_cached(Registry, body, url)
+        except ValueError:
+            return None
+        if revalidate and not self.cache.is_fresh(entry, self.cache.registry_ttl):
+            task = asyncio.ensure_future(self.fetch_registry(registry_url))
+            self._background.add(task)
+        return registry
 
     async def fetch_manifest(self, registry_url: str, kit_name: str) -> Manifest:
-        """Fetch manifest.json for a specific kit."""
+        """Fetch manifest.json for a specific kit (conditional GET when cached)."""
         url = f"{registry_url}/{kit_name}/manifest.json"
-        resp = await self._fetch_with_retry(url)
-        # raw.githubusercontent.com returns text/plain; skip mimetype check
-        data = await resp.json(content_type=None)
-        return Manifest.model_validate(data)
+        body = await self._fetch_cached(url, trust_fresh=False)
+        return self._validate_cached(Manifest, body, url)
 
     async def fetch_file(
-        self, registry_url: str, kit_name: str, subdir: str, filename: str
+        self,
+        registry_url: str,
+        kit_name: str,
+        subdir: str,
+        filename: str,
+        sha256: str | None = None,
+    ) -> str:
+        """Fetch a single file content from remote.
+
+        With the ``sha256`` published in the manifest, a cached blob of that
+        hash is returned without any request, and downloaded bytes are
+        verified against it.
+        """
+        url = f"{registry_url}/{kit_name}/{subdir}/{filename}"
+        body = await self._fetch_verified(url, f"{subdir}/{filename}", sha256)
+        return body.decode("utf-8")
+
+    async def download_file(
+        self,
+        registry_url: str,
+        kit_name: str,
+        subdir: str,
+        filename: str,
+        dest: Path,
+        sha256: str | None = None,
     ) -> str:
-        """Fetch a single file content from remote."""
+        """Stream a single file from remote straight to ``dest``.
+
+        Chunks are hashed as they arrive, so memory stays flat regardless of
+        file size. Returns the sha256 of the written file; with ``sha256``
+        given, a cached blob is copied without any request and a mismatch
+        removes ``dest`` and raises ``RemoteFetchError``.
+        """
         url = f"{registry_url}/{kit_name}/{subdir}/{filename}"
-        resp = await self._fetch_with_retry(url)
-        # raise_for_status() is now handled in _fetch_with_retry
-        return await resp.text()
+        return await self._download_verified(url, f"{subdir}/{filename}", dest, sha256)
+
+    async def download_archive(
+        self, registry_url: str, kit_name: str, archive: KitArchive, dest: Path
+    ) -> str:
+        """Stream a kit's archive bundle to ``dest``, verified like ``download_file``."""
+        url = f"{registry_url}/{kit_name}/{archive.path}"
+        return await self._download_verified(url, archive.path, dest, archive.sha256)
+
+    async def _download_verified(
+        self, url: str, label: str, dest: Path, sha256: str | None
+    ) -> str:
+        """Stream ``url`` to ``dest`` through the cache, checking ``sha256``."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if (
+            sha256 is not None
+            and self.cache is not None
+            and await asyncio.to_thread(self.cache.materialize, sha256, dest)
+        ):
+            return sha256
+        digest = await self._download_cached(url, dest, trust_fresh=sha256 is None)
+        if sha256 is not None and digest != sha256:
+            dest.unlink(missing_ok=True)
+            raise RemoteFetchError(
+                f"sha256 mismatch for {label}: expected {sha256}, got {digest}",
+                url,
+                1,
+            )
+        return digest
+
+    async def _fetch_verified(self, url: str, label: str, sha256: str | None) -> bytes:
+        """Fetch ``url`` through the cache, checking it against ``sha256``.
+
+        A cached blob of the expected hash is returned without any request.
+        """
+        if sha256 is not None and self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get_blob, sha256)
+            if cached is not None:
+                return cached
+        # raise_for_status() is now handled in _fetch_with_retry.
+        # A known hash that missed the blob store means the URL's cached
+        # content is outdated, so skip the TTL shortcut.
+        body = await self._fetch_cached(url, trust_fresh=sha256 is None)
+        if sha256 is not None:
+            actual = sha256_hex(body)
+            if actual != sha256:
+                raise RemoteFetchError(
+                    f"sha256 mismatch for {label}: expected {sha256}, got {actual}",
+                    url,
+                    1,
+                )
+        return body
 
     async def fetch_files_concurrent(
         self,
@@ -324,31 +649,284 @@ class RemoteClient:
         return fetched
 
 
-# Module-level async functions for backward compatibility
-async def fetch_registry(registry_url: str) -> Registry:
-    """Fetch registry.json from remote."""
-    client = RemoteClient()
+def local_registry_path(url: str) -> Path | None:
+    """Return the filesystem path for a ``file://`` URL or plain path.
+
+    Any URL with another scheme (``http://``, ``https://``) returns None and
+    is fetched over HTTP.
+    """
+    if url.startswith("file://"):
+        return Path(url2pathname(urlparse(url).path))
+    if "://" in url:
+        return None
+    return Path(url)
+
+
+def _local_error(path: Path, url: str, exc: OSError) -> Exception:
+    """Map a local read failure onto the errors HTTP fetches raise.
+
+    A missing file becomes a 404 ``ClientResponseError`` so commands report
+    "not found" exactly as they do for a remote registry.
+    """
+    if isinstance(exc, (FileNotFoundError, NotADirectoryError, IsADirectoryError)):
+        request_url = URL(path.as_uri()) if path.is_absolute() else URL(url)
+        return aiohttp.ClientResponseError(
+            request_info=aiohttp.RequestInfo(
+                request_url, "GET", CIMultiDictProxy(CIMultiDict()), request_url
+            ),
+            history=(),
+            status=404,
+            message="Not Found",
+        )
+    return RemoteFetchError(f"Cannot read {path}: {exc}", url, 1)
+
+
+def _read_local(path: Path, url: str) -> bytes:
+    """Read a file from a local registry."""
+    with profiling.span("local", path.name):
+        try:
+            return path.read_bytes()
+        except OSError as exc:
+            raise _local_error(path, url, exc) from exc
+
+
+def _copy_local(path: Path, dest: Path, url: str) -> str:
+    """Copy a file from a local registry to ``dest``; return its sha256.
+
+    ``shutil.copyfile`` uses the kernel's zero-copy path (sendfile /
+    copy_file_range) where available, so no bytes pass through Python.
+    """
+    with profiling.span("local", path.name):
+        try:
+            shutil.copyfile(path, dest)
+        except OSError as exc:
+            dest.unlink(missing_ok=True)
+            raise _local_error(path, url, exc) from exc
+        return file_sha256(dest)
+
+
+def _model_tag(model: type[BaseModel]) -> str:
+    # A dump written by another multikit version may not fit this model
+    return f"{model.__name__}@{__version__}"
+
+
+def _load_validated(
+    cache: BlobCache | None, model: type[_ModelT], entry: dict | None
+) -> _ModelT | None:
+    """Rebuild ``model`` from the dump a ref's ``validated`` marker points at."""
+    marker = entry.get("validated") if entry is not None else None
+    if cache is None or not isinstance(marker, dict):
+        return None
+    if marker.get("model") != _model_tag(model):
+        return None
+    dump = cache.get_blob(str(marker.get("sha256")))
+    if dump is None:
+        return None
+    try:
+        return _construct(model, json.loads(dump))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _save_validated(
+    cache: BlobCache | None, url: str, entry: dict, model: BaseModel
+) -> None:
+    """Store ``model``'s dump and mark the ref's blob as validated."""
+    if cache is None:
+        return
+    digest = cache.put_blob(model.model_dump_json().encode("utf-8"))
+    cache.mark_validated(
+        url, entry, {"model": _model_tag(type(model)), "sha256": digest}
+    )
+
+
+def _construct(model: type[_ModelT], data: dict) -> _ModelT:
+    """Build ``model`` from its own ``model_dump`` without running validators."""
+    values = {
+        name: _construct_value(field.annotation, data[name])
+        for name, field in model.model_fields.items()
+        if name in data
+    }
+    return model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct(annotation, value)
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is list:
+        return [_construct_value(args[0], item) for item in value]
+    if origin is dict:
+        return {k: _construct_value(args[1], v) for k, v in value.items()}
+    # Optional[Model] and other unions: the non-None member
+    for arg in args:
+        if arg is not type(None):
+            return _construct_value(arg, value)
+    return value
+
+
+def _conditional_headers(entry: dict) -> dict[str, str]:
+    """Build ``If-None-Match`` / ``If-Modified-Since`` from a cache ref."""
+    headers: dict[str, str] = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+async def _stream_to_file(resp: aiohttp.ClientResponse, dest: Path) -> str:
+    """Write a response body to ``dest`` chunk by chunk; return its sha256.
+
+    A partially written ``dest`` is removed if the transfer fails.
+    """
+    hasher = hashlib.sha256()
     try:
-        return await client.fetch_registry(registry_url)
+        with profiling.span("download", dest.name):
+            async with aiofiles.open(dest, "wb") as f:
+                async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await f.write(chunk)
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
     finally:
-        await client.close()
+        await resp.release()
+    return hasher.hexdigest()
+
+
+@contextmanager
+def _timed_request(url: str, method: str, attempt: int) -> Iterator[None]:
+    """Record one HTTP attempt (time to response headers) while profiling."""
+    profiler = profiling.active()
+    if profiler is None:
+        yield
+        return
+    parsed = urlparse(url)
+    start = profiler.now()
+    try:
+        yield
+    finally:
+        end = profiler.now()
+        profiler.add("http", f"{method} {parsed.path}", start, end, attempt=attempt + 1)
+        profiler.record_request(parsed.netloc, end - start)
 
 
-async def fetch_manifest(registry_url: str, kit_name: str) -> Manifest:
-    """Fetch manifest.json for a specific kit."""
-    client = RemoteClient()
+def _profiling_trace_configs() -> list[aiohttp.TraceConfig]:
+    """aiohttp hooks that record DNS lookups and TCP/TLS connects as spans."""
+    profiler = profiling.active()
+    if profiler is None:
+        return []
+
+    async def on_dns_start(_session, ctx, params) -> None:
+        ctx.dns_start = profiler.now()
+
+    async def on_dns_end(_session, ctx, params) -> None:
+        profiler.add("dns", params.host, ctx.dns_start, profiler.now())
+
+    async def on_connect_start(_session, ctx, _params) -> None:
+        ctx.connect_start = profiler.now()
+
+    async def on_connect_end(_session, ctx, _params) -> None:
+        profiler.add("connect", "tcp+tls", ctx.connect_start, profiler.now())
+
+    trace = aiohttp.TraceConfig()
+    trace.on_dns_resolvehost_start.append(on_dns_start)
+    trace.on_dns_resolvehost_end.append(on_dns_end)
+    trace.on_connection_create_start.append(on_connect_start)
+    trace.on_connection_create_end.append(on_connect_end)
+    return [trace]
+
+
+def create_client(config: MultikitConfig, link: str | None = None) -> RemoteClient:
+    """Build the per-command client: pooled session plus the user blob cache.
+
+    ``link`` overrides ``cache.link`` for how cached files are materialised.
+    """
+    return RemoteClient(
+        config.network, cache=BlobCache.from_config(config.cache, link=link)
+    )
+
+
+# Module-level async functions for backward compatibility.
+# Pass ``client`` to reuse a command's pooled session; without it a
+# short-lived client is created and closed around the single call.
+@asynccontextmanager
+async def _borrow_client(client: RemoteClient | None) -> AsyncIterator[RemoteClient]:
+    """Yield ``client`` as-is, or a temporary client closed on exit."""
+    if client is not None:
+        yield client
+        return
+    owned = RemoteClient()
     try:
-        return await client.fetch_manifest(registry_url, kit_name)
+        yield owned
     finally:
-        await client.close()
+        await owned.close()
+
+
+async def fetch_registry(
+    registry_url: str, client: RemoteClient | None = None
+) -> Registry:
+    """Fetch registry.json from remote."""
+    async with _borrow_client(client) as active:
+        return await active.fetch_registry(registry_url)
+
+
+def cached_registry(
+    registry_url: str, client: RemoteClient, revalidate: bool = True
+) -> Registry | None:
+    """Return registry.json from ``client``'s cache, revalidating it if stale."""
+    return client.cached_registry(registry_url, revalidate=revalidate)
+
+
+async def fetch_manifest(
+    registry_url: str, kit_name: str, client: RemoteClient | None = None
+) -> Manifest:
+    """Fetch manifest.json for a specific kit."""
+    async with _borrow_client(client) as active:
+        return await active.fetch_manifest(registry_url, kit_name)
 
 
 async def fetch_file(
-    registry_url: str, kit_name: str, subdir: str, filename: str
+    registry_url: str,
+    kit_name: str,
+    subdir: str,
+    filename: str,
+    client: RemoteClient | None = None,
+    sha256: str | None = None,
 ) -> str:
     """Fetch a single file content from remote."""
-    client = RemoteClient()
-    try:
-        return await client.fetch_file(registry_url, kit_name, subdir, filename)
-    finally:
-        await client.close()
+    async with _borrow_client(client) as active:
+        return await active.fetch_file(
+            registry_url, kit_name, subdir, filename, sha256=sha256
+        )
+
+
+async def download_file(
+    registry_url: str,
+    kit_name: str,
+    subdir: str,
+    filename: str,
+    dest: Path,
+    client: RemoteClient | None = None,
+    sha256: str | None = None,
+) -> str:
+    """Stream a single file from remote to ``dest``. Returns its sha256."""
+    async with _borrow_client(client) as active:
+        return await active.download_file(
+            registry_url, kit_name, subdir, filename, dest, sha256=sha256
+        )
+
+
+async def download_archive(
+    registry_url: str,
+    kit_name: str,
+    archive: KitArchive,
+    dest: Path,
+    client: RemoteClient | None = None,
+) -> str:
+    """Stream a kit's archive bundle to ``dest``. Returns its sha256."""
+    async with _borrow_client(client) as active:
+        return await active.download_archive(registry_url, kit_name, archive, dest)
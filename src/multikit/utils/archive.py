@@ -0,0 +1,61 @@
+"""Kit archive bundles: extract declared members from .tar.gz / .zip files."""
+
+from __future__ import annotations
+
+import shutil
+import tarfile
+import zipfile
+from pathlib import Path
+
+
+class ArchiveError(Exception):
+    """Raised when a kit archive cannot be read."""
+
+
+def _member_key(name: str) -> str:
+    """Normalize an archive member name to a 'subdir/filename' key."""
+    while name.startswith("./"):
+        name = name[2:]
+    return name
+
+
+def extract_archive_members(
+    archive: Path, dest_dir: Path, wanted: set[str]
+) -> set[str]:
+    """Copy each ``wanted`` member of ``archive`` to ``dest_dir/<key>``.
+
+    ``wanted`` holds 'subdir/filename' keys (e.g. 'agents/x.agent.md').
+    Members are streamed to disk one at a time, and members outside
+    ``wanted`` are never written, so hostile paths inside the archive cannot
+    escape ``dest_dir``. Returns the keys that were found and extracted.
+    """
+    extracted: set[str] = set()
+    try:
+        if archive.name.endswith(".zip"):
+            with zipfile.ZipFile(archive) as zf:
+                for info in zf.infolist():
+                    key = _member_key(info.filename)
+                    if key not in wanted or info.is_dir():
+                        continue
+                    target = dest_dir / key
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with zf.open(info) as src, open(target, "wb") as out:
+                        shutil.copyfileobj(src, out)
+                    extracted.add(key)
+        else:
+            with tarfile.open(archive, mode="r:*") as tf:
+                for member in tf:
+                    key = _member_key(member.name)
+                    if key not in wanted or not member.isfile():
+                        continue
+                    src = tf.extractfile(member)
+                    if src is None:
+                        continue
+                    target = dest_dir / key
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with src, open(target, "wb") as out:
+                        shutil.copyfileobj(src, out)
+                    extracted.add(key)
+    except (tarfile.TarError, zipfile.BadZipFile, EOFError, OSError) as exc:
+        raise ArchiveError(f"Cannot read archive '{archive.name}': {exc}") from exc
+    return extracted
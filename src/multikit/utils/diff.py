@@ -1,9 +1,23 @@
-"""Diff utilities: colored unified diff and interactive overwrite prompt."""
+"""Diff utilities: colored unified diff and interactive overwrite prompt.
+
+Unified diffs are built from the opcodes of a pluggable engine
+(:data:`DIFF_ENGINES`). The default ``patience`` engine interns lines to
+ints, trims the common prefix and suffix, anchors on lines that occur once
+on both sides (patience diff) and runs a cost-capped Myers search only in
+the gaps without anchors, which keeps large generated templates close to
+linear. ``difflib`` (``SequenceMatcher``) is kept as the fallback engine;
+select it with ``MULTIKIT_DIFF_ENGINE=difflib``.
+"""
 
 from __future__ import annotations
 
 import difflib
+import os
 import sys
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+
+from multikit.utils.profiling import timed
 
 # ANSI color codes
 RED = "\033[91m"
@@ -12,47 +26,306 @@ CYAN = "\033[96m"
 BOLD = "\033[1m"
 RESET = "\033[0m"
 
+DIFF_ENGINE_ENV = "MULTIKIT_DIFF_ENGINE"
+
+# (tag, i1, i2, j1, j2), as returned by difflib.SequenceMatcher.get_opcodes
+Opcode = tuple[str, int, int, int, int]
+DiffEngine = Callable[[Sequence[str], Sequence[str]], list[Opcode]]
+
+# Myers is only run on anchor-free gaps; beyond this many compared line
+# pairs a gap is emitted as one replace hunk instead of searched further
+_MYERS_BUDGET = 4_000_000
+
+
+def _difflib_opcodes(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    return difflib.SequenceMatcher(None, a, b).get_opcodes()
+
+
+def _unique_anchors(
+    x: list[int], lo1: int, hi1: int, y: list[int], lo2: int, hi2: int
+) -> list[tuple[int, int]]:
+    """Longest increasing run of lines unique to both ranges (patience LCS)."""
+    count_a: dict[int, int] = {}
+    pos_a: dict[int, int] = {}
+    for i in range(lo1, hi1):
+        count_a[x[i]] = count_a.get(x[i], 0) + 1
+        pos_a[x[i]] = i
+    count_b: dict[int, int] = {}
+    pos_b: dict[int, int] = {}
+    for j in range(lo2, hi2):
+        if count_a.get(y[j]) == 1:
+            count_b[y[j]] = count_b.get(y[j], 0) + 1
+            pos_b[y[j]] = j
+    pairs = sorted((pos_b[line], pos_a[line]) for line, n in count_b.items() if n == 1)
+    if not pairs:
+        return []
+
+    # Patience sorting: tails[k] ends the best run of length k + 1
+    tails: list[int] = []
+    tail_keys: list[int] = []
+    back = [-1] * len(pairs)
+    for index, (_, i) in enumerate(pairs):
+        slot = bisect_left(tail_keys, i)
+        if slot:
+            back[index] = tails[slot - 1]
+        if slot == len(tails):
+            tails.append(index)
+            tail_keys.append(i)
+        else:
+            tails[slot] = index
+            tail_keys[slot] = i
+    anchors: list[tuple[int, int]] = []
+    index = tails[-1]
+    while index != -1:
+        j, i = pairs[index]
+        anchors.append((i, j))
+        index = back[index]
+    anchors.reverse()
+    return anchors
+
+
+def _myers_blocks(
+    x: list[int], lo1: int, hi1: int, y: list[int], lo2: int, hi2: int
+) -> list[tuple[int, int, int]]:
+    """Matching blocks of a shortest edit script, or [] past the cost cap."""
+    n, m = hi1 - lo1, hi2 - lo2
+    max_d = min(n + m, _MYERS_BUDGET // (n + m))
+    v = {1: 0}
+    trace: list[dict[int, int]] = []
+    for d in range(max_d + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                px = v[k + 1]
+            else:
+                px = v[k - 1] + 1
+            py = px - k
+            while px < n and py < m and x[lo1 + px] == y[lo2 + py]:
+                px += 1
+                py += 1
+            v[k] = px
+            if px >= n and py >= m:
+                return _myers_backtrack(trace, n, m, lo1, lo2)
+    return []
+
+
+def _myers_backtrack(
+    trace: list[dict[int, int]], px: int, py: int, lo1: int, lo2: int
+) -> list[tuple[int, int, int]]:
+    blocks: list[tuple[int, int, int]] = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = px - py
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        # The snake starts right after this step's insertion or deletion
+        if d == 0:
+            mid_x, mid_y = 0, 0
+        elif prev_k == k + 1:
+            mid_x, mid_y = prev_x, prev_y + 1
+        else:
+            mid_x, mid_y = prev_x + 1, prev_y
+        if px > mid_x:
+            blocks.append((lo1 + mid_x, lo2 + mid_y, px - mid_x))
+        px, py = prev_x, prev_y
+    return blocks
+
+
+def _patience_opcodes(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    ids: dict[str, int] = {}
+    x = [ids.setdefault(line, len(ids)) for line in a]
+    y = [ids.setdefault(line, len(ids)) for line in b]
+
+    blocks: list[tuple[int, int, int]] = []
+    ranges = [(0, len(x), 0, len(y))]
+    while ranges:
+        lo1, hi1, lo2, hi2 = ranges.pop()
+        start1, start2 = lo1, lo2
+        while lo1 < hi1 and lo2 < hi2 and x[lo1] == y[lo2]:
+            lo1 += 1
+            lo2 += 1
+        if lo1 > start1:
+            blocks.append((start1, start2, lo1 - start1))
+        end1 = hi1
+        while hi1 > lo1 and hi2 > lo2 and x[hi1 - 1] == y[hi2 - 1]:
+            hi1 -= 1
+            hi2 -= 1
+        if hi1 < end1:
+            blocks.append((hi1, hi2, end1 - hi1))
+        if lo1 == hi1 or lo2 == hi2:
+            continue
+
+        anchors = _unique_anchors(x, lo1, hi1, y, lo2, hi2)
+        if not anchors:
+            blocks.extend(_myers_blocks(x, lo1, hi1, y, lo2, hi2))
+            continue
+        for i, j in anchors:
+            ranges.append((lo1, i, lo2, j))
+            blocks.append((i, j, 1))
+            lo1, lo2 = i + 1, j + 1
+        ranges.append((lo1, hi1, lo2, hi2))
+
+    return _blocks_to_opcodes(sorted(blocks), len(x), len(y))
+
 
+def _blocks_to_opcodes(
+    blocks: list[tuple[int, int, int]], n: int, m: int
+) -> list[Opcode]:
+    """Turn sorted matching blocks into ``get_opcodes``-style opcodes."""
+    opcodes: list[Opcode] = []
+    i = j = 0
+    for ai, bj, size in [*blocks, (n, m, 0)]:
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+        if size:
+            if opcodes and opcodes[-1][0] == "equal":
+                # Adjacent blocks from different passes form one equal run
+                _, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(("equal", i1, ai + size, j1, bj + size))
+            else:
+                opcodes.append(("equal", ai, ai + size, bj, bj + size))
+        i, j = ai + size, bj + size
+    return opcodes
+
+
+DIFF_ENGINES: dict[str, DiffEngine] = {
+    "patience": _patience_opcodes,
+    "difflib": _difflib_opcodes,
+}
+
+
+def _group_opcodes(opcodes: list[Opcode], n: int) -> Iterator[list[Opcode]]:
+    """Split opcodes into hunks with ``n`` lines of context (as difflib does)."""
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > 2 * n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    """``start,length`` for a hunk header, per the unified diff format."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _engine(name: str | None) -> DiffEngine:
+    """Resolve ``name`` (or ``$MULTIKIT_DIFF_ENGINE``) to a diff engine."""
+    name = name or os.environ.get(DIFF_ENGINE_ENV) or "patience"
+    try:
+        return DIFF_ENGINES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown diff engine {name!r}; expected one of {sorted(DIFF_ENGINES)}"
+        ) from None
+
+
+@timed("diff")
+def diff_stat(
+    old_content: str, new_content: str, engine: str | None = None
+) -> tuple[int, int]:
+    """Return ``(insertions, deletions)`` without building any hunks."""
+    if old_content == new_content:
+        return 0, 0
+    old_lines = old_content.splitlines(keepends=True)
+    new_lines = new_content.splitlines(keepends=True)
+    insertions = deletions = 0
+    for tag, i1, i2, j1, j2 in _engine(engine)(old_lines, new_lines):
+        if tag != "equal":
+            deletions += i2 - i1
+            insertions += j2 - j1
+    return insertions, deletions
+
+
+@timed("diff")
 def generate_diff(
     old_content: str,
     new_content: str,
     old_label: str = "local",
     new_label: str = "remote",
+    engine: str | None = None,
 ) -> list[str]:
     """Generate unified diff lines between two strings.
 
-    Returns list of diff lines (empty if no differences).
+    ``engine`` names an entry of :data:`DIFF_ENGINES`, defaulting to
+    ``$MULTIKIT_DIFF_ENGINE`` or ``patience``. Returns list of diff lines
+    (empty if no differences).
     """
+    if old_content == new_content:
+        return []
     old_lines = old_content.splitlines(keepends=True)
     new_lines = new_content.splitlines(keepends=True)
 
-    return list(
-        difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=old_label,
-            tofile=new_label,
-            n=3,
+    lines: list[str] = []
+    opcodes = _engine(engine)(old_lines, new_lines)
+    for group in _group_opcodes(opcodes, n=3):
+        if not lines:
+            lines += [f"--- {old_label}\n", f"+++ {new_label}\n"]
+        first, last = group[0], group[-1]
+        lines.append(
+            f"@@ -{_format_range(first[1], last[2])} "
+            f"+{_format_range(first[3], last[4])} @@\n"
         )
-    )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                lines += [" " + line for line in old_lines[i1:i2]]
+                continue
+            if tag in ("replace", "delete"):
+                lines += ["-" + line for line in old_lines[i1:i2]]
+            if tag in ("replace", "insert"):
+                lines += ["+" + line for line in new_lines[j1:j2]]
+    return lines
 
 
-def print_colored_diff(diff_lines: list[str]) -> None:
-    """Print diff lines with ANSI colors."""
+def format_colored_diff(diff_lines: list[str]) -> str:
+    """Render diff lines with ANSI colors, ending in a newline."""
+    parts: list[str] = []
     for line in diff_lines:
         if line.startswith("---") or line.startswith("+++"):
-            sys.stdout.write(f"{BOLD}{line}{RESET}")
+            parts.append(f"{BOLD}{line}{RESET}")
         elif line.startswith("@@"):
-            sys.stdout.write(f"{CYAN}{line}{RESET}")
+            parts.append(f"{CYAN}{line}{RESET}")
         elif line.startswith("-"):
-            sys.stdout.write(f"{RED}{line}{RESET}")
+            parts.append(f"{RED}{line}{RESET}")
         elif line.startswith("+"):
-            sys.stdout.write(f"{GREEN}{line}{RESET}")
+            parts.append(f"{GREEN}{line}{RESET}")
         else:
-            sys.stdout.write(line)
+            parts.append(line)
     # Ensure trailing newline
     if diff_lines and not diff_lines[-1].endswith("\n"):
-        sys.stdout.write("\n")
+        parts.append("\n")
+    return "".join(parts)
+
+
+def print_colored_diff(diff_lines: list[str]) -> None:
+    """Print diff lines with ANSI colors."""
+    sys.stdout.write(format_colored_diff(diff_lines))
 
 
 def show_diff(
@@ -73,6 +346,7 @@ def show_diff(
     return True
 
 
+@timed("prompt")
 def prompt_overwrite(filename: str) -> str:
     """Prompt user for overwrite decision on a single file.
 
@@ -1,62 +1,74 @@
-"""File utilities: atomic install, file delete, file move."""
+"""File utilities: atomic install, file delete, file move, content hashing."""
 
 from __future__ import annotations
 
+import errno
+import hashlib
+import os
 import shutil
 import tempfile
 from pathlib import Path
 from typing import Generator
 from contextlib import contextmanager
-import aiofiles
+
+from multikit.utils.profiling import timed
+
+
+STAGING_PREFIX = ".multikit-staging-"
 
 
 @contextmanager
-def atomic_staging(prefix: str = "multikit-") -> Generator[Path, None, None]:
+def atomic_staging(
+    prefix: str = "multikit-", parent: Path | None = None
+) -> Generator[Path, None, None]:
     """Context manager providing a temporary directory for atomic file staging.
 
     Files are written to the temp dir first, then moved to final location.
     On any error, the temp dir is automatically cleaned up.
+
+    With ``parent`` (e.g. the project's ``.github/``), the directory is
+    created there as ``.multikit-staging-<pid>-*`` instead of the system temp
+    dir, so staged files sit on the destination filesystem and
+    ``commit_file`` can rename them into place without copying.
     """
-    with tempfile.TemporaryDirectory(prefix=prefix) as tmp_str:
+    if parent is None:
+        with tempfile.TemporaryDirectory(prefix=prefix) as tmp_str:
+            yield Path(tmp_str)
+        return
+
+    parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(
+        prefix=f"{STAGING_PREFIX}{os.getpid()}-", dir=parent
+    ) as tmp_str:
         yield Path(tmp_str)
 
 
-def stage_file(staging_dir: Path, subdir: str, filename: str, content: str) -> Path:
-    """Write a file to the staging directory.
+def commit_file(src: Path, dst: Path) -> None:
+    """Move a staged file to ``dst``, replacing any existing file atomically.
 
-    Returns the path to the staged file.
+    Within one filesystem this is a single ``os.replace`` rename: readers see
+    either the old or the new file, never a partial one. Across devices
+    (staging in the system temp dir) it falls back to ``shutil.move``.
     """
-    dest = staging_dir / subdir / filename
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_text(content, encoding="utf-8")
-    return dest
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
 
 
-def move_staged_files(
-    staging_dir: Path,
-    target_dir: Path,
-    files: list[tuple[str, str]],
-) -> list[str]:
-    """Move staged files from staging dir to target .github/ directory.
+@timed("stage")
+def stage_copy(staging_dir: Path, subdir: str, filename: str, src: Path) -> Path:
+    """Copy an existing file into the staging directory byte for byte.
 
-    Args:
-        staging_dir: Temporary directory with downloaded files
-        target_dir: Project .github/ directory
-        files: List of (subdir, filename) pairs
-
-    Returns:
-        List of relative file paths that were installed (relative to .github/)
+    Returns the path to the staged file.
     """
-    installed: list[str] = []
-    for subdir, filename in files:
-        src = staging_dir / subdir / filename
-        if not src.exists():
-            continue
-        dst = target_dir / subdir / filename
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(src), str(dst))
-        installed.append(f"{subdir}/{filename}")
-    return installed
+    dest = staging_dir / subdir / filename
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, dest)
+    return dest
 
 
 def delete_kit_files(github_dir: Path, file_paths: list[str]) -> int:
@@ -78,9 +90,35 @@ def delete_kit_files(github_dir: Path, file_paths: list[str]) -> int:
     return deleted
 
 
-# Async file I/O helpers
+def file_sha256(path: Path) -> str:
+    """Return the hex sha256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_matches(path: Path, sha256: str, size: int | None = None) -> bool:
+    """Check whether a local file has the given content hash.
+
+    A known ``size`` is compared first so mismatches are found without
+    reading the file. Missing or unreadable files never match.
+    """
+    try:
+        if size is not None and path.stat().st_size != size:
+            return False
+        return file_sha256(path) == sha256
+    except OSError:
+        return False
+
+
+# Async file I/O helpers. aiofiles is imported on first use so the sync
+# commands (status, uninstall, cache) start without it.
 async def async_write_file(path: Path, content: str) -> None:
     """Write content to file asynchronously."""
+    import aiofiles
+
     path.parent.mkdir(parents=True, exist_ok=True)
     async with aiofiles.open(path, "w", encoding="utf-8") as f:
         await f.write(content)
@@ -88,12 +126,16 @@ async def async_write_file(path: Path, content: str) -> None:
 
 async def async_read_file(path: Path) -> str:
     """Read file content asynchronously."""
+    import aiofiles
+
     async with aiofiles.open(path, "r", encoding="utf-8") as f:
         return await f.read()
 
 
 async def async_move_file(src: Path, dst: Path) -> None:
     """Move file asynchronously (copy + delete)."""
+    import aiofiles
+
     dst.parent.mkdir(parents=True, exist_ok=True)
     # Copy content
     async with aiofiles.open(src, "r", encoding="utf-8") as sf:
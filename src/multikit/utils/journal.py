@@ -0,0 +1,322 @@
+"""Transaction journal: commit a batch of staged files all-or-nothing.
+
+A :class:`Transaction` owns a staging directory under ``.github/``. Commands
+download into it and plan renames with :meth:`Transaction.add`; nothing in
+the project changes until :meth:`Transaction.commit`, which
+
+1. writes ``.multikit/journal`` listing every planned rename,
+2. keeps each file it is about to replace as a hard link in the staging dir,
+3. renames the staged files into place and flushes the config session,
+4. deletes the journal.
+
+A commit that fails is rolled back before the error propagates. If the
+process dies half-way, the journal and staging dir survive and
+:func:`recover` (``multikit recover``) finishes or rolls back the batch.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from multikit.utils import profiling
+from multikit.utils.files import STAGING_PREFIX, commit_file
+from multikit.utils.toml_io import (
+    LOCKFILE_NAME,
+    STATE_DIR,
+    ConfigSession,
+    atomic_write_bytes,
+    config_lock,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+JOURNAL_DIR = STATE_DIR
+JOURNAL_NAME = "journal"
+RECOVER_HINT = (
+    "✗ A previous multikit run was interrupted. "
+    "Run 'multikit recover' to finish or roll it back."
+)
+_JOURNAL_VERSION = 1
+# Originals of replaced files, inside the transaction's staging dir
+_BACKUP_DIR = ".rollback"
+_CONFIG_FILES = ("multikit.toml", LOCKFILE_NAME)
+
+
+def journal_path(project_dir: Path) -> Path:
+    return project_dir / JOURNAL_DIR / JOURNAL_NAME
+
+
+def has_pending_journal(project_dir: Path) -> bool:
+    """Whether an interrupted commit is waiting for ``multikit recover``."""
+    return journal_path(project_dir).is_file()
+
+
+def _discard_journal(path: Path) -> None:
+    """Delete a settled journal, and ``.multikit/`` once nothing else is in it."""
+    path.unlink()
+    try:
+        path.parent.rmdir()
+    except OSError:
+        pass  # still holds other files
+
+
+class Transaction:
+    """Staged file renames plus config changes, committed as one batch.
+
+    Use as a context manager: the staging directory is created on entry and
+    removed on exit, so leaving the block without :meth:`commit` discards
+    every planned change.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        session: ConfigSession | None = None,
+        operation: str = "install",
+    ) -> None:
+        self.project_dir = project_dir
+        self.session = session
+        self.operation = operation
+        self.staging_dir = project_dir / ".github"
+        self.committed = False
+        self._renames: list[tuple[Path, Path]] = []
+        # Set while a failed rollback leaves the journal for `recover`
+        self._keep_staging = False
+
+    def __enter__(self) -> Self:
+        github_dir = self.project_dir / ".github"
+        github_dir.mkdir(parents=True, exist_ok=True)
+        self.staging_dir = Path(
+            tempfile.mkdtemp(prefix=f"{STAGING_PREFIX}{os.getpid()}-", dir=github_dir)
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if not self._keep_staging:
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def add(self, src: Path, dst: Path) -> None:
+        """Plan moving staged file ``src`` to ``dst`` at commit time."""
+        self._renames.append((src, dst))
+
+    def commit(self) -> None:
+        """Move every planned file into place and flush the config session.
+
+        Runs under :func:`config_lock`. On any error the files and config
+        are restored from the journal before the error is re-raised.
+        """
+        if self.committed:
+            return
+        with (
+            profiling.span("commit", self.operation, files=len(self._renames)),
+            config_lock(self.project_dir),
+        ):
+            record = self._record()
+            path = journal_path(self.project_dir)
+            path.parent.mkdir(exist_ok=True)
+            atomic_write_bytes(path, json.dumps(record, indent=2).encode("utf-8"))
+            try:
+                _apply(self.project_dir, record, self.session)
+            except BaseException:
+                try:
+                    _rollback(self.project_dir, record)
+                except BaseException:
+                    # Keep the journal and backups so `recover` can retry
+                    self._keep_staging = True
+                    raise
+                _discard_journal(path)
+                raise
+            _discard_journal(path)
+        self.committed = True
+
+    def _record(self) -> dict[str, Any]:
+        def rel(path: Path) -> str:
+            return path.relative_to(self.project_dir).as_posix()
+
+        return {
+            "version": _JOURNAL_VERSION,
+            "operation": self.operation,
+            "pid": os.getpid(),
+            "staging": rel(self.staging_dir),
+            "renames": [
+                {"src": rel(src), "dst": rel(dst), "existed": dst.exists()}
+                for src, dst in self._renames
+            ],
+            "config": {
+                name: (self.project_dir / name).exists() for name in _CONFIG_FILES
+            },
+            "changes": self.session.changes() if self.session else None,
+        }
+
+
+def _preserve(path: Path, backup: Path) -> None:
+    """Keep the current ``path`` as ``backup`` (a hard link when possible)."""
+    if backup.exists() or not path.exists():
+        return
+    try:
+        os.link(path, backup)
+    except OSError:
+        shutil.copy2(path, backup)
+
+
+def _apply(
+    project_dir: Path, record: dict[str, Any], session: ConfigSession | None
+) -> None:
+    """Perform the journaled renames not done yet, then flush ``session``."""
+    backups = project_dir / record["staging"] / _BACKUP_DIR
+    backups.mkdir(exist_ok=True)
+    for i, op in enumerate(record["renames"]):
+        src, dst = project_dir / op["src"], project_dir / op["dst"]
+        if not src.exists():
+            continue  # renamed before an interruption
+        if op["existed"]:
+            _preserve(dst, backups / str(i))
+        commit_file(src, dst)
+
+    if session is not None:
+        for name in _CONFIG_FILES:
+            _preserve(project_dir / name, backups / name)
+        session.flush()
+
+
+def _rollback(project_dir: Path, record: dict[str, Any]) -> None:
+    """Put back every file the journaled commit replaced or created."""
+    backups = project_dir / record["staging"] / _BACKUP_DIR
+    for name, existed in record["config"].items():
+        backup = backups / name
+        if backup.exists():
+            os.replace(backup, project_dir / name)
+        elif not existed:
+            (project_dir / name).unlink(missing_ok=True)
+
+    for i, op in reversed(list(enumerate(record["renames"]))):
+        src, dst = project_dir / op["src"], project_dir / op["dst"]
+        backup = backups / str(i)
+        if backup.exists():
+            os.replace(backup, dst)
+        elif not op["existed"] and not src.exists():
+            # Created by the commit; an existing file without a backup was
+            # never replaced
+            dst.unlink(missing_ok=True)
+
+
+def _can_finish(project_dir: Path, record: dict[str, Any]) -> bool:
+    """Whether every rename is either done or still has its staged file.
+
+    A missing staged file only means the rename is done if ``dst`` is there
+    and, when it replaced a file, that file was backed up first; otherwise
+    ``dst`` is still the old file and the staged one was lost.
+    """
+    backups = project_dir / record["staging"] / _BACKUP_DIR
+    for i, op in enumerate(record["renames"]):
+        if (project_dir / op["src"]).exists():
+            continue
+        if not (project_dir / op["dst"]).exists():
+            return False
+        if op["existed"] and not (backups / str(i)).exists():
+            return False
+    return True
+
+
+def _read_journal(path: Path) -> dict[str, Any]:
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"Invalid {JOURNAL_DIR}/{JOURNAL_NAME}: {exc}") from exc
+    if record.get("version") != _JOURNAL_VERSION:
+        raise ValueError(
+            f"Unsupported {JOURNAL_DIR}/{JOURNAL_NAME} version: {record.get('version')}"
+        )
+    return record
+
+
+def recover(project_dir: Path, rollback: bool = False) -> tuple[str, str] | None:
+    """Finish (or with ``rollback``, undo) an interrupted commit.
+
+    A commit is finished when every staged file it still needs is present;
+    otherwise it is rolled back. Returns ``(operation, "finished" | "rolled
+    back")``, or None when there was nothing to recover. Raises
+    ``ValueError`` if the journal cannot be read.
+    """
+    path = journal_path(project_dir)
+    with config_lock(project_dir):
+        if not path.is_file():
+            return None
+        record = _read_journal(path)
+        if rollback or not _can_finish(project_dir, record):
+            _rollback(project_dir, record)
+            outcome = "rolled back"
+        else:
+            session = None
+            if record["changes"] is not None:
+                session = ConfigSession(project_dir)
+                session.replay(record["changes"])
+            _apply(project_dir, record, session)
+            outcome = "finished"
+        shutil.rmtree(project_dir / record["staging"], ignore_errors=True)
+        _discard_journal(path)
+    return record["operation"], outcome
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    if sys.platform == "win32":  # pragma: no cover - no safe liveness probe
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def sweep_stale_files(project_dir: Path) -> int:
+    """Remove staging dirs and temp files left by multikit runs that died.
+
+    Only leftovers whose owning process is gone are removed; a running
+    install's staging dir is left alone, and nothing is removed while a
+    journal still needs its backups. Returns how many were removed.
+    """
+    candidates: list[tuple[Path, str]] = []
+    github_dir = project_dir / ".github"
+    if github_dir.is_dir():
+        candidates += [
+            (p, p.name[len(STAGING_PREFIX) :].split("-", 1)[0])
+            for p in github_dir.glob(f"{STAGING_PREFIX}*")
+        ]
+    # Temp files from atomic_write_bytes: .<name>.<pid>.<hex>.tmp
+    for directory, pattern in (
+        (project_dir, ".multikit.*.tmp"),
+        (project_dir / JOURNAL_DIR, f".{JOURNAL_NAME}.*.tmp"),
+    ):
+        if directory.is_dir():
+            candidates += [(p, p.name.split(".")[-3]) for p in directory.glob(pattern)]
+
+    removed = 0
+    with config_lock(project_dir):
+        if has_pending_journal(project_dir):
+            return 0
+        for path, pid in candidates:
+            if not pid.isdigit() or _pid_alive(int(pid)):
+                continue
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+            removed += 1
+    return removed
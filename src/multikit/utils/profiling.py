@@ -0,0 +1,231 @@
+"""Opt-in hot-path instrumentation behind ``multikit --profile``.
+
+Spans are recorded only while a :class:`Profiler` is active, so the disabled
+path costs one global lookup per instrumented call. Recorded spans feed a
+per-phase breakdown, per-host request latency percentiles and a Chrome
+trace-event file that loads into Perfetto or ``chrome://tracing``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import math
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_active: Profiler | None = None
+
+
+@dataclass
+class Span:
+    """One timed interval, in seconds relative to profiler start."""
+
+    phase: str
+    name: str
+    start: float
+    end: float
+    track: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Profiler:
+    """Collects spans and request latencies for a single CLI run."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._tracks: dict[object, tuple[int, str]] = {}
+        self.spans: list[Span] = []
+        self.requests: dict[str, list[float]] = defaultdict(list)
+        self.finished: float | None = None
+
+    def now(self) -> float:
+        """Seconds since the profiler started."""
+        return time.perf_counter() - self._origin
+
+    def _track(self) -> int:
+        """Small integer id for the current asyncio task (or thread).
+
+        Concurrent downloads overlap in time, so each task gets its own row in
+        the trace instead of stacking unrelated spans on one track.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key: object = task if task is not None else threading.get_ident()
+        with self._lock:
+            entry = self._tracks.get(key)
+            if entry is None:
+                label = (
+                    task.get_name()
+                    if task is not None
+                    else threading.current_thread().name
+                )
+                entry = (len(self._tracks) + 1, label)
+                self._tracks[key] = entry
+        return entry[0]
+
+    def add(self, phase: str, name: str, start: float, end: float, **args: Any) -> None:
+        """Record a span measured by the caller (e.g. an aiohttp trace hook)."""
+        span = Span(phase, name or phase, start, end, self._track(), args)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, phase: str, name: str = "", **args: Any) -> Iterator[None]:
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.add(phase, name, start, self.now(), **args)
+
+    def record_request(self, host: str, seconds: float) -> None:
+        """Record time-to-response-headers for one HTTP attempt."""
+        with self._lock:
+            self.requests[host].append(seconds)
+
+    def finish(self) -> None:
+        self.finished = self.now()
+
+    def phase_totals(self) -> dict[str, tuple[int, float, float]]:
+        """Return ``{phase: (calls, total seconds, max seconds)}``.
+
+        Totals add up overlapping spans, so concurrent phases can exceed the
+        wall-clock time of the run.
+        """
+        totals: dict[str, tuple[int, float, float]] = {}
+        for span in self.spans:
+            calls, total, longest = totals.get(span.phase, (0, 0.0, 0.0))
+            totals[span.phase] = (
+                calls + 1,
+                total + span.duration,
+                max(longest, span.duration),
+            )
+        return dict(sorted(totals.items(), key=lambda item: -item[1][1]))
+
+    def print_report(self, out: TextIO) -> None:
+        """Print the phase breakdown and per-host latency percentiles."""
+        wall = self.finished if self.finished is not None else self.now()
+        print(f"\nProfile: {wall * 1000:.1f} ms wall", file=out)
+        print(f"  {'phase':<12} {'calls':>6} {'total ms':>10} {'max ms':>9}", file=out)
+        for phase, (calls, total, longest) in self.phase_totals().items():
+            print(
+                f"  {phase:<12} {calls:>6} {total * 1000:>10.1f} {longest * 1000:>9.1f}",
+                file=out,
+            )
+
+        if not self.requests:
+            return
+        print("\nRequest latency by host (time to response headers, ms):", file=out)
+        print(
+            f"  {'host':<36} {'n':>4} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}",
+            file=out,
+        )
+        for host, samples in sorted(self.requests.items()):
+            ordered = sorted(samples)
+            p50, p90, p99 = (percentile(ordered, q) * 1000 for q in (50, 90, 99))
+            print(
+                f"  {host:<36} {len(ordered):>4} {p50:>8.1f} {p90:>8.1f} "
+                f"{p99:>8.1f} {ordered[-1] * 1000:>8.1f}",
+                file=out,
+            )
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the spans as a Chrome trace-event JSON object."""
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": track,
+                "args": {"name": label},
+            }
+            for track, label in self._tracks.values()
+        ]
+        events += [
+            {
+                "name": span.name,
+                "cat": span.phase,
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": 1,
+                "tid": span.track,
+                "args": span.args,
+            }
+            for span in sorted(self.spans, key=lambda s: s.start)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def enable() -> Profiler:
+    """Start recording; returns the active profiler."""
+    global _active
+    _active = Profiler()
+    return _active
+
+
+def disable() -> Profiler | None:
+    """Stop recording and return the profiler that was active, if any."""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.finish()
+    return profiler
+
+
+def active() -> Profiler | None:
+    """The running profiler, or None when profiling is off."""
+    return _active
+
+
+@contextmanager
+def span(phase: str, name: str = "", **args: Any) -> Iterator[None]:
+    """Time the enclosed block under ``phase`` when profiling is on."""
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    with profiler.span(phase, name, **args):
+        yield
+
+
+def timed(phase: str) -> Callable[[_F], _F]:
+    """Decorator: record every call of a sync function as a ``phase`` span."""
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(phase, func.__name__):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
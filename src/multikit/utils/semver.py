@@ -0,0 +1,48 @@
+"""Semantic version parsing and precedence (SemVer 2.0.0)."""
+
+from __future__ import annotations
+
+import re
+
+# MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]; a leading "v" is tolerated
+_SEMVER = re.compile(
+    r"^v?(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
+    r"(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
+)
+
+# Sort key: (major, minor, patch, is_release, prerelease identifiers)
+VersionKey = tuple[int, int, int, bool, tuple[tuple[int, int | str], ...]]
+
+
+def parse_version(version: str) -> VersionKey | None:
+    """Return a key ordering ``version`` by SemVer precedence, or None.
+
+    A pre-release sorts before its release, numeric identifiers sort
+    numerically and before alphanumeric ones, and build metadata is
+    ignored, as the spec requires.
+    """
+    match = _SEMVER.match(version.strip())
+    if match is None:
+        return None
+    major, minor, patch, prerelease = match.groups()
+    identifiers: tuple[tuple[int, int | str], ...] = ()
+    if prerelease:
+        identifiers = tuple(
+            (0, int(part)) if part.isdigit() else (1, part)
+            for part in prerelease.split(".")
+        )
+    return (int(major), int(minor), int(patch), not prerelease, identifiers)
+
+
+def is_newer(candidate: str, current: str) -> bool:
+    """Whether ``candidate`` has higher precedence than ``current``.
+
+    Versions that are not valid SemVer cannot be ordered; they count as
+    newer whenever the strings differ, so a registry change is never missed.
+    """
+    candidate_key = parse_version(candidate)
+    current_key = parse_version(current)
+    if candidate_key is None or current_key is None:
+        return candidate.strip() != current.strip()
+    return candidate_key > current_key
@@ -1,11 +1,18 @@
-"""TOML read/write utilities for multikit.toml."""
+"""TOML read/write utilities for multikit.toml and multikit.lock."""
 
 from __future__ import annotations
 
+import os
+import secrets
 import shutil
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
 from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 # Python 3.11+ has tomllib in stdlib
 if sys.version_info >= (3, 11):  # pragma: no cover - runs only on Python 3.11+
@@ -20,7 +27,29 @@ else:
 
 import tomli_w
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
 from multikit.models.config import DEFAULT_REGISTRY_URL, InstalledKit, MultikitConfig
+from multikit.models.lock import LockedKit, Lockfile
+from multikit.utils.profiling import timed
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+LOCKFILE_NAME = "multikit.lock"
+# Per-project scratch directory (config lock, transaction journal); removed
+# again once it is empty
+STATE_DIR = ".multikit"
+# Advisory lock guarding read-modify-write of multikit.toml / multikit.lock
+CONFIG_LOCK_NAME = "lock"
+_LOCKFILE_HEADER = (
+    "# This file is generated by multikit. Do not edit it by hand.\n"
+    "# Run `multikit sync` to reproduce the locked kits.\n\n"
+)
 
 
 def read_toml(path: Path) -> dict:
@@ -30,11 +59,118 @@ def read_toml(path: Path) -> dict:
 
 
 def write_toml(path: Path, data: dict) -> None:
-    """Write a dict to a TOML file."""
-    with open(path, "wb") as f:
-        tomli_w.dump(data, f)
+    """Write a dict to a TOML file atomically."""
+    atomic_write_bytes(path, tomli_w.dumps(data).encode("utf-8"))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file.
+
+    The bytes go to a temp file in the same directory, are fsynced, and the
+    temp file is renamed over ``path`` with ``os.replace``.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    # 0o666 & ~umask, like open(path, "w"); mkstemp would force 0o600
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Per-thread lock depth by project, so nested config_lock() calls don't deadlock
+_held = threading.local()
+
+
+@contextmanager
+def config_lock(project_dir: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on the project's multikit files.
+
+    Wrap every load-modify-save of ``multikit.toml`` / ``multikit.lock`` in
+    this so concurrent multikit processes cannot lose each other's updates.
+    Plain reads need no lock because writes are atomic. Re-entrant within a
+    thread.
+    """
+    key = project_dir.resolve()
+    depths: dict[Path, int] = _held.__dict__.setdefault("depths", {})
+    if depths.get(key):
+        depths[key] += 1
+        try:
+            yield
+        finally:
+            depths[key] -= 1
+        return
+
+    lock_path = key / STATE_DIR / CONFIG_LOCK_NAME
+    f = _open_locked(lock_path)
+    with f:
+        depths[key] = 1
+        try:
+            yield
+        finally:
+            del depths[key]
+            if fcntl is not None:
+                # Unlink while still locked, so no one can lock this inode
+                # and believe they hold the lock; Windows keeps the file
+                lock_path.unlink(missing_ok=True)
+                try:
+                    lock_path.parent.rmdir()
+                except OSError:
+                    pass  # still holds the journal or another holder's lock
+            _unlock_file(f.fileno())
 
 
+def _open_locked(lock_path: Path) -> BinaryIO:
+    """Open ``lock_path`` (creating its directory) and lock it exclusively.
+
+    The previous holder unlinks the file on release, so after waiting for the
+    lock we check that ``lock_path`` is still the file we locked and start
+    over if it is not.
+    """
+    while True:
+        lock_path.parent.mkdir(exist_ok=True)
+        with ExitStack() as stack:
+            try:
+                f = stack.enter_context(open(lock_path, "a+b"))
+            except FileNotFoundError:
+                continue  # directory removed by the releasing holder; recreate it
+            _lock_file(f.fileno())
+            if fcntl is None or _same_file(f, lock_path):
+                stack.pop_all()  # the caller closes it
+                return f
+
+
+def _same_file(f: BinaryIO, path: Path) -> bool:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return False
+    fst = os.fstat(f.fileno())
+    return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
+
+
+def _lock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@timed("config")
 def load_config(project_dir: Path) -> MultikitConfig:
     """Load multikit.toml from project directory.
 
@@ -68,6 +204,7 @@ def load_config(project_dir: Path) -> MultikitConfig:
         version=multikit_data.get("version", "0.1.0"),
         registry_url=multikit_data.get("registry_url", DEFAULT_REGISTRY_URL),
         network=multikit_data.get("network", {}),
+        cache=multikit_data.get("cache", {}),
         kits=kits,
     )
 
@@ -93,6 +230,7 @@ def _backup_corrupted_config(config_path: Path) -> None:
         )
 
 
+@timed("config")
 def save_config(project_dir: Path, config: MultikitConfig) -> None:
     """Write multikit.toml to project directory."""
     config_path = project_dir / "multikit.toml"
@@ -102,6 +240,7 @@ def save_config(project_dir: Path, config: MultikitConfig) -> None:
             "version": config.version,
             "registry_url": config.registry_url,
             "network": config.network.model_dump() if config.network else {},
+            "cache": config.cache.model_dump() if config.cache else {},
         }
     }
 
@@ -116,8 +255,196 @@ def save_config(project_dir: Path, config: MultikitConfig) -> None:
 def create_default_config(project_dir: Path) -> None:
     """Create a default multikit.toml if it doesn't exist."""
     config_path = project_dir / "multikit.toml"
-    if config_path.exists():
-        return
+    with config_lock(project_dir):
+        if config_path.exists():
+            return
+
+        config = MultikitConfig()
+        save_config(project_dir, config)
+
+
+@timed("config")
+def load_lock(project_dir: Path) -> Lockfile | None:
+    """Load multikit.lock from project directory, or None if absent.
+
+    Raises ``ValueError`` when the file exists but cannot be parsed.
+    """
+    lock_path = project_dir / LOCKFILE_NAME
+    if not lock_path.exists():
+        return None
+    try:
+        return Lockfile.model_validate(read_toml(lock_path))
+    except Exception as e:
+        raise ValueError(f"Invalid {LOCKFILE_NAME}: {e}") from e
+
+
+@timed("config")
+def save_lock(project_dir: Path, lock: Lockfile) -> None:
+    """Write multikit.lock to project directory (kits sorted by name)."""
+    data = lock.model_dump()
+    data["kits"] = dict(sorted(data["kits"].items()))
+    lock_path = project_dir / LOCKFILE_NAME
+    atomic_write_bytes(
+        lock_path, (_LOCKFILE_HEADER + tomli_w.dumps(data)).encode("utf-8")
+    )
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    """``(inode, size, mtime_ns)`` of ``path``, or None if it does not exist.
+
+    Every write goes through ``os.replace``, so any change gives a new inode.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class ConfigSession:
+    """One parse of multikit.toml / multikit.lock per command, one write.
+
+    Commands read ``config`` (and ``lock``) from the session instead of
+    calling ``load_config`` per kit, record their changes with
+    :meth:`set_kit` / :meth:`remove_kit`, and :meth:`flush` them once. Used
+    as a context manager the session flushes on exit, also when the command
+    fails part-way, so kits whose files were already written stay recorded.
+
+    ``flush`` holds :func:`config_lock` and only re-reads a file if another
+    process replaced it since the session read it; the pending changes are
+    then merged into the fresh copy.
+    """
+
+    def __init__(self, project_dir: Path) -> None:
+        self.project_dir = project_dir
+        self._config_path = project_dir / "multikit.toml"
+        self._lock_path = project_dir / LOCKFILE_NAME
+        self._config_sig = _file_signature(self._config_path)
+        self._config = load_config(project_dir)
+        self._lock: Lockfile | None = None
+        self._lock_sig: tuple[int, int, int] | None = None
+        self._lock_loaded = False
+        # Pending changes by kit name; None marks a removal
+        self._kits: dict[str, InstalledKit | None] = {}
+        self._locked: dict[str, LockedKit | None] = {}
+
+    @property
+    def config(self) -> MultikitConfig:
+        """The parsed config, including changes not yet flushed."""
+        return self._config
+
+    @property
+    def lock(self) -> Lockfile | None:
+        """The parsed lockfile (loaded on first use), or None if absent.
+
+        Raises ``ValueError`` when the file cannot be parsed.
+        """
+        if not self._lock_loaded:
+            self._lock_sig = _file_signature(self._lock_path)
+            self._lock = load_lock(self.project_dir)
+            self._lock_loaded = True
+        return self._lock
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._kits or self._locked)
+
+    def set_kit(
+        self, name: str, kit: InstalledKit, locked: LockedKit | None = None
+    ) -> None:
+        """Record ``name`` as installed, pinning it in the lockfile if given."""
+        self._config.kits[name] = kit
+        self._kits[name] = kit
+        if locked is not None:
+            self._locked[name] = locked
+
+    def remove_kit(self, name: str) -> None:
+        """Drop ``name`` from both multikit.toml and multikit.lock."""
+        self._config.kits.pop(name, None)
+        self._kits[name] = None
+        self._locked[name] = None
+
+    def changes(self) -> dict[str, dict[str, Any]]:
+        """The pending changes as plain data, for the transaction journal."""
+        return {
+            "kits": {
+                name: kit.model_dump() if kit else None
+                for name, kit in self._kits.items()
+            },
+            "locked": {
+                name: kit.model_dump() if kit else None
+                for name, kit in self._locked.items()
+            },
+        }
+
+    def replay(self, changes: dict[str, dict[str, Any]]) -> None:
+        """Record changes previously returned by :meth:`changes`."""
+        for name, data in changes["kits"].items():
+            if data is None:
+                self._config.kits.pop(name, None)
+                self._kits[name] = None
+            else:
+                self._kits[name] = self._config.kits[name] = InstalledKit(**data)
+        for name, data in changes["locked"].items():
+            self._locked[name] = None if data is None else LockedKit(**data)
+
+    def flush(self) -> None:
+        """Write the pending changes, if any, under the config lock."""
+        if not self.dirty:
+            return
+        with config_lock(self.project_dir):
+            if self._kits:
+                self._flush_config()
+            if self._locked:
+                self._flush_lock()
+
+    def _flush_config(self) -> None:
+        if _file_signature(self._config_path) != self._config_sig:
+            self._config = load_config(self.project_dir)
+        for name, kit in self._kits.items():
+            if kit is None:
+                self._config.kits.pop(name, None)
+            else:
+                self._config.kits[name] = kit
+        self._kits.clear()
+        save_config(self.project_dir, self._config)
+        self._config_sig = _file_signature(self._config_path)
+
+    def _flush_lock(self) -> None:
+        changes, self._locked = self._locked, {}
+        pins = {name: kit for name, kit in changes.items() if kit is not None}
+        if _file_signature(self._lock_path) != self._lock_sig:
+            self._lock_loaded = False
+        try:
+            lock = self.lock
+        except ValueError as exc:
+            # A corrupted lockfile is left for `multikit sync` to report,
+            # unless there are new pins to write
+            if not pins:
+                return
+            print(f"⚠ Rewriting {exc}", file=sys.stderr)
+            lock = None
+        if lock is None:
+            if not pins:
+                return
+            lock = Lockfile()
+
+        removed = [lock.kits.pop(name, None) for name in changes if name not in pins]
+        if not pins and not any(removed):
+            return
+        lock.kits.update(pins)
+        save_lock(self.project_dir, lock)
+        self._lock = lock
+        self._lock_sig = _file_signature(self._lock_path)
+        self._lock_loaded = True
+
+    def __enter__(self) -> Self:
+        return self
 
-    config = MultikitConfig()
-    save_config(project_dir, config)
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.flush()
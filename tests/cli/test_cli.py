@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from multikit.cli import app, default_action
+import json
+from pathlib import Path
+
+from multikit.cli import COMMANDS, app, default_action, launcher
+from multikit.utils import profiling
 
 
 class TestCLIApp:
@@ -15,14 +19,36 @@ class TestCLIApp:
         assert app.name == ("multikit",)
 
     def test_app_has_commands(self) -> None:
-        # Get registered command names (cyclopts uses tuples for names)
-        command_names = [cmd.name for cmd in app._commands.values()]
-        assert ("init",) in command_names
-        assert ("install",) in command_names
-        assert ("uninstall",) in command_names
-        assert ("update",) in command_names
-        assert ("list",) in command_names
-        assert ("diff",) in command_names
+        command_names = list(app)
+        assert "init" in command_names
+        assert "install" in command_names
+        assert "uninstall" in command_names
+        assert "update" in command_names
+        assert "list" in command_names
+        assert "diff" in command_names
+        assert "cache" in command_names
+        assert "sync" in command_names
+        assert "status" in command_names
+        assert "recover" in command_names
+        assert "outdated" in command_names
+
+    def test_commands_resolve_to_named_apps(self) -> None:
+        """Every lazy import path points at an App with a matching name."""
+        for name in (
+            "init",
+            "install",
+            "list",
+            "sync",
+            "status",
+            "recover",
+            "outdated",
+        ):
+            assert app[name].name == (name,)
+
+    def test_static_help_matches_command_apps(self) -> None:
+        """Root help is rendered from COMMANDS; keep it in step with each app."""
+        for name, _module, text in COMMANDS:
+            assert app[name].help == text
 
     def test_default_action_prints_help(self, monkeypatch) -> None:
         called = {"help": False}
@@ -35,3 +61,34 @@ class TestCLIApp:
         default_action()
 
         assert called["help"] is True
+
+
+class TestProfileFlag:
+    """Tests for the global --profile / --profile-trace options."""
+
+    def test_without_profile_runs_command(self, monkeypatch) -> None:
+        seen: list[tuple[str, ...]] = []
+        monkeypatch.setattr(type(app), "__call__", lambda _self, t: seen.append(t))
+
+        launcher("status")
+
+        assert seen == [("status",)]
+        assert profiling.active() is None
+
+    def test_profile_prints_report_and_writes_trace(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        trace_path = initialized_project / "trace.json"
+
+        try:
+            launcher("status", profile=True, profile_trace=trace_path)
+        except SystemExit as exc:
+            assert not exc.code
+
+        err = capsys.readouterr().err
+        assert "Profile:" in err
+        assert "config" in err
+        assert profiling.active() is None
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+        assert any(e.get("cat") == "config" for e in trace["traceEvents"])
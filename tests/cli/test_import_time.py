@@ -0,0 +1,65 @@
+"""Startup regression tests: subcommands must not import what they don't use."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Cumulative import time of multikit.cli, in microseconds. Lazy registration
+# keeps it near cyclopts' own cost (~80 ms); eagerly importing every command
+# (aiohttp, pydantic, questionary, ...) took ~700 ms.
+STARTUP_BUDGET_US = 250_000
+
+HEAVY_MODULES = {"aiohttp", "aiofiles", "questionary", "tabulate"}
+# The root help lists commands only; config handling is not needed either
+ROOT_HELP_EXCLUDED = HEAVY_MODULES | {"pydantic", "tomli_w"}
+
+
+def _importtime(*argv: str) -> dict[str, int]:
+    """Run the CLI under ``-X importtime``; return {module: cumulative µs}."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "multikit", *argv],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = (part.strip() for part in line.split("|", 2))
+        times[module] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """``python -X importtime`` checks for the CLI startup path."""
+
+    def test_version_skips_command_modules(self) -> None:
+        times = _importtime("--version")
+        assert not any(m.startswith("multikit.commands") for m in times)
+        assert not HEAVY_MODULES & times.keys()
+
+    @pytest.mark.parametrize("argv", [("--help",), ("-h",), ()])
+    def test_root_help_skips_command_modules(self, argv: tuple[str, ...]) -> None:
+        times = _importtime(*argv)
+        assert not any(m.startswith("multikit.commands") for m in times)
+        assert not ROOT_HELP_EXCLUDED & times.keys()
+
+    @pytest.mark.parametrize("command", ["init", "status", "cache"])
+    def test_offline_commands_skip_network_stack(self, command: str) -> None:
+        times = _importtime(command, "--help")
+        assert not HEAVY_MODULES & times.keys()
+
+    def test_cli_startup_budget(self) -> None:
+        times = _importtime("--version")
+        assert times["multikit.cli"] < STARTUP_BUDGET_US
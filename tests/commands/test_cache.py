@@ -0,0 +1,74 @@
+"""Tests for multikit cache command group."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from multikit.commands.cache import clear, info, prune
+from multikit.registry.cache import BlobCache
+
+
+class TestCacheCommand:
+    """Tests for cache info/prune/clear."""
+
+    def test_info(self, isolated_cache_dir: Path, tmp_path: Path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        BlobCache().store("https://example.com/a", b"x" * 2048)
+
+        info()
+
+        out = capsys.readouterr().out
+        assert str(isolated_cache_dir) in out
+        assert "Blobs: 1" in out
+        assert "2.0 KiB / 256.0 MiB" in out
+
+    def test_prune_to_size(self, tmp_path: Path, monkeypatch, capsys) -> None:
+        monkeypatch.chdir(tmp_path)
+        cache = BlobCache()
+        cache.put_blob(b"a" * 10)
+        cache.put_blob(b"b" * 10)
+
+        prune(max_size_mb=0)
+
+        assert "Pruned 2 blob(s), freed 20 B" in capsys.readouterr().out
+        assert cache.info().blob_count == 0
+
+    def test_clear(self, tmp_path: Path, monkeypatch, capsys) -> None:
+        monkeypatch.chdir(tmp_path)
+        cache = BlobCache()
+        cache.put_blob(b"data")
+
+        clear()
+
+        assert "Cleared cache" in capsys.readouterr().out
+        assert cache.info().blob_count == 0
+
+    def test_uses_project_cache_config(self, tmp_path: Path, monkeypatch, capsys):
+        from multikit.models.config import CacheConfig, MultikitConfig
+        from multikit.utils.toml_io import save_config
+
+        monkeypatch.chdir(tmp_path)
+        config = MultikitConfig(
+            cache=CacheConfig(enabled=False, max_size_mb=1, link="hardlink")
+        )
+        save_config(tmp_path, config)
+
+        info()
+
+        out = capsys.readouterr().out
+        assert "0 B / 1.0 MiB" in out
+        assert "Link mode: hardlink" in out
+
+    def test_invalid_config_exits_one(self, tmp_path: Path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "multikit.toml").write_text(
+            "[multikit.cache]\nmax_size_mb = -1\n", encoding="utf-8"
+        )
+
+        with pytest.raises(SystemExit) as exc_info:
+            info()
+
+        assert exc_info.value.code == 1
+        assert "Config corrupted" in capsys.readouterr().err
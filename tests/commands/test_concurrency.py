@@ -23,7 +23,15 @@ class TestConcurrentInstalls:
         save_config(initialized_project, MultikitConfig())
 
         # create fake install that sleeps before writing
-        async def fake_install(kit_name, project_dir, github_dir, registry_url, force):
+        async def fake_install(
+            kit_name,
+            project_dir,
+            github_dir,
+            registry_url,
+            force,
+            client=None,
+            session=None,
+        ):
             # simulate some work
             await asyncio.sleep(0.01)
             config = load_config(project_dir)
@@ -90,12 +90,8 @@ class TestDiffCommand:
         prompts_dir = initialized_project / ".github" / "prompts"
         agents_dir.mkdir(parents=True, exist_ok=True)
         prompts_dir.mkdir(parents=True, exist_ok=True)
-        (agents_dir / "testkit.design.agent.md").write_text(
-            content, encoding="utf-8"
-        )
-        (prompts_dir / "testkit.design.prompt.md").write_text(
-            content, encoding="utf-8"
-        )
+        (agents_dir / "testkit.design.agent.md").write_text(content, encoding="utf-8")
+        (prompts_dir / "testkit.design.prompt.md").write_text(content, encoding="utf-8")
 
         config = MultikitConfig(
             kits={
@@ -113,12 +109,8 @@ class TestDiffCommand:
         m = aioresponses()
         with m:
             m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
-            m.get(
-                f"{BASE_URL}/testkit/agents/testkit.design.agent.md", body=content
-            )
-            m.get(
-                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md", body=content
-            )
+            m.get(f"{BASE_URL}/testkit/agents/testkit.design.agent.md", body=content)
+            m.get(f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md", body=content)
 
             await diff_handler("testkit")
 
@@ -437,7 +429,18 @@ class TestDiffInteractive:
             lambda _config, action="diff": ["testkit"],
         )
 
-        async def fake_diff(_name, _project_dir, _github_dir):
+        async def fake_diff(
+            _name,
+            _project_dir,
+            _github_dir,
+            client=None,
+            session=None,
+            output="patch",
+            semaphore=None,
+            out=None,
+            err=None,
+            strict=False,
+        ):
             return False
 
         monkeypatch.setattr("multikit.commands.diff._diff_single_kit", fake_diff)
@@ -456,7 +459,18 @@ class TestDiffInteractive:
             lambda _config, action="diff": ["testkit"],
         )
 
-        async def fake_diff(_name, _project_dir, _github_dir):
+        async def fake_diff(
+            _name,
+            _project_dir,
+            _github_dir,
+            client=None,
+            session=None,
+            output="patch",
+            semaphore=None,
+            out=None,
+            err=None,
+            strict=False,
+        ):
             return True
 
         monkeypatch.setattr("multikit.commands.diff._diff_single_kit", fake_diff)
@@ -575,7 +589,7 @@ class TestDiffNetworkErrors:
         )
         save_config(initialized_project, config)
 
-        async def _raise_403(_url, _kit):
+        async def _raise_403(_url, _kit, client=None):
             raise aiohttp.ClientResponseError(
                 request_info=mock.Mock(),
                 history=(),
@@ -604,7 +618,7 @@ class TestDiffNetworkErrors:
         )
         save_config(initialized_project, config)
 
-        async def _raise_client_error(_url, _kit):
+        async def _raise_client_error(_url, _kit, client=None):
             raise aiohttp.ClientError("Connection reset by peer")
 
         monkeypatch.setattr(
@@ -651,12 +665,14 @@ class TestDiffNetworkErrors:
 
         from multikit.models.kit import Manifest
 
-        async def _mock_manifest(_url, _kit):
+        async def _mock_manifest(_url, _kit, client=None):
             return Manifest(**SAMPLE_MANIFEST)
 
         call_count = 0
 
-        async def _raise_on_file(_url, _kit, _subdir, _filename):
+        async def _raise_on_file(
+            _url, _kit, _subdir, _filename, client=None, sha256=None
+        ):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -709,12 +725,14 @@ class TestDiffNetworkErrors:
 
         from multikit.models.kit import Manifest
 
-        async def _mock_manifest(_url, _kit):
+        async def _mock_manifest(_url, _kit, client=None):
             return Manifest(**SAMPLE_MANIFEST)
 
         call_count = 0
 
-        async def _raise_on_file(_url, _kit, _subdir, _filename):
+        async def _raise_on_file(
+            _url, _kit, _subdir, _filename, client=None, sha256=None
+        ):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -733,14 +751,14 @@ class TestDiffNetworkErrors:
     async def test_diff_handler_config_load_exception(
         self, initialized_project: Path, monkeypatch, capsys
     ) -> None:
-        """D05: Handler-level load_config raises unexpected Exception."""
+        """D05: Handler-level load_config raises a validation error."""
         monkeypatch.chdir(initialized_project)
 
         def _raise_validation_error(_path):
-            raise RuntimeError("Pydantic validation failed")
+            InstalledKit.model_validate({"version": "1.0.0", "files": 5})
 
         monkeypatch.setattr(
-            "multikit.commands.diff.load_config", _raise_validation_error
+            "multikit.utils.toml_io.load_config", _raise_validation_error
         )
 
         with pytest.raises(SystemExit) as exc_info:
@@ -749,3 +767,401 @@ class TestDiffNetworkErrors:
 
         captured = capsys.readouterr()
         assert "Config corrupted" in captured.err
+
+
+class TestDiffConcurrentHashFirst:
+    """Files are fetched concurrently, hash matches skip the fetch entirely."""
+
+    @staticmethod
+    def _install(project: Path, agents: list[str]) -> None:
+        agents_dir = project / ".github" / "agents"
+        agents_dir.mkdir(parents=True, exist_ok=True)
+        for name in agents:
+            (agents_dir / name).write_text(f"local {name}\n", encoding="utf-8")
+        save_config(
+            project,
+            MultikitConfig(
+                kits={
+                    "testkit": InstalledKit(
+                        version="1.0.0", files=[f"agents/{n}" for n in agents]
+                    )
+                }
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_output_follows_manifest_order(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        import asyncio
+
+        from multikit.models.kit import Manifest
+
+        names = [f"kit{i}.agent.md" for i in range(4)]
+        self._install(initialized_project, names)
+        monkeypatch.chdir(initialized_project)
+        in_flight = peak = 0
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return Manifest(name="testkit", version="1.0.0", agents=names)
+
+        async def _slow_fetch(_url, _kit, _subdir, filename, client=None, sha256=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier files finish last
+            await asyncio.sleep(0.01 * (len(names) - names.index(filename)))
+            in_flight -= 1
+            return f"remote {filename}\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _slow_fetch)
+
+        with pytest.raises(SystemExit):
+            await diff_handler("testkit")
+
+        out = capsys.readouterr().out
+        positions = [out.index(f"local/{name}") for name in names]
+        assert positions == sorted(positions)
+        assert peak == len(names)
+        assert "4 file(s) changed, 0 unchanged" in out
+
+    @pytest.mark.asyncio
+    async def test_matching_hash_is_not_fetched(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        import hashlib
+
+        from multikit.models.kit import Manifest
+
+        names = ["same.agent.md", "edited.agent.md"]
+        self._install(initialized_project, names)
+        monkeypatch.chdir(initialized_project)
+        same = b"local same.agent.md\n"
+        manifest = Manifest(
+            name="testkit",
+            version="1.0.0",
+            agents=names,
+            hashes={
+                "agents/same.agent.md": hashlib.sha256(same).hexdigest(),
+                "agents/edited.agent.md": hashlib.sha256(b"remote\n").hexdigest(),
+            },
+        )
+        fetched: list[str] = []
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return manifest
+
+        async def _fetch(_url, _kit, _subdir, filename, client=None, sha256=None):
+            fetched.append(filename)
+            return "remote\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _fetch)
+
+        with pytest.raises(SystemExit):
+            await diff_handler("testkit")
+
+        assert fetched == ["edited.agent.md"]
+        assert "1 file(s) changed, 1 unchanged" in capsys.readouterr().out
+
+
+class TestDiffOutputModes:
+    """--stat, --name-only and --json never build hunks."""
+
+    @pytest.fixture
+    def drifted(self, initialized_project: Path, monkeypatch) -> list[str]:
+        """Agent unchanged, prompt edited, second agent missing."""
+        import hashlib
+
+        from multikit.models.kit import Manifest
+
+        github_dir = initialized_project / ".github"
+        (github_dir / "agents" / "a.agent.md").write_text("same\n", encoding="utf-8")
+        (github_dir / "prompts" / "p.prompt.md").write_text(
+            "one\ntwo\n", encoding="utf-8"
+        )
+        save_config(
+            initialized_project,
+            MultikitConfig(
+                kits={
+                    "testkit": InstalledKit(
+                        version="1.0.0",
+                        files=[
+                            "agents/a.agent.md",
+                            "agents/b.agent.md",
+                            "prompts/p.prompt.md",
+                        ],
+                    )
+                }
+            ),
+        )
+        remote = {
+            "a.agent.md": "same\n",
+            "b.agent.md": "b\n",
+            "p.prompt.md": "one\nTWO\nthree\n",
+        }
+        manifest = Manifest(
+            name="testkit",
+            version="1.0.0",
+            agents=["a.agent.md", "b.agent.md"],
+            prompts=["p.prompt.md"],
+            hashes={
+                f"{'prompts' if name.endswith('prompt.md') else 'agents'}/{name}": (
+                    hashlib.sha256(body.encode()).hexdigest()
+                )
+                for name, body in remote.items()
+            },
+        )
+        fetched: list[str] = []
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return manifest
+
+        async def _fetch(_url, _kit, _subdir, filename, client=None, sha256=None):
+            fetched.append(filename)
+            return remote[filename]
+
+        def _no_hunks(*_args, **_kwargs):
+            raise AssertionError("hunks were generated")
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _fetch)
+        monkeypatch.setattr("multikit.commands.diff.generate_diff", _no_hunks)
+        monkeypatch.chdir(initialized_project)
+        return fetched
+
+    @pytest.mark.asyncio
+    async def test_name_only(self, drifted: list[str], capsys) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            await diff_handler("testkit", name_only=True)
+        assert exc_info.value.code == 1
+        assert capsys.readouterr().out.splitlines() == [
+            ".github/agents/b.agent.md",
+            ".github/prompts/p.prompt.md",
+        ]
+        # Published hashes already tell which files differ
+        assert drifted == []
+
+    @pytest.mark.asyncio
+    async def test_stat(self, drifted: list[str], capsys) -> None:
+        with pytest.raises(SystemExit):
+            await diff_handler("testkit", stat=True)
+        out = capsys.readouterr().out
+        assert " .github/agents/b.agent.md   | missing" in out
+        assert " .github/prompts/p.prompt.md |    3 ++-" in out
+        assert "2 file(s) changed, 2 insertion(s)(+), 1 deletion(s)(-)" in out
+        assert drifted == ["p.prompt.md"]
+
+    @pytest.mark.asyncio
+    async def test_json_lines(self, drifted: list[str], capsys) -> None:
+        import json
+
+        with pytest.raises(SystemExit):
+            await diff_handler("testkit", json_output=True)
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(r["path"], r["status"]) for r in records] == [
+            (".github/agents/a.agent.md", "unchanged"),
+            (".github/agents/b.agent.md", "missing"),
+            (".github/prompts/p.prompt.md", "modified"),
+        ]
+        assert records[2]["insertions"] == 2
+        assert records[2]["deletions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_modes_are_exclusive(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with pytest.raises(SystemExit) as exc_info:
+            await diff_handler("testkit", stat=True, json_output=True)
+        assert exc_info.value.code == 1
+        assert "mutually exclusive" in capsys.readouterr().err
+
+
+class TestDiffAll:
+    """--all diffs every installed kit concurrently, reports in kit order."""
+
+    KITS = ["alpha", "beta", "gamma"]
+
+    @pytest.fixture
+    def kits(self, initialized_project: Path, monkeypatch) -> dict[str, int]:
+        """Three one-agent kits; beta is clean, the others have drifted."""
+        import asyncio
+
+        from multikit.models.kit import Manifest
+
+        agents_dir = initialized_project / ".github" / "agents"
+        for name in self.KITS:
+            (agents_dir / f"{name}.agent.md").write_text(
+                f"local {name}\n", encoding="utf-8"
+            )
+        config = MultikitConfig(
+            kits={
+                name: InstalledKit(version="1.0.0", files=[f"agents/{name}.agent.md"])
+                for name in self.KITS
+            }
+        )
+        config.network.max_concurrency = 2
+        save_config(initialized_project, config)
+        stats = {"in_flight": 0, "peak": 0}
+
+        async def _mock_manifest(_url, kit, client=None):
+            return Manifest(name=kit, version="1.0.0", agents=[f"{kit}.agent.md"])
+
+        async def _fetch(_url, kit, _subdir, filename, client=None, sha256=None):
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+            # Earlier kits finish last
+            await asyncio.sleep(0.01 * (len(self.KITS) - self.KITS.index(kit)))
+            stats["in_flight"] -= 1
+            return f"local {kit}\n" if kit == "beta" else f"remote {kit}\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _fetch)
+        monkeypatch.chdir(initialized_project)
+        return stats
+
+    @pytest.mark.asyncio
+    async def test_reports_in_kit_order_with_summary(
+        self, kits: dict[str, int], capsys
+    ) -> None:
+        with pytest.raises(SystemExit) as exc_info:
+            await diff_handler(all_kits=True)
+        assert exc_info.value.code == 1
+
+        captured = capsys.readouterr()
+        positions = [captured.out.index(f"Comparing {name} ") for name in self.KITS]
+        assert positions == sorted(positions)
+        assert "✓ No changes detected for beta" in captured.out
+        assert "2 of 3 kit(s) differ or failed: alpha, gamma" in captured.err
+        # Kits share one semaphore sized by network.max_concurrency
+        assert kits["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_json_records_stay_grouped_by_kit(
+        self, kits: dict[str, int], capsys
+    ) -> None:
+        import json
+
+        with pytest.raises(SystemExit):
+            await diff_handler(all_kits=True, json_output=True)
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(r["kit"], r["status"]) for r in records] == [
+            ("alpha", "modified"),
+            ("beta", "unchanged"),
+            ("gamma", "modified"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_first_kit_prints_before_it_finishes(
+        self, kits: dict[str, int], monkeypatch, capsys
+    ) -> None:
+        seen: list[str] = []
+
+        async def _fetch(_url, kit, _subdir, _filename, client=None, sha256=None):
+            if kit == "alpha":
+                seen.append(capsys.readouterr().out)
+            return f"remote {kit}\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _fetch)
+
+        with pytest.raises(SystemExit):
+            await diff_handler(all_kits=True)
+        assert "Comparing alpha " in seen[0]
+
+    @pytest.mark.asyncio
+    async def test_json_records_stream_within_a_kit(
+        self, kits: dict[str, int], initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        import asyncio
+        import json
+
+        from multikit.models.kit import Manifest
+
+        (initialized_project / ".github" / "agents" / "alpha2.agent.md").write_text(
+            "local alpha2\n", encoding="utf-8"
+        )
+        seen: list[str] = []
+
+        async def _mock_manifest(_url, kit, client=None):
+            agents = [f"{kit}.agent.md"]
+            if kit == "alpha":
+                agents.append("alpha2.agent.md")
+            return Manifest(name=kit, version="1.0.0", agents=agents)
+
+        async def _fetch(_url, kit, _subdir, filename, client=None, sha256=None):
+            if filename == "alpha2.agent.md":
+                await asyncio.sleep(0.05)
+                seen.append(capsys.readouterr().out)
+            return f"remote {kit}\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _fetch)
+
+        with pytest.raises(SystemExit):
+            await diff_handler(all_kits=True, json_output=True)
+        first = [json.loads(line) for line in seen[0].splitlines()]
+        assert [(r["kit"], r["path"]) for r in first] == [
+            ("alpha", ".github/agents/alpha.agent.md")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_all_clean_exits_zero(
+        self, kits: dict[str, int], monkeypatch, capsys
+    ) -> None:
+        async def _same(_url, kit, _subdir, _filename, client=None, sha256=None):
+            return f"local {kit}\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _same)
+
+        await diff_handler(all_kits=True)
+        assert "✓ All 3 kit(s) match the registry" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_counts_as_failure(
+        self, kits: dict[str, int], monkeypatch, capsys
+    ) -> None:
+        async def _gamma_fails(_url, kit, _subdir, _filename, client=None, sha256=None):
+            if kit == "gamma":
+                raise aiohttp.ClientError("connection reset")
+            return f"local {kit}\n"
+
+        monkeypatch.setattr("multikit.commands.diff.fetch_file", _gamma_fails)
+
+        with pytest.raises(SystemExit) as exc_info:
+            await diff_handler(all_kits=True)
+        assert exc_info.value.code == 1
+
+        captured = capsys.readouterr()
+        assert "✗ 1 file(s) could not be compared, 0 changed, 0 unchanged" in (
+            captured.out
+        )
+        assert "1 of 3 kit(s) differ or failed: gamma" in captured.err
+
+    @pytest.mark.asyncio
+    async def test_never_prompts(self, kits: dict[str, int], monkeypatch) -> None:
+        def _prompt(*_args, **_kwargs):
+            raise AssertionError("prompted")
+
+        monkeypatch.setattr("multikit.commands.diff.select_installed_kits", _prompt)
+        with pytest.raises(SystemExit):
+            await diff_handler(all_kits=True)
+
+    @pytest.mark.asyncio
+    async def test_no_kits_installed(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        await diff_handler(all_kits=True)
+        assert "No kits installed." in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_rejects_kit_name(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with pytest.raises(SystemExit) as exc_info:
+            await diff_handler("testkit", all_kits=True)
+        assert exc_info.value.code == 1
+        assert "--all" in capsys.readouterr().err
@@ -26,6 +26,15 @@ AGENT_CONTENT = "# Test Agent\nSample agent content.\n"
 PROMPT_CONTENT = "# Test Prompt\nSample prompt content.\n"
 
 
+def _write(dest: Path, content: str) -> str:
+    """Stand-in for a streamed download: write ``dest``, return its sha256."""
+    import hashlib
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_text(content, encoding="utf-8")
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 class TestInstallCommandFresh:
     """Tests for fresh kit installation."""
 
@@ -475,17 +484,28 @@ class TestInstallCommandConflicts:
                 body=PROMPT_CONTENT,
             )
 
-            def _raise_runtime(*_args, **_kwargs):
-                raise RuntimeError("boom")
+            import multikit.utils.journal as journal
 
-            monkeypatch.setattr(
-                "multikit.commands.install.move_staged_files", _raise_runtime
-            )
+            real_commit = journal.commit_file
+            moved: list[Path] = []
+
+            def _fail_second(src: Path, dst: Path) -> None:
+                if moved:
+                    raise RuntimeError("boom")
+                real_commit(src, dst)
+                moved.append(dst)
+
+            monkeypatch.setattr(journal, "commit_file", _fail_second)
 
             with pytest.raises(SystemExit) as exc_info:
                 await install_handler("testkit")
             assert exc_info.value.code == 1
 
+        # The file moved before the failure is rolled back with the rest
+        assert len(moved) == 1 and not moved[0].exists()
+        assert not load_config(initialized_project).is_installed("testkit")
+        assert not (initialized_project / ".multikit" / "journal").exists()
+
 
 class TestInstallCommandInteractive:
     """Tests for install interactive flow branches."""
@@ -497,7 +517,7 @@ class TestInstallCommandInteractive:
         """Interactive install exits when registry cannot be fetched."""
         monkeypatch.chdir(initialized_project)
 
-        async def _raise_registry(_url: str):
+        async def _raise_registry(_url: str, client=None):
             raise RuntimeError("registry unavailable")
 
         monkeypatch.setattr("multikit.commands.install.fetch_registry", _raise_registry)
@@ -515,7 +535,7 @@ class TestInstallCommandInteractive:
 
         from multikit.models.kit import Registry
 
-        async def fake_fetch_registry(_url):
+        async def fake_fetch_registry(_url, client=None):
             return Registry(kits=[])
 
         monkeypatch.setattr(
@@ -539,7 +559,7 @@ class TestInstallCommandInteractive:
 
         from multikit.models.kit import Registry
 
-        async def fake_fetch_registry(_url):
+        async def fake_fetch_registry(_url, client=None):
             return Registry(kits=[])
 
         monkeypatch.setattr(
@@ -550,17 +570,39 @@ class TestInstallCommandInteractive:
             lambda _config, _registry: ["ok-kit", "bad-kit"],
         )
 
-        async def _fake_install(name: str, *_args, **_kwargs) -> bool:
-            return name != "bad-kit"
+        async def _fake_install(names: list[str], *_args, **_kwargs) -> list[str]:
+            return [name for name in names if name == "bad-kit"]
 
-        monkeypatch.setattr(
-            "multikit.commands.install._install_single_kit", _fake_install
-        )
+        monkeypatch.setattr("multikit.commands.install._install_kits", _fake_install)
 
         with pytest.raises(SystemExit) as exc_info:
             await install_handler()
         assert exc_info.value.code == 1
 
+    @pytest.mark.asyncio
+    async def test_install_interactive_prompts_from_cached_registry(
+        self, initialized_project: Path, monkeypatch, sample_registry: dict
+    ) -> None:
+        """The prompt lists the cached registry; --refresh fetches it first."""
+        monkeypatch.chdir(initialized_project)
+        offered: list[list[str]] = []
+
+        def _select(_config, registry) -> list[str]:
+            offered.append([kit.name for kit in registry.kits])
+            return []
+
+        monkeypatch.setattr(
+            "multikit.commands.install.select_installable_kits", _select
+        )
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=sample_registry)
+            m.get(f"{BASE_URL}/registry.json", payload={"kits": []})
+            for refresh in (False, False, True):
+                with pytest.raises(SystemExit):
+                    await install_handler(refresh=refresh)
+
+        assert offered == [["testkit", "gitkit"], ["testkit", "gitkit"], []]
+
 
 class TestInstallWrapperFunction:
     """Tests for the sync wrapper function install_handler."""
@@ -613,7 +655,15 @@ class TestInstallWrapperFunction:
 
         call_args = {}
 
-        async def mock_install(kit_name, project_dir, github_dir, registry_url, force):
+        async def mock_install(
+            kit_name,
+            project_dir,
+            github_dir,
+            registry_url,
+            force,
+            client=None,
+            session=None,
+        ):
             call_args["force"] = force
             return True
 
@@ -634,7 +684,15 @@ class TestInstallWrapperFunction:
 
         call_args = {}
 
-        async def mock_install(kit_name, project_dir, github_dir, registry_url, force):
+        async def mock_install(
+            kit_name,
+            project_dir,
+            github_dir,
+            registry_url,
+            force,
+            client=None,
+            session=None,
+        ):
             call_args["registry_url"] = registry_url
             return True
 
@@ -744,7 +802,7 @@ class TestInstallNetworkErrors:
         """I01: Manifest fetch raises generic ClientError."""
         monkeypatch.chdir(initialized_project)
 
-        async def _raise_client_error(_url, _kit):
+        async def _raise_client_error(_url, _kit, client=None):
             raise aiohttp.ClientError("Connection reset")
 
         monkeypatch.setattr(
@@ -767,10 +825,12 @@ class TestInstallNetworkErrors:
 
         from multikit.models.kit import Manifest
 
-        async def _mock_manifest(_url, _kit):
+        async def _mock_manifest(_url, _kit, client=None):
             return Manifest(**SAMPLE_MANIFEST)
 
-        async def _raise_403(_url, _kit, _subdir, _filename):
+        async def _raise_403(
+            _url, _kit, _subdir, _filename, _dest, client=None, sha256=None
+        ):
             raise aiohttp.ClientResponseError(
                 request_info=mock.Mock(),
                 history=(),
@@ -779,7 +839,7 @@ class TestInstallNetworkErrors:
             )
 
         monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
-        monkeypatch.setattr("multikit.commands.install.fetch_file", _raise_403)
+        monkeypatch.setattr("multikit.commands.install.download_file", _raise_403)
 
         with pytest.raises(SystemExit) as exc_info:
             await install_handler("testkit")
@@ -797,14 +857,18 @@ class TestInstallNetworkErrors:
 
         from multikit.models.kit import Manifest
 
-        async def _mock_manifest(_url, _kit):
+        async def _mock_manifest(_url, _kit, client=None):
             return Manifest(**SAMPLE_MANIFEST)
 
-        async def _raise_client_error(_url, _kit, _subdir, _filename):
+        async def _raise_client_error(
+            _url, _kit, _subdir, _filename, _dest, client=None, sha256=None
+        ):
             raise aiohttp.ClientError("Connection timeout")
 
         monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
-        monkeypatch.setattr("multikit.commands.install.fetch_file", _raise_client_error)
+        monkeypatch.setattr(
+            "multikit.commands.install.download_file", _raise_client_error
+        )
 
         with pytest.raises(SystemExit) as exc_info:
             await install_handler("testkit")
@@ -1070,3 +1134,668 @@ class TestInstallSkipAllNewFiles:
         assert "agents/testkit.help.agent.md" in kit.files
         assert "prompts/testkit.design.prompt.md" in kit.files
         assert "prompts/testkit.coverage.prompt.md" in kit.files
+
+
+class TestInstallConcurrentDownloads:
+    """Tests for concurrent file downloads during install."""
+
+    @pytest.mark.asyncio
+    async def test_downloads_run_concurrently_within_limit(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Agents, prompts and templates overlap, bounded by max_concurrency."""
+        import asyncio
+
+        from multikit.models.config import MultikitConfig, NetworkConfig
+        from multikit.models.kit import Manifest
+        from multikit.utils.toml_io import save_config
+
+        monkeypatch.chdir(initialized_project)
+        save_config(
+            initialized_project,
+            MultikitConfig(network=NetworkConfig(max_concurrency=2)),
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return Manifest(**SAMPLE_MANIFEST_WITH_TEMPLATES)
+
+        async def _slow_fetch(
+            _url, _kit, subdir, filename, dest, client=None, sha256=None
+        ):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _write(dest, f"{subdir}/{filename}\n")
+
+        monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.install.download_file", _slow_fetch)
+
+        await install_handler("cikit")
+
+        assert peak == 2
+        agent_file = initialized_project / ".github" / "agents" / "cikit.help.agent.md"
+        assert agent_file.read_text(encoding="utf-8") == "agents/cikit.help.agent.md\n"
+        template_file = initialized_project / ".github" / "readme-governance.md"
+        assert template_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_first_failure_in_manifest_order_is_reported(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """A template failure is still reported per file and nothing is installed."""
+        from multikit.models.kit import Manifest
+
+        monkeypatch.chdir(initialized_project)
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return Manifest(**SAMPLE_MANIFEST_WITH_TEMPLATES)
+
+        async def _fetch(_url, _kit, subdir, filename, dest, client=None, sha256=None):
+            if subdir.startswith("templates/"):
+                raise aiohttp.ClientResponseError(
+                    request_info=mock.Mock(), history=(), status=404
+                )
+            return _write(dest, "content\n")
+
+        monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.install.download_file", _fetch)
+
+        with pytest.raises(SystemExit) as exc_info:
+            await install_handler("cikit")
+        assert exc_info.value.code == 1
+
+        captured = capsys.readouterr()
+        assert (
+            "File not found: templates/cikit.governance.readme/"
+            "readme-governance.template.md"
+        ) in captured.err
+        agent_file = initialized_project / ".github" / "agents" / "cikit.help.agent.md"
+        assert not agent_file.exists()
+
+
+class TestInstallHashSkip:
+    """Files whose local copy matches the manifest sha256 are not downloaded."""
+
+    @pytest.mark.asyncio
+    async def test_matching_local_file_is_not_fetched(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Only the file whose hash differs goes over the wire."""
+        import hashlib
+
+        from multikit.models.kit import Manifest
+
+        monkeypatch.chdir(initialized_project)
+        agents_dir = initialized_project / ".github" / "agents"
+        agents_dir.mkdir(parents=True, exist_ok=True)
+        (agents_dir / "testkit.design.agent.md").write_text(
+            AGENT_CONTENT, encoding="utf-8"
+        )
+
+        manifest = Manifest(
+            **SAMPLE_MANIFEST,
+            hashes={
+                "agents/testkit.design.agent.md": hashlib.sha256(
+                    AGENT_CONTENT.encode("utf-8")
+                ).hexdigest(),
+                "prompts/testkit.design.prompt.md": hashlib.sha256(
+                    PROMPT_CONTENT.encode("utf-8")
+                ).hexdigest(),
+            },
+        )
+        fetched: list[tuple[str, str, str | None]] = []
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return manifest
+
+        async def _fetch(_url, _kit, subdir, filename, dest, client=None, sha256=None):
+            fetched.append((subdir, filename, sha256))
+            return _write(dest, PROMPT_CONTENT)
+
+        monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.install.download_file", _fetch)
+
+        await install_handler("testkit")
+
+        assert fetched == [
+            (
+                "prompts",
+                "testkit.design.prompt.md",
+                manifest.file_hash("prompts", "testkit.design.prompt.md"),
+            )
+        ]
+        prompt_file = initialized_project / ".github" / "prompts"
+        assert (prompt_file / "testkit.design.prompt.md").read_text(
+            encoding="utf-8"
+        ) == PROMPT_CONTENT
+        config = load_config(initialized_project)
+        assert config.is_installed("testkit")
+
+    @pytest.mark.asyncio
+    async def test_downloaded_files_are_not_hashed_again(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """The digest verified while downloading is the one recorded."""
+        import hashlib
+
+        from multikit.models.kit import Manifest
+
+        monkeypatch.chdir(initialized_project)
+        contents = {
+            "agents/testkit.design.agent.md": AGENT_CONTENT,
+            "prompts/testkit.design.prompt.md": PROMPT_CONTENT,
+        }
+        hashes = {
+            path: hashlib.sha256(text.encode("utf-8")).hexdigest()
+            for path, text in contents.items()
+        }
+        manifest = Manifest(**SAMPLE_MANIFEST, hashes=hashes)
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return manifest
+
+        async def _fetch(_url, _kit, subdir, filename, dest, client=None, sha256=None):
+            return _write(dest, contents[f"{subdir}/{filename}"])
+
+        def _no_rehash(path):
+            raise AssertionError(f"re-hashed {path}")
+
+        monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.install.download_file", _fetch)
+        monkeypatch.setattr("multikit.commands.install.file_sha256", _no_rehash)
+
+        await install_handler("testkit")
+
+        kit = load_config(initialized_project).get_kit("testkit")
+        assert kit is not None
+        assert kit.hashes == hashes
+
+    @pytest.mark.asyncio
+    async def test_kept_template_is_not_fetched(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """An existing template dest with overwrite=False is never downloaded."""
+        from multikit.models.kit import Manifest
+
+        monkeypatch.chdir(initialized_project)
+        existing = initialized_project / ".github" / "readme-governance.md"
+        existing.parent.mkdir(parents=True, exist_ok=True)
+        existing.write_text("local edits\n", encoding="utf-8")
+        fetched: list[str] = []
+
+        async def _mock_manifest(_url, _kit, client=None):
+            return Manifest(**SAMPLE_MANIFEST_WITH_TEMPLATES)
+
+        async def _fetch(_url, _kit, subdir, filename, dest, client=None, sha256=None):
+            fetched.append(subdir)
+            return _write(dest, "content\n")
+
+        monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.install.download_file", _fetch)
+
+        await install_handler("cikit")
+
+        assert not any(subdir.startswith("templates/") for subdir in fetched)
+        assert existing.read_text(encoding="utf-8") == "local edits\n"
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_aborts_install(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """A download that fails sha256 verification installs nothing."""
+        from multikit.models.kit import Manifest
+
+        monkeypatch.chdir(initialized_project)
+        manifest = Manifest(
+            **SAMPLE_MANIFEST,
+            hashes={"agents/testkit.design.agent.md": "0" * 64},
+        )
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=manifest.model_dump())
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            with pytest.raises(SystemExit) as exc_info:
+                await install_handler("testkit")
+
+        assert exc_info.value.code == 1
+        assert "sha256 mismatch" in capsys.readouterr().err
+        agent_file = initialized_project / ".github" / "agents"
+        assert not (agent_file / "testkit.design.agent.md").exists()
+
+
+class TestInstallArchive:
+    """Kits that publish an archive bundle install in a single file request."""
+
+    @staticmethod
+    def _archive(members: dict[str, str]) -> bytes:
+        import io
+        import tarfile
+
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+            for name, text in members.items():
+                data = text.encode("utf-8")
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        return buf.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_install_from_archive(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Every file comes from the archive; no per-file URL is requested."""
+        import hashlib
+
+        monkeypatch.chdir(initialized_project)
+        archive = self._archive(
+            {
+                "agents/testkit.design.agent.md": AGENT_CONTENT,
+                "prompts/testkit.design.prompt.md": PROMPT_CONTENT,
+            }
+        )
+        manifest = {
+            **SAMPLE_MANIFEST,
+            "archive": {
+                "path": "1.0.0.tar.gz",
+                "sha256": hashlib.sha256(archive).hexdigest(),
+            },
+        }
+
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=manifest)
+            m.get(f"{BASE_URL}/testkit/1.0.0.tar.gz", body=archive)
+            await install_handler("testkit")
+
+        assert len(m.requests) == 2
+        github_dir = initialized_project / ".github"
+        assert (github_dir / "agents" / "testkit.design.agent.md").read_text(
+            encoding="utf-8"
+        ) == AGENT_CONTENT
+        assert (github_dir / "prompts" / "testkit.design.prompt.md").read_text(
+            encoding="utf-8"
+        ) == PROMPT_CONTENT
+        assert load_config(initialized_project).is_installed("testkit")
+
+    @pytest.mark.asyncio
+    async def test_missing_archive_falls_back_to_files(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """A 404 archive warns and downloads each file individually."""
+        monkeypatch.chdir(initialized_project)
+        manifest = {**SAMPLE_MANIFEST, "archive": {"path": "1.0.0.tar.gz"}}
+
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=manifest)
+            m.get(f"{BASE_URL}/testkit/1.0.0.tar.gz", status=404)
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            await install_handler("testkit")
+
+        assert "downloading files individually" in capsys.readouterr().err
+        assert load_config(initialized_project).is_installed("testkit")
+
+    @pytest.mark.asyncio
+    async def test_member_missing_from_archive_is_fetched(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Files the archive lacks are still downloaded on their own."""
+        monkeypatch.chdir(initialized_project)
+        archive = self._archive({"agents/testkit.design.agent.md": AGENT_CONTENT})
+        manifest = {**SAMPLE_MANIFEST, "archive": {"path": "1.0.0.tar.gz"}}
+
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=manifest)
+            m.get(f"{BASE_URL}/testkit/1.0.0.tar.gz", body=archive)
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            await install_handler("testkit")
+
+        prompt_file = (
+            initialized_project / ".github" / "prompts" / "testkit.design.prompt.md"
+        )
+        assert prompt_file.read_text(encoding="utf-8") == PROMPT_CONTENT
+
+
+class TestInstallBatch:
+    """Several kits on the command line install as one batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_install_single_config_write(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Manifests are fetched together and multikit.toml is written once."""
+        import asyncio
+
+        from multikit.models.kit import Manifest
+
+        monkeypatch.chdir(initialized_project)
+        in_flight = 0
+        peak = 0
+        saves: list[list[str]] = []
+
+        async def _mock_manifest(_url, kit, client=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Manifest(
+                name=kit,
+                version="1.0.0",
+                agents=[f"{kit}.design.agent.md"],
+                prompts=[f"{kit}.design.prompt.md"],
+            )
+
+        async def _fetch(_url, kit, subdir, filename, dest, client=None, sha256=None):
+            return _write(dest, f"{kit}:{subdir}/{filename}\n")
+
+        import multikit.commands.install as install_mod
+        from multikit.utils import toml_io
+
+        real_save = toml_io.save_config
+
+        def _counting_save(project_dir, config):
+            saves.append(sorted(config.kits))
+            real_save(project_dir, config)
+
+        monkeypatch.setattr(install_mod, "fetch_manifest", _mock_manifest)
+        monkeypatch.setattr(install_mod, "download_file", _fetch)
+        monkeypatch.setattr(toml_io, "save_config", _counting_save)
+
+        await install_handler("akit", "bkit", "ckit")
+
+        assert peak == 3
+        assert saves == [["akit", "bkit", "ckit"]]
+        config = load_config(initialized_project)
+        for kit in ("akit", "bkit", "ckit"):
+            assert config.is_installed(kit)
+            agent = (
+                initialized_project / ".github" / "agents" / f"{kit}.design.agent.md"
+            )
+            assert agent.read_text(encoding="utf-8") == (
+                f"{kit}:agents/{kit}.design.agent.md\n"
+            )
+
+    @pytest.mark.asyncio
+    async def test_batch_shares_one_concurrency_budget(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Downloads across all kits stay within network.max_concurrency."""
+        import asyncio
+
+        from multikit.models.config import MultikitConfig, NetworkConfig
+        from multikit.models.kit import Manifest
+        from multikit.utils.toml_io import save_config
+
+        monkeypatch.chdir(initialized_project)
+        save_config(
+            initialized_project,
+            MultikitConfig(network=NetworkConfig(max_concurrency=3)),
+        )
+        in_flight = 0
+        peak = 0
+
+        async def _mock_manifest(_url, kit, client=None):
+            return Manifest(
+                name=kit,
+                version="1.0.0",
+                agents=[f"{kit}.a.agent.md", f"{kit}.b.agent.md"],
+                prompts=[f"{kit}.a.prompt.md", f"{kit}.b.prompt.md"],
+            )
+
+        async def _fetch(_url, _kit, subdir, filename, dest, client=None, sha256=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _write(dest, "content\n")
+
+        monkeypatch.setattr("multikit.commands.install.fetch_manifest", _mock_manifest)
+        monkeypatch.setattr("multikit.commands.install.download_file", _fetch)
+
+        await install_handler("akit", "bkit")
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_installs_nothing(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """One failing kit aborts the batch; no other kit is committed."""
+        m = aioresponses()
+        monkeypatch.chdir(initialized_project)
+        with m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
+            m.get(f"{BASE_URL}/missing/manifest.json", status=404)
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            with pytest.raises(SystemExit) as exc_info:
+                await install_handler("testkit", "missing")
+
+        assert exc_info.value.code == 1
+        err = capsys.readouterr().err
+        assert "Kit 'missing' not found" in err
+        assert "Not installed: testkit" in err
+        assert "Failed to install: missing" in err
+        config = load_config(initialized_project)
+        assert not config.is_installed("testkit")
+        assert not config.is_installed("missing")
+        github_dir = initialized_project / ".github"
+        assert not (github_dir / "agents" / "testkit.design.agent.md").exists()
+        assert not list(github_dir.glob(".multikit-staging-*"))
+
+
+class TestInstallLocalRegistry:
+    """--registry accepts a directory laid out like kits/."""
+
+    @pytest.mark.asyncio
+    async def test_install_from_local_path(
+        self, initialized_project: Path, tmp_path: Path, monkeypatch
+    ) -> None:
+        import hashlib
+        import json
+
+        registry_dir = tmp_path / "vendored-kits"
+        kit_dir = registry_dir / "testkit"
+        _write(kit_dir / "agents" / "testkit.design.agent.md", AGENT_CONTENT)
+        _write(kit_dir / "prompts" / "testkit.design.prompt.md", PROMPT_CONTENT)
+        manifest = {
+            **SAMPLE_MANIFEST,
+            "hashes": {
+                "agents/testkit.design.agent.md": hashlib.sha256(
+                    AGENT_CONTENT.encode()
+                ).hexdigest(),
+                "prompts/testkit.design.prompt.md": hashlib.sha256(
+                    PROMPT_CONTENT.encode()
+                ).hexdigest(),
+            },
+        }
+        (kit_dir / "manifest.json").write_text(json.dumps(manifest))
+
+        monkeypatch.chdir(initialized_project)
+        await install_handler("testkit", registry=registry_dir.as_uri())
+
+        github_dir = initialized_project / ".github"
+        assert (
+            github_dir / "agents" / "testkit.design.agent.md"
+        ).read_text() == AGENT_CONTENT
+        assert (
+            github_dir / "prompts" / "testkit.design.prompt.md"
+        ).read_text() == PROMPT_CONTENT
+        assert load_config(initialized_project).is_installed("testkit")
+
+    @pytest.mark.asyncio
+    async def test_install_repo_kit_from_archive(
+        self, initialized_project: Path, monkeypatch, isolated_cache_dir: Path
+    ) -> None:
+        """The repository's own kits/ directory works as a registry."""
+        kits_dir = Path(__file__).resolve().parents[2] / "kits"
+        monkeypatch.chdir(initialized_project)
+
+        await install_handler("dockit", registry=str(kits_dir))
+
+        kit = load_config(initialized_project).get_kit("dockit")
+        assert kit is not None
+        for rel in kit.files:
+            assert (initialized_project / ".github" / rel).is_file()
+        # Archive members of a local registry are not copied into the cache
+        assert not list((isolated_cache_dir / "blobs").glob("*/*"))
+
+    @pytest.mark.asyncio
+    async def test_missing_local_kit_reports_not_found(
+        self, initialized_project: Path, tmp_path: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with pytest.raises(SystemExit):
+            await install_handler("nokit", registry=str(tmp_path))
+        assert "Kit 'nokit' not found" in capsys.readouterr().err
+
+
+class TestInstallInProjectStaging:
+    """Staging lives under .github/ and is removed after the commit."""
+
+    @pytest.mark.asyncio
+    async def test_no_staging_dir_left_behind(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        staging_parents: list[Path] = []
+
+        async def _fake_download(
+            _url, _kit, subdir, filename, dest, client=None, sha256=None
+        ):
+            staging_parents.append(dest.parents[2])
+            return _write(dest, AGENT_CONTENT if subdir == "agents" else PROMPT_CONTENT)
+
+        monkeypatch.chdir(initialized_project)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
+            monkeypatch.setattr(
+                "multikit.commands.install.download_file", _fake_download
+            )
+            await install_handler("testkit")
+
+        github_dir = initialized_project / ".github"
+        assert {p.parent for p in staging_parents} == {github_dir}
+        assert all(p.name.startswith(".multikit-staging-") for p in staging_parents)
+        assert not list(github_dir.glob(".multikit-staging-*"))
+        assert (github_dir / "agents" / "testkit.design.agent.md").exists()
+
+
+class TestInstallLinkMode:
+    """--link materialises files from the shared cache without copying."""
+
+    @staticmethod
+    def _hashed_manifest() -> dict:
+        import hashlib
+
+        return {
+            **SAMPLE_MANIFEST,
+            "hashes": {
+                "agents/testkit.design.agent.md": hashlib.sha256(
+                    AGENT_CONTENT.encode()
+                ).hexdigest(),
+                "prompts/testkit.design.prompt.md": hashlib.sha256(
+                    PROMPT_CONTENT.encode()
+                ).hexdigest(),
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_hardlink_shares_files_across_projects(
+        self, initialized_project: Path, tmp_path: Path, monkeypatch
+    ) -> None:
+        from multikit.commands.status import MODIFIED, check_kits
+
+        second = tmp_path / "second"
+        second.mkdir()
+        (second / "multikit.toml").write_text(
+            (initialized_project / "multikit.toml").read_text()
+        )
+        rel = Path(".github") / "agents" / "testkit.design.agent.md"
+
+        with aioresponses() as m:
+            m.get(
+                f"{BASE_URL}/testkit/manifest.json",
+                payload=self._hashed_manifest(),
+                repeat=True,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            monkeypatch.chdir(initialized_project)
+            await install_handler("testkit", link="hardlink")
+            # Served from the store: the file URLs were registered only once
+            monkeypatch.chdir(second)
+            await install_handler("testkit", link="hardlink")
+
+        first_agent = initialized_project / rel
+        second_agent = second / rel
+        assert second_agent.read_text(encoding="utf-8") == AGENT_CONTENT
+        assert first_agent.stat().st_ino == second_agent.stat().st_ino
+
+        # An in-place edit is still reported by status, which hashes files
+        with open(second_agent, "a", encoding="utf-8") as f:
+            f.write("edited\n")
+        report = check_kits(load_config(second).kits, second)
+        assert (rel.as_posix(), MODIFIED) in report["testkit"]
+
+    @pytest.mark.asyncio
+    async def test_copy_mode_writes_independent_files(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        from multikit.registry.cache import BlobCache
+
+        monkeypatch.chdir(initialized_project)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=self._hashed_manifest())
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            await install_handler("testkit", link="copy")
+
+        agent = initialized_project / ".github" / "agents" / "testkit.design.agent.md"
+        digest = self._hashed_manifest()["hashes"]["agents/testkit.design.agent.md"]
+        blob = BlobCache().blob_path(digest)
+        assert blob.is_file()
+        assert agent.stat().st_ino != blob.stat().st_ino
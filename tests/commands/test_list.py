@@ -216,7 +216,7 @@ class TestListRemoteFetchFailure:
         save_config(initialized_project, config)
 
         # Mock fetch_registry to raise exception
-        async def mock_fetch_registry(_url):
+        async def mock_fetch_registry(_url, client=None):
             raise Exception("Network error")
 
         monkeypatch.setattr(
@@ -253,3 +253,88 @@ class TestListConfigLoadException:
 
         captured = capsys.readouterr()
         assert "Config corrupted" in captured.err
+
+
+class TestListRegistryCache:
+    """list renders from the cached registry.json; --refresh / --offline."""
+
+    UPDATED = {"kits": [{"name": "newkit", "version": "2.0.0"}]}
+
+    @pytest.mark.asyncio
+    async def test_second_list_is_served_from_cache(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=SAMPLE_REGISTRY)
+            await list_handler()
+            await list_handler()
+
+        # The mocked response is consumed once; the second run needed none
+        assert capsys.readouterr().out.count("gitkit") == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_revalidates_before_listing(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=SAMPLE_REGISTRY)
+            m.get(f"{BASE_URL}/registry.json", payload=self.UPDATED)
+            await list_handler()
+            capsys.readouterr()
+            await list_handler(refresh=True)
+
+        out = capsys.readouterr().out
+        assert "newkit" in out
+        assert "gitkit" not in out
+
+    @pytest.mark.asyncio
+    async def test_offline_never_contacts_registry(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        save_config(
+            initialized_project,
+            MultikitConfig(
+                cache={"registry_ttl": 0},
+                kits={"testkit": InstalledKit(version="1.0.0")},
+            ),
+        )
+
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=SAMPLE_REGISTRY)
+            await list_handler()
+            capsys.readouterr()
+            # Stale (ttl 0), yet listed without a request
+            await list_handler(offline=True)
+            assert len(m.requests) == 1
+
+        out = capsys.readouterr().out
+        assert "gitkit" in out
+
+    @pytest.mark.asyncio
+    async def test_offline_without_cache_shows_local_kits(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        save_config(
+            initialized_project,
+            MultikitConfig(kits={"testkit": InstalledKit(version="1.0.0")}),
+        )
+
+        await list_handler(offline=True)
+
+        captured = capsys.readouterr()
+        assert "No cached registry" in captured.err
+        assert "testkit" in captured.out
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_offline_are_exclusive(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with pytest.raises(SystemExit) as exc_info:
+            await list_handler(refresh=True, offline=True)
+        assert exc_info.value.code == 1
+        assert "mutually exclusive" in capsys.readouterr().err
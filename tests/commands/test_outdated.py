@@ -0,0 +1,129 @@
+"""Tests for multikit outdated command."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from multikit.commands.outdated import handler as outdated_handler
+from multikit.models.config import InstalledKit, MultikitConfig
+from multikit.utils.toml_io import save_config
+
+BASE_URL = "https://raw.githubusercontent.com/devcomfort/multikit/main/kits"
+
+SAMPLE_REGISTRY = {
+    "kits": [
+        {"name": "testkit", "version": "1.10.0"},
+        {"name": "gitkit", "version": "2.0.0"},
+        {"name": "dockit", "version": "1.0.0"},
+    ]
+}
+
+
+@pytest.fixture
+def installed(initialized_project: Path) -> Path:
+    save_config(
+        initialized_project,
+        MultikitConfig(
+            kits={
+                "testkit": InstalledKit(version="1.9.0"),
+                "gitkit": InstalledKit(version="2.0.0"),
+                "oldkit": InstalledKit(version="0.1.0"),
+            }
+        ),
+    )
+    return initialized_project
+
+
+class TestOutdatedCommand:
+    @pytest.mark.asyncio
+    async def test_reports_outdated_and_exits_one(
+        self, installed: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=SAMPLE_REGISTRY)
+            with pytest.raises(SystemExit) as exc_info:
+                await outdated_handler()
+        # Only registry.json is fetched, never a manifest
+        assert len(m.requests) == 1
+
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "testkit" in captured.out
+        assert "1.10.0" in captured.out
+        assert "gitkit" not in captured.out
+        assert "Kit 'oldkit' is not in the registry" in captured.err
+
+    @pytest.mark.asyncio
+    async def test_json_output(self, installed: Path, monkeypatch, capsys) -> None:
+        monkeypatch.chdir(installed)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=SAMPLE_REGISTRY)
+            with pytest.raises(SystemExit):
+                await outdated_handler(json_output=True)
+
+        assert json.loads(capsys.readouterr().out) == [
+            {"name": "testkit", "installed": "1.9.0", "latest": "1.10.0"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_exits_zero(
+        self, installed: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=SAMPLE_REGISTRY)
+            await outdated_handler("gitkit")
+        assert "up to date" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_not_installed_kit(
+        self, installed: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed)
+        with pytest.raises(SystemExit) as exc_info:
+            await outdated_handler("dockit")
+        assert exc_info.value.code == 1
+        assert "Kit 'dockit' is not installed" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_registry_unreachable(
+        self, installed: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", status=404)
+            with pytest.raises(SystemExit) as exc_info:
+                await outdated_handler()
+        assert exc_info.value.code == 1
+        assert "Cannot fetch registry" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_invalid_registry(self, installed: Path, monkeypatch, capsys) -> None:
+        monkeypatch.chdir(installed)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload={"kits": [{"name": "testkit"}]})
+            with pytest.raises(SystemExit) as exc_info:
+                await outdated_handler()
+        assert exc_info.value.code == 1
+        assert "Cannot fetch registry" in capsys.readouterr().err
+
+    def test_sync_wrapper_forwards_registry(
+        self, installed: Path, tmp_path: Path, monkeypatch, capsys
+    ) -> None:
+        from multikit.commands.outdated import outdated_handler as sync_wrapper
+
+        local = tmp_path / "local-registry"
+        local.mkdir()
+        (local / "registry.json").write_text(json.dumps(SAMPLE_REGISTRY))
+        monkeypatch.chdir(installed)
+        with pytest.raises(SystemExit) as exc_info:
+            sync_wrapper("testkit", json_output=True, registry=str(local))
+        assert exc_info.value.code == 1
+        assert json.loads(capsys.readouterr().out) == [
+            {"name": "testkit", "installed": "1.9.0", "latest": "1.10.0"}
+        ]
@@ -0,0 +1,106 @@
+"""Tests for multikit recover and the interrupted-run guard."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from multikit.commands.install import handler as install_handler
+from multikit.commands.recover import handler as recover_handler
+from multikit.models.config import InstalledKit
+from multikit.utils.journal import journal_path
+from multikit.utils.toml_io import load_config
+
+
+def _interrupted_install(project_dir: Path) -> Path:
+    """Lay out what a commit killed before its first rename leaves behind."""
+    staging = project_dir / ".github" / f".multikit-staging-{os.getpid()}-x"
+    staged = staging / "testkit" / "agents" / "testkit.design.agent.md"
+    staged.parent.mkdir(parents=True)
+    staged.write_text("# Agent\n", encoding="utf-8")
+    kit = InstalledKit(version="1.0.0", files=["agents/testkit.design.agent.md"])
+    record = {
+        "version": 1,
+        "operation": "install",
+        "pid": os.getpid(),
+        "staging": staging.relative_to(project_dir).as_posix(),
+        "renames": [
+            {
+                "src": staged.relative_to(project_dir).as_posix(),
+                "dst": ".github/agents/testkit.design.agent.md",
+                "existed": False,
+            }
+        ],
+        "config": {"multikit.toml": True, "multikit.lock": False},
+        "changes": {"kits": {"testkit": kit.model_dump()}, "locked": {}},
+    }
+    path = journal_path(project_dir)
+    path.parent.mkdir()
+    path.write_text(json.dumps(record), encoding="utf-8")
+    return staging
+
+
+class TestRecoverCommand:
+    def test_nothing_to_recover(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        recover_handler()
+        assert "Nothing to recover." in capsys.readouterr().out
+
+    def test_finishes_interrupted_install(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        staging = _interrupted_install(initialized_project)
+
+        recover_handler()
+
+        assert "Finished the interrupted install" in capsys.readouterr().out
+        agent = initialized_project / ".github" / "agents" / "testkit.design.agent.md"
+        assert agent.read_text(encoding="utf-8") == "# Agent\n"
+        assert load_config(initialized_project).is_installed("testkit")
+        assert not staging.exists()
+        assert not journal_path(initialized_project).exists()
+
+    def test_rollback_flag(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        _interrupted_install(initialized_project)
+
+        recover_handler(rollback=True)
+
+        assert "Rolled back the interrupted install" in capsys.readouterr().out
+        agent = initialized_project / ".github" / "agents" / "testkit.design.agent.md"
+        assert not agent.exists()
+        assert not load_config(initialized_project).is_installed("testkit")
+
+    def test_unreadable_journal_exits_one(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        staging = _interrupted_install(initialized_project)
+        journal_path(initialized_project).write_text("{", encoding="utf-8")
+
+        with pytest.raises(SystemExit) as exc_info:
+            recover_handler()
+        assert exc_info.value.code == 1
+        assert "Invalid .multikit/journal" in capsys.readouterr().err
+        # Backups and staged files are kept for a manual fix
+        assert staging.exists()
+
+    @pytest.mark.asyncio
+    async def test_install_refuses_while_journal_pending(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        _interrupted_install(initialized_project)
+
+        with pytest.raises(SystemExit) as exc_info:
+            await install_handler("testkit")
+        assert exc_info.value.code == 1
+        assert "multikit recover" in capsys.readouterr().err
@@ -0,0 +1,173 @@
+"""Tests for multikit status command."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from multikit.commands.status import handler as status_handler
+from multikit.models.config import InstalledKit, MultikitConfig
+from multikit.utils.toml_io import save_config
+
+AGENT_CONTENT = "# Test Agent\n"
+PROMPT_CONTENT = "# Test Prompt\n"
+TEMPLATE_CONTENT = "# Guide\n"
+
+
+def _sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+def installed_testkit(initialized_project: Path) -> Path:
+    """A project with testkit installed and hashes recorded."""
+    github_dir = initialized_project / ".github"
+    (github_dir / "agents" / "testkit.design.agent.md").write_text(
+        AGENT_CONTENT, encoding="utf-8"
+    )
+    (github_dir / "prompts" / "testkit.design.prompt.md").write_text(
+        PROMPT_CONTENT, encoding="utf-8"
+    )
+    (github_dir / "testkit-guide.md").write_text(TEMPLATE_CONTENT, encoding="utf-8")
+    save_config(
+        initialized_project,
+        MultikitConfig(
+            kits={
+                "testkit": InstalledKit(
+                    version="1.0.0",
+                    files=[
+                        "agents/testkit.design.agent.md",
+                        "prompts/testkit.design.prompt.md",
+                    ],
+                    templates=[".github/testkit-guide.md"],
+                    hashes={
+                        "agents/testkit.design.agent.md": _sha256(AGENT_CONTENT),
+                        "prompts/testkit.design.prompt.md": _sha256(PROMPT_CONTENT),
+                        ".github/testkit-guide.md": _sha256(TEMPLATE_CONTENT),
+                    },
+                )
+            }
+        ),
+    )
+    return initialized_project
+
+
+class TestStatusCommand:
+    """Tests for the status command handler."""
+
+    def test_clean_project_exits_zero(
+        self, installed_testkit: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed_testkit)
+        status_handler()
+        out = capsys.readouterr().out
+        assert "✓ testkit v1.0.0: 3 clean" in out
+
+    def test_modified_and_missing_exit_one(
+        self, installed_testkit: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed_testkit)
+        github_dir = installed_testkit / ".github"
+        (github_dir / "agents" / "testkit.design.agent.md").write_text(
+            "edited\n", encoding="utf-8"
+        )
+        (github_dir / "testkit-guide.md").unlink()
+
+        with pytest.raises(SystemExit) as exc_info:
+            status_handler()
+        assert exc_info.value.code == 1
+
+        captured = capsys.readouterr()
+        assert "1 modified, 1 missing, 1 clean" in captured.out
+        assert "modified   .github/agents/testkit.design.agent.md" in captured.out
+        assert "missing    .github/testkit-guide.md" in captured.out
+        assert "2 file(s) differ" in captured.err
+
+    def test_files_without_recorded_hash_are_unverified(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """Kits installed before hashes were recorded do not fail the check."""
+        monkeypatch.chdir(initialized_project)
+        (initialized_project / ".github" / "agents" / "old.design.agent.md").write_text(
+            "x", encoding="utf-8"
+        )
+        save_config(
+            initialized_project,
+            MultikitConfig(
+                kits={
+                    "old": InstalledKit(
+                        version="0.1.0", files=["agents/old.design.agent.md"]
+                    )
+                }
+            ),
+        )
+
+        status_handler()
+        assert "1 unverified" in capsys.readouterr().out
+
+    def test_unknown_kit_exits_one(
+        self, installed_testkit: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(installed_testkit)
+        with pytest.raises(SystemExit) as exc_info:
+            status_handler("nope")
+        assert exc_info.value.code == 1
+        assert "Kit 'nope' is not installed" in capsys.readouterr().err
+
+    def test_invalid_config_exits_one(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        (initialized_project / "multikit.toml").write_text(
+            '[multikit.kits.bad]\nversion = "1.0.0"\nfiles = 5\n'
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            status_handler()
+        assert exc_info.value.code == 1
+        assert "Config corrupted" in capsys.readouterr().err
+
+    def test_no_kits_installed(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        status_handler()
+        assert "No kits installed." in capsys.readouterr().out
+
+
+class TestInstallRecordsHashes:
+    """install stores the hash of every file it writes."""
+
+    @pytest.mark.asyncio
+    async def test_install_then_status_clean(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        from aioresponses import aioresponses
+
+        from multikit.commands.install import handler as install_handler
+        from multikit.utils.toml_io import load_config
+
+        base_url = "https://raw.githubusercontent.com/devcomfort/multikit/main/kits"
+        monkeypatch.chdir(initialized_project)
+        with aioresponses() as m:
+            m.get(
+                f"{base_url}/testkit/manifest.json",
+                payload={
+                    "name": "testkit",
+                    "version": "1.0.0",
+                    "agents": ["testkit.design.agent.md"],
+                },
+            )
+            m.get(
+                f"{base_url}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            await install_handler("testkit")
+
+        kit = load_config(initialized_project).get_kit("testkit")
+        assert kit is not None
+        assert kit.hashes == {"agents/testkit.design.agent.md": _sha256(AGENT_CONTENT)}
+
+        status_handler()
+        assert "1 clean" in capsys.readouterr().out
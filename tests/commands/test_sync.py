@@ -0,0 +1,387 @@
+"""Tests for multikit.lock generation and the multikit sync command."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from multikit.commands.install import handler as install_handler
+from multikit.commands.sync import handler as sync_handler
+from multikit.commands.uninstall import handler as uninstall_handler
+from multikit.utils.toml_io import load_config, load_lock
+
+BASE_URL = "https://raw.githubusercontent.com/devcomfort/multikit/main/kits"
+
+SAMPLE_MANIFEST = {
+    "name": "testkit",
+    "version": "1.0.0",
+    "description": "Test kit",
+    "agents": ["testkit.design.agent.md"],
+    "prompts": ["testkit.design.prompt.md"],
+    "templates": [
+        {
+            "agent": "testkit.design",
+            "src": "guide.template.md",
+            "dest": ".github/testkit-guide.md",
+        }
+    ],
+}
+
+AGENT_CONTENT = "# Test Agent\nSample agent content.\n"
+PROMPT_CONTENT = "# Test Prompt\nSample prompt content.\n"
+TEMPLATE_CONTENT = "# Guide\n"
+
+
+def _sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+async def _install_testkit() -> None:
+    with aioresponses() as m:
+        m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
+        m.get(f"{BASE_URL}/testkit/agents/testkit.design.agent.md", body=AGENT_CONTENT)
+        m.get(
+            f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+            body=PROMPT_CONTENT,
+        )
+        m.get(
+            f"{BASE_URL}/testkit/templates/testkit.design/guide.template.md",
+            body=TEMPLATE_CONTENT,
+        )
+        await install_handler("testkit")
+
+
+class TestLockfileWrite:
+    """install/uninstall keep multikit.lock in step with multikit.toml."""
+
+    @pytest.mark.asyncio
+    async def test_install_writes_lock(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+
+        lock = load_lock(initialized_project)
+        assert lock is not None
+        locked = lock.kits["testkit"]
+        assert locked.version == "1.0.0"
+        assert locked.registry_url == BASE_URL
+        by_path = {f.path: f for f in locked.files}
+        agent = by_path[".github/agents/testkit.design.agent.md"]
+        assert agent.source == "agents/testkit.design.agent.md"
+        assert agent.sha256 == _sha256(AGENT_CONTENT)
+        assert agent.size == len(AGENT_CONTENT)
+        template = by_path[".github/testkit-guide.md"]
+        assert template.sha256 == _sha256(TEMPLATE_CONTENT)
+        assert template.overwrite is False
+
+    @pytest.mark.asyncio
+    async def test_uninstall_drops_locked_kit(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+
+        uninstall_handler("testkit")
+
+        lock = load_lock(initialized_project)
+        assert lock is not None
+        assert "testkit" not in lock.kits
+
+
+class TestSyncCommand:
+    """Tests for multikit sync."""
+
+    @pytest.mark.asyncio
+    async def test_sync_without_lock_exits_one(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        with pytest.raises(SystemExit) as exc_info:
+            await sync_handler()
+        assert exc_info.value.code == 1
+        assert "No multikit.lock" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_sync_corrupted_lock_exits_one(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        (initialized_project / "multikit.lock").write_text("[kits\n")
+        with pytest.raises(SystemExit) as exc_info:
+            await sync_handler()
+        assert exc_info.value.code == 1
+        assert "Config corrupted" in capsys.readouterr().err
+
+    @pytest.mark.asyncio
+    async def test_sync_noop_when_up_to_date(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        capsys.readouterr()
+
+        with aioresponses() as m:
+            await sync_handler()
+        assert not m.requests
+        assert "3 up to date, 0 restored" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_sync_restores_from_cache_without_network(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Missing and modified files come back from the blob cache."""
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        github_dir = initialized_project / ".github"
+        agent = github_dir / "agents" / "testkit.design.agent.md"
+        prompt = github_dir / "prompts" / "testkit.design.prompt.md"
+        agent.unlink()
+        prompt.write_text("local edit\n", encoding="utf-8")
+
+        with aioresponses() as m:
+            await sync_handler()
+        assert not m.requests
+        assert agent.read_text(encoding="utf-8") == AGENT_CONTENT
+        assert prompt.read_text(encoding="utf-8") == PROMPT_CONTENT
+
+    @pytest.mark.asyncio
+    async def test_sync_fresh_checkout_downloads(
+        self, initialized_project: Path, monkeypatch, isolated_cache_dir: Path
+    ) -> None:
+        """With an empty cache, only the missing blobs are downloaded."""
+        import shutil
+
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        shutil.rmtree(isolated_cache_dir)
+        (
+            initialized_project / ".github" / "agents" / "testkit.design.agent.md"
+        ).unlink()
+        (initialized_project / "multikit.toml").unlink()
+
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            await sync_handler()
+        # The manifest, then only the one missing blob
+        assert len(m.requests) == 2
+
+        config = load_config(initialized_project)
+        kit = config.get_kit("testkit")
+        assert kit is not None
+        assert kit.version == "1.0.0"
+        assert "agents/testkit.design.agent.md" in kit.files
+        assert kit.templates == [".github/testkit-guide.md"]
+
+    @pytest.mark.asyncio
+    async def test_sync_keeps_customized_template(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Templates locked with overwrite=False are not reverted."""
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        template = initialized_project / ".github" / "testkit-guide.md"
+        template.write_text("customized\n", encoding="utf-8")
+
+        with aioresponses():
+            await sync_handler()
+        assert template.read_text(encoding="utf-8") == "customized\n"
+
+    @pytest.mark.asyncio
+    async def test_sync_hash_mismatch_changes_nothing(
+        self, initialized_project: Path, monkeypatch, isolated_cache_dir, capsys
+    ) -> None:
+        """A tampered download aborts before any file is moved into place."""
+        import shutil
+
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        shutil.rmtree(isolated_cache_dir)
+        github_dir = initialized_project / ".github"
+        (github_dir / "agents" / "testkit.design.agent.md").unlink()
+        prompt = github_dir / "prompts" / "testkit.design.prompt.md"
+        prompt.write_text("local edit\n", encoding="utf-8")
+
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body="tampered",
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            with pytest.raises(SystemExit) as exc_info:
+                await sync_handler()
+
+        assert exc_info.value.code == 1
+        assert "sha256 mismatch" in capsys.readouterr().err
+        assert prompt.read_text(encoding="utf-8") == "local edit\n"
+
+    @pytest.mark.asyncio
+    async def test_sync_rejects_traversal_path_in_lock(
+        self, initialized_project: Path, monkeypatch, tmp_path: Path, capsys
+    ) -> None:
+        """A tampered multikit.lock cannot make sync write outside the project."""
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        lock_file = initialized_project / "multikit.lock"
+        lock_file.write_text(
+            lock_file.read_text(encoding="utf-8").replace(
+                ".github/agents/testkit.design.agent.md", ".github/../../escaped.md"
+            ),
+            encoding="utf-8",
+        )
+        capsys.readouterr()
+
+        with aioresponses() as m, pytest.raises(SystemExit) as exc_info:
+            await sync_handler()
+
+        assert exc_info.value.code == 1
+        assert "stay inside the project" in capsys.readouterr().err
+        assert not m.requests
+        assert not (tmp_path / "escaped.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_sync_refuses_target_resolving_outside_project(
+        self, initialized_project: Path, monkeypatch, tmp_path: Path, capsys
+    ) -> None:
+        """A symlinked directory that leads out of the project is refused."""
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        agents = initialized_project / ".github" / "agents"
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        for path in agents.iterdir():
+            path.unlink()
+        agents.rmdir()
+        agents.symlink_to(outside, target_is_directory=True)
+        capsys.readouterr()
+
+        with aioresponses() as m, pytest.raises(SystemExit) as exc_info:
+            await sync_handler()
+
+        assert exc_info.value.code == 1
+        assert "outside the project" in capsys.readouterr().err
+        assert not m.requests
+        assert not list(outside.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_sync_reports_pinned_version_gone(
+        self, initialized_project: Path, monkeypatch, isolated_cache_dir, capsys
+    ) -> None:
+        """With a cold cache, a bumped upstream file is not fetched by URL."""
+        import shutil
+
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        shutil.rmtree(isolated_cache_dir)
+        agent = initialized_project / ".github" / "agents" / "testkit.design.agent.md"
+        agent.unlink()
+        bumped = {
+            **SAMPLE_MANIFEST,
+            "version": "2.0.0",
+            "hashes": {"agents/testkit.design.agent.md": _sha256("# v2\n")},
+        }
+        capsys.readouterr()
+
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=bumped)
+            with pytest.raises(SystemExit) as exc_info:
+                await sync_handler()
+
+        assert exc_info.value.code == 1
+        err = capsys.readouterr().err
+        assert "testkit v1.0.0: pinned .github/agents/testkit.design.agent.md" in err
+        assert "no longer available" in err
+        assert "v2.0.0" in err
+        assert len(m.requests) == 1
+        assert not agent.exists()
+
+    @pytest.mark.asyncio
+    async def test_sync_restores_from_pinned_archive(
+        self, initialized_project: Path, monkeypatch, isolated_cache_dir
+    ) -> None:
+        """The locked version's archive serves files in one request."""
+        import io
+        import shutil
+        import tarfile
+
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        shutil.rmtree(isolated_cache_dir)
+        github_dir = initialized_project / ".github"
+        agent = github_dir / "agents" / "testkit.design.agent.md"
+        prompt = github_dir / "prompts" / "testkit.design.prompt.md"
+        agent.unlink()
+        prompt.unlink()
+
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode="w:gz") as tf:
+            for name, text in (
+                ("agents/testkit.design.agent.md", AGENT_CONTENT),
+                ("prompts/testkit.design.prompt.md", PROMPT_CONTENT),
+            ):
+                data = text.encode("utf-8")
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        manifest = {
+            **SAMPLE_MANIFEST,
+            "archive": {
+                "path": "1.0.0.tar.gz",
+                "sha256": hashlib.sha256(buf.getvalue()).hexdigest(),
+            },
+        }
+
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=manifest)
+            m.get(f"{BASE_URL}/testkit/1.0.0.tar.gz", body=buf.getvalue())
+            await sync_handler()
+
+        assert len(m.requests) == 2
+        assert agent.read_text(encoding="utf-8") == AGENT_CONTENT
+        assert prompt.read_text(encoding="utf-8") == PROMPT_CONTENT
+
+    @pytest.mark.asyncio
+    async def test_sync_failed_commit_rolls_back(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """Restored files are committed as one journaled batch."""
+        from multikit.utils import journal
+
+        monkeypatch.chdir(initialized_project)
+        await _install_testkit()
+        github_dir = initialized_project / ".github"
+        agent = github_dir / "agents" / "testkit.design.agent.md"
+        prompt = github_dir / "prompts" / "testkit.design.prompt.md"
+        agent.unlink()
+        prompt.write_text("local edit\n", encoding="utf-8")
+        real_commit = journal.commit_file
+        moved: list[Path] = []
+
+        def failing(src: Path, dst: Path) -> None:
+            if moved:
+                raise OSError("disk full")
+            real_commit(src, dst)
+            moved.append(dst)
+
+        monkeypatch.setattr(journal, "commit_file", failing)
+
+        with aioresponses(), pytest.raises(SystemExit) as exc_info:
+            await sync_handler()
+
+        assert exc_info.value.code == 1
+        assert "rolled back" in capsys.readouterr().err
+        assert moved
+        assert not agent.exists()
+        assert prompt.read_text(encoding="utf-8") == "local edit\n"
+        assert not journal.has_pending_journal(initialized_project)
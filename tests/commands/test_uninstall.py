@@ -142,6 +142,39 @@ class TestUninstallInteractive:
             uninstall_handler()
         assert exc_info.value.code == 1
 
+    def test_uninstall_many_kits_parses_and_writes_config_once(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """Every selected kit is removed through one config session."""
+        from multikit.utils import toml_io
+
+        monkeypatch.chdir(initialized_project)
+        names = [f"kit{i}" for i in range(4)]
+        save_config(
+            initialized_project,
+            MultikitConfig(
+                kits={name: InstalledKit(version="1.0.0") for name in names}
+            ),
+        )
+        monkeypatch.setattr(
+            "multikit.commands.uninstall.select_installed_kits",
+            lambda _config, action="uninstall": names,
+        )
+        calls: list[str] = []
+        for name in ("load_config", "save_config"):
+            real = getattr(toml_io, name)
+
+            def counting(*args, _name=name, _real=real):
+                calls.append(_name)
+                return _real(*args)
+
+            monkeypatch.setattr(toml_io, name, counting)
+
+        uninstall_handler()
+
+        assert calls == ["load_config", "save_config"]
+        assert load_config(initialized_project).kits == {}
+
 
 class TestUninstallWrapperFunction:
     """Tests for the sync wrapper function uninstall_handler."""
@@ -224,9 +257,7 @@ class TestUninstallConfigCorruption:
         def _raise_unexpected(_path):
             raise RuntimeError("Unexpected error reading config")
 
-        monkeypatch.setattr(
-            "multikit.commands.uninstall.load_config", _raise_unexpected
-        )
+        monkeypatch.setattr("multikit.utils.toml_io.load_config", _raise_unexpected)
 
         with pytest.raises(SystemExit) as exc_info:
             uninstall_handler("testkit")
@@ -70,6 +70,56 @@ class TestUpdateCommand:
         assert kit is not None
         assert kit.version == "1.1.0"
 
+    @pytest.mark.asyncio
+    async def test_noop_update_fetches_only_manifest(
+        self, initialized_project: Path, monkeypatch
+    ) -> None:
+        """With published hashes, an up-to-date kit costs one manifest request."""
+        import hashlib
+
+        monkeypatch.chdir(initialized_project)
+        github_dir = initialized_project / ".github"
+        (github_dir / "agents").mkdir(parents=True, exist_ok=True)
+        (github_dir / "prompts").mkdir(parents=True, exist_ok=True)
+        (github_dir / "agents" / "testkit.design.agent.md").write_text(
+            AGENT_CONTENT, encoding="utf-8"
+        )
+        (github_dir / "prompts" / "testkit.design.prompt.md").write_text(
+            PROMPT_CONTENT, encoding="utf-8"
+        )
+        save_config(
+            initialized_project,
+            MultikitConfig(
+                kits={
+                    "testkit": InstalledKit(
+                        version="1.1.0",
+                        files=[
+                            "agents/testkit.design.agent.md",
+                            "prompts/testkit.design.prompt.md",
+                        ],
+                    )
+                }
+            ),
+        )
+        manifest = {
+            **SAMPLE_MANIFEST,
+            "hashes": {
+                "agents/testkit.design.agent.md": hashlib.sha256(
+                    AGENT_CONTENT.encode("utf-8")
+                ).hexdigest(),
+                "prompts/testkit.design.prompt.md": hashlib.sha256(
+                    PROMPT_CONTENT.encode("utf-8")
+                ).hexdigest(),
+            },
+        }
+
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=manifest)
+            await update_handler("testkit")
+
+        assert len(m.requests) == 1
+
     @pytest.mark.asyncio
     async def test_update_non_installed_kit(
         self, initialized_project: Path, monkeypatch
@@ -236,6 +286,55 @@ class TestUpdateInteractive:
             await update_handler()
         assert exc_info.value.code == 1
 
+    @pytest.mark.asyncio
+    async def test_update_batch_is_all_or_nothing(
+        self, initialized_project: Path, monkeypatch, capsys
+    ) -> None:
+        """A kit failing mid-batch leaves the kits updated before it untouched."""
+        monkeypatch.chdir(initialized_project)
+        agent_file = (
+            initialized_project / ".github" / "agents" / "testkit.design.agent.md"
+        )
+        agent_file.write_text("# Old Agent\n", encoding="utf-8")
+        save_config(
+            initialized_project,
+            MultikitConfig(
+                kits={
+                    "testkit": InstalledKit(
+                        version="1.0.0", files=["agents/testkit.design.agent.md"]
+                    ),
+                    "brokenkit": InstalledKit(version="1.0.0"),
+                }
+            ),
+        )
+        monkeypatch.setattr(
+            "multikit.commands.update.select_installed_kits",
+            lambda _config, action="update": ["testkit", "brokenkit"],
+        )
+
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/manifest.json", payload=SAMPLE_MANIFEST)
+            m.get(
+                f"{BASE_URL}/testkit/agents/testkit.design.agent.md",
+                body=AGENT_CONTENT,
+            )
+            m.get(
+                f"{BASE_URL}/testkit/prompts/testkit.design.prompt.md",
+                body=PROMPT_CONTENT,
+            )
+            m.get(f"{BASE_URL}/brokenkit/manifest.json", status=404)
+
+            with pytest.raises(SystemExit) as exc_info:
+                await update_handler(force=True)
+
+        assert exc_info.value.code == 1
+        assert "no kits were changed" in capsys.readouterr().err
+        assert agent_file.read_text(encoding="utf-8") == "# Old Agent\n"
+        assert load_config(initialized_project).get_kit("testkit").version == "1.0.0"
+        github_dir = initialized_project / ".github"
+        assert not (github_dir / "prompts" / "testkit.design.prompt.md").exists()
+        assert not list(github_dir.glob(".multikit-staging-*"))
+
 
 class TestUpdateConfigCorruption:
     """Tests for config corruption handling in update command."""
@@ -274,7 +373,7 @@ class TestUpdateConfigCorruption:
         def _raise_unexpected(_path):
             raise RuntimeError("Unexpected error reading config")
 
-        monkeypatch.setattr("multikit.commands.update.load_config", _raise_unexpected)
+        monkeypatch.setattr("multikit.utils.toml_io.load_config", _raise_unexpected)
 
         with pytest.raises(SystemExit) as exc_info:
             await update_handler("testkit")
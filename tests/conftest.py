@@ -7,6 +7,14 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch) -> Path:
+    """Point the user-level download cache at a per-test directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("MULTIKIT_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def project_dir(tmp_path: Path) -> Path:
     """Create a temporary project directory for testing."""
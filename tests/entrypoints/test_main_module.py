@@ -11,7 +11,7 @@ def test_main_module_invokes_cli_app(monkeypatch) -> None:
     def _fake_app() -> None:
         called["ok"] = True
 
-    monkeypatch.setattr("multikit.cli.app", _fake_app)
+    monkeypatch.setattr("multikit.cli.main", _fake_app)
 
     runpy.run_module("multikit.__main__", run_name="__main__")
 
@@ -10,7 +10,14 @@ from multikit.models.config import (
     MultikitConfig,
     NetworkConfig,
 )
-from multikit.models.kit import Manifest, Registry, RegistryEntry, TemplateEntry
+from multikit.models.kit import (
+    KitArchive,
+    Manifest,
+    Registry,
+    RegistryEntry,
+    TemplateEntry,
+)
+from multikit.models.lock import LockedFile
 
 
 class TestTemplateEntry:
@@ -146,6 +153,96 @@ class TestManifest:
         m = Manifest(name="testkit", version="1.0.0")
         assert m.template_files == []
 
+    def test_hashes_default_empty(self) -> None:
+        m = Manifest(name="testkit", version="1.0.0")
+        assert m.hashes == {}
+        assert m.file_hash("agents", "x.agent.md") is None
+        assert m.file_size("agents", "x.agent.md") is None
+
+    def test_file_hash_and_size_lookup(self) -> None:
+        digest = "a" * 64
+        m = Manifest(
+            name="testkit",
+            version="1.0.0",
+            agents=["testkit.a.agent.md"],
+            hashes={"agents/testkit.a.agent.md": digest},
+            sizes={"agents/testkit.a.agent.md": 12},
+        )
+        assert m.file_hash("agents", "testkit.a.agent.md") == digest
+        assert m.file_size("agents", "testkit.a.agent.md") == 12
+
+    def test_invalid_hash_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            Manifest(
+                name="testkit",
+                version="1.0.0",
+                hashes={"agents/testkit.a.agent.md": "not-a-sha256"},
+            )
+
+
+class TestKitArchive:
+    """Tests for KitArchive model."""
+
+    def test_manifest_archive_default_none(self) -> None:
+        assert Manifest(name="testkit", version="1.0.0").archive is None
+
+    def test_valid_archive(self) -> None:
+        m = Manifest(
+            name="testkit",
+            version="1.0.0",
+            archive={"path": "1.0.0.tar.gz", "sha256": "b" * 64, "size": 10},
+        )
+        assert m.archive == KitArchive(path="1.0.0.tar.gz", sha256="b" * 64, size=10)
+
+    def test_zip_archive_allowed(self) -> None:
+        assert KitArchive(path="1.0.0.zip").sha256 is None
+
+    def test_unsupported_extension_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            KitArchive(path="1.0.0.rar")
+
+    def test_path_escaping_kit_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            KitArchive(path="../other/1.0.0.tar.gz")
+
+    def test_invalid_sha256_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            KitArchive(path="1.0.0.tar.gz", sha256="xyz")
+
+
+class TestLockedFile:
+    """Tests for LockedFile path validation."""
+
+    @staticmethod
+    def _locked(path: str, source: str = "agents/x.agent.md") -> LockedFile:
+        return LockedFile(path=path, source=source, sha256="a" * 64, size=1)
+
+    def test_github_path_accepted(self) -> None:
+        assert self._locked(".github/agents/x.agent.md").path.endswith("x.agent.md")
+
+    def test_template_dest_outside_github_accepted(self) -> None:
+        locked = self._locked("docs/guide.md", source="templates/kit.a/guide.md")
+        assert locked.is_template
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/etc/passwd",
+            "\\\\server\\share\\x.md",
+            "C:/Users/x.md",
+            ".github/../../outside.md",
+            "..\\outside.md",
+            "",
+        ],
+    )
+    def test_escaping_paths_rejected(self, path: str) -> None:
+        with pytest.raises(ValidationError):
+            self._locked(path, source="templates/kit.a/x.md")
+
+    def test_kit_file_outside_github_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            self._locked("agents/x.agent.md")
+
 
 class TestRegistryEntry:
     """Tests for RegistryEntry model."""
@@ -205,6 +302,7 @@ class TestInstalledKit:
         assert kit.source == "remote"
         assert kit.files == []
         assert kit.templates == []
+        assert kit.hashes == {}
 
     def test_with_templates(self) -> None:
         kit = InstalledKit(
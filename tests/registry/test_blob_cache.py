@@ -0,0 +1,486 @@
+"""Tests for the content-addressed download cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from multikit.models.config import CacheConfig
+from multikit.registry import cache as cache_module
+from multikit.registry.cache import BlobCache, default_cache_dir, sha256_hex
+from multikit.registry.remote import RemoteClient
+
+BASE_URL = "https://raw.githubusercontent.com/devcomfort/multikit/main/kits"
+
+
+class TestDefaultCacheDir:
+    """Tests for cache root resolution."""
+
+    def test_env_override(self, monkeypatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("MULTIKIT_CACHE_DIR", str(tmp_path / "c"))
+        assert default_cache_dir() == tmp_path / "c"
+
+    def test_xdg_cache_home(self, monkeypatch, tmp_path: Path) -> None:
+        monkeypatch.delenv("MULTIKIT_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "multikit"
+
+
+class TestBlobCache:
+    """Tests for BlobCache storage, lookup and eviction."""
+
+    def test_put_and_get_blob(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path)
+        digest = cache.put_blob(b"hello")
+        assert digest == sha256_hex(b"hello")
+        assert cache.blob_path(digest).exists()
+        assert cache.get_blob(digest) == b"hello"
+
+    def test_corrupted_blob_is_discarded(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path)
+        digest = cache.put_blob(b"hello")
+        cache.blob_path(digest).write_bytes(b"tampered")
+        assert cache.get_blob(digest) is None
+        assert not cache.blob_path(digest).exists()
+
+    def test_lookup_fresh_ref(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path, ttl=300)
+        cache.store("https://example.com/a", b"data")
+        assert cache.lookup("https://example.com/a") == b"data"
+        assert cache.lookup("https://example.com/other") is None
+
+    def test_lookup_stale_ref_misses(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path, ttl=0)
+        cache.store("https://example.com/a", b"data")
+        assert cache.lookup("https://example.com/a") is None
+        # The blob itself is still addressable by hash
+        assert cache.get_blob(sha256_hex(b"data")) == b"data"
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path, max_bytes=10)
+        old = cache.put_blob(b"aaaaaa")
+        os.utime(cache.blob_path(old), (1, 1))
+        new = cache.put_blob(b"bbbbbb")
+        assert not cache.blob_path(old).exists()
+        assert cache.blob_path(new).exists()
+
+    def test_prune_drops_dangling_refs(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path)
+        cache.store("https://example.com/a", b"data")
+        removed, freed = cache.prune(max_bytes=0)
+        assert (removed, freed) == (1, 4)
+        assert cache.read_ref("https://example.com/a") is None
+
+    def test_info_and_clear(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path, max_bytes=1024)
+        cache.store("https://example.com/a", b"abc")
+        cache.store("https://example.com/b", b"defg")
+        stats = cache.info()
+        assert stats.blob_count == 2
+        assert stats.total_bytes == 7
+        assert stats.max_bytes == 1024
+        cache.clear()
+        assert cache.info().blob_count == 0
+        assert cache.read_ref("https://example.com/a") is None
+
+    def test_put_file_and_copy_blob(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path / "cache")
+        src = tmp_path / "src.md"
+        src.write_bytes(b"streamed")
+        digest = sha256_hex(b"streamed")
+        cache.put_file(src, digest)
+        dest = tmp_path / "dest.md"
+        assert cache.copy_blob(digest, dest)
+        assert dest.read_bytes() == b"streamed"
+
+    def test_copy_blob_rejects_corruption(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path / "cache")
+        digest = cache.put_blob(b"hello")
+        cache.blob_path(digest).write_bytes(b"tampered")
+        dest = tmp_path / "dest.md"
+        assert not cache.copy_blob(digest, dest)
+        assert not dest.exists()
+        assert not cache.blob_path(digest).exists()
+
+    def test_copy_blob_missing(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path / "cache")
+        assert not cache.copy_blob("0" * 64, tmp_path / "dest.md")
+
+    def test_from_config(self) -> None:
+        assert BlobCache.from_config(CacheConfig(enabled=False)) is None
+        cache = BlobCache.from_config(CacheConfig(max_size_mb=2, ttl=60))
+        assert cache is not None
+        assert cache.max_bytes == 2 * 1024 * 1024
+        assert cache.ttl == 60
+
+
+class TestLinkModes:
+    """Tests for materialising blobs by reflink/hardlink instead of copying."""
+
+    def _cache_with(self, tmp_path: Path, link: str) -> tuple[BlobCache, str]:
+        cache = BlobCache(root=tmp_path / "cache", link=link)
+        return cache, cache.put_blob(b"shared")
+
+    def test_hardlink_shares_inode(self, tmp_path: Path) -> None:
+        cache, digest = self._cache_with(tmp_path, "hardlink")
+        dest = tmp_path / "dest.md"
+        assert cache.materialize(digest, dest)
+        assert dest.read_bytes() == b"shared"
+        assert dest.stat().st_ino == cache.blob_path(digest).stat().st_ino
+
+    def test_copy_mode_writes_a_separate_file(self, tmp_path: Path) -> None:
+        cache, digest = self._cache_with(tmp_path, "copy")
+        dest = tmp_path / "dest.md"
+        assert cache.materialize(digest, dest)
+        assert dest.stat().st_ino != cache.blob_path(digest).stat().st_ino
+
+    def test_auto_without_reflink_copies(self, tmp_path: Path, monkeypatch) -> None:
+        def unsupported(*_args) -> None:
+            raise OSError("not supported")
+
+        monkeypatch.setattr(cache_module, "_reflink", unsupported)
+        cache, digest = self._cache_with(tmp_path, "auto")
+        dest = tmp_path / "dest.md"
+        assert cache.materialize(digest, dest)
+        assert dest.read_bytes() == b"shared"
+        # Never a hard link: edits must not reach the shared blob
+        assert dest.stat().st_ino != cache.blob_path(digest).stat().st_ino
+
+    def test_hardlink_falls_back_to_copy(self, tmp_path: Path, monkeypatch) -> None:
+        def cross_device(*_args) -> None:
+            raise OSError("Invalid cross-device link")
+
+        # e.g. the cache and the project are on different filesystems
+        monkeypatch.setattr(cache_module.os, "link", cross_device)
+        cache, digest = self._cache_with(tmp_path, "hardlink")
+        dest = tmp_path / "dest.md"
+        assert cache.materialize(digest, dest)
+        assert dest.read_bytes() == b"shared"
+
+    def test_put_file_links_download_into_store(self, tmp_path: Path) -> None:
+        cache = BlobCache(root=tmp_path / "cache", link="hardlink")
+        src = tmp_path / "staged.md"
+        src.write_bytes(b"streamed")
+        digest = sha256_hex(b"streamed")
+        cache.put_file(src, digest)
+        assert cache.blob_path(digest).stat().st_ino == src.stat().st_ino
+        assert cache.info().blob_count == 1
+
+    def test_edit_through_link_is_not_spread(self, tmp_path: Path) -> None:
+        cache, digest = self._cache_with(tmp_path, "hardlink")
+        first = tmp_path / "first.md"
+        assert cache.materialize(digest, first)
+        # An in-place edit also rewrites the shared blob
+        with open(first, "r+b") as f:
+            f.write(b"edited")
+
+        second = tmp_path / "second.md"
+        assert not cache.materialize(digest, second)
+        assert not second.exists()
+        assert not cache.blob_path(digest).exists()
+        assert first.read_bytes() == b"edited"
+
+    def test_unknown_mode_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="link mode"):
+            BlobCache(root=tmp_path, link="symlink")
+
+    def test_from_config_link_override(self) -> None:
+        cache = BlobCache.from_config(CacheConfig())
+        assert cache is not None and cache.link == "auto"
+        cache = BlobCache.from_config(CacheConfig(link="hardlink"), link="copy")
+        assert cache is not None and cache.link == "copy"
+
+
+class TestRemoteClientCache:
+    """Tests for RemoteClient.fetch_file backed by the blob cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_served_from_cache(self, tmp_path: Path) -> None:
+        url = f"{BASE_URL}/testkit/agents/a.agent.md"
+        cache = BlobCache(root=tmp_path)
+        m = aioresponses()
+        with m:
+            # Registered once: a second network request would fail
+            m.get(url, body="agent")
+            async with RemoteClient(cache=cache) as client:
+                first = await client.fetch_file(
+                    BASE_URL, "testkit", "agents", "a.agent.md"
+                )
+                second = await client.fetch_file(
+                    BASE_URL, "testkit", "agents", "a.agent.md"
+                )
+        assert first == second == "agent"
+        assert cache.read_ref(url)["sha256"] == sha256_hex(b"agent")
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_refetched(self, tmp_path: Path) -> None:
+        url = f"{BASE_URL}/testkit/agents/a.agent.md"
+        cache = BlobCache(root=tmp_path, ttl=0)
+        cache.store(url, b"old")
+        m = aioresponses()
+        with m:
+            m.get(url, body="new")
+            async with RemoteClient(cache=cache) as client:
+                result = await client.fetch_file(
+                    BASE_URL, "testkit", "agents", "a.agent.md"
+                )
+        assert result == "new"
+
+    @pytest.mark.asyncio
+    async def test_streamed_download_cached_by_hash(self, tmp_path: Path) -> None:
+        url = f"{BASE_URL}/testkit/agents/a.agent.md"
+        cache = BlobCache(root=tmp_path / "cache")
+        digest = sha256_hex(b"agent")
+        m = aioresponses()
+        with m:
+            # Registered once: a second network request would fail
+            m.get(url, body="agent")
+            async with RemoteClient(cache=cache) as client:
+                for name in ("first.md", "second.md"):
+                    result = await client.download_file(
+                        BASE_URL,
+                        "testkit",
+                        "agents",
+                        "a.agent.md",
+                        tmp_path / name,
+                        sha256=digest,
+                    )
+                    assert result == digest
+        assert (tmp_path / "second.md").read_bytes() == b"agent"
+        assert cache.read_ref(url)["sha256"] == digest
+
+
+class TestConditionalMetadata:
+    """Tests for ETag / Last-Modified revalidation of registry and manifests."""
+
+    @pytest.mark.asyncio
+    async def test_manifest_304_reuses_cached_body(
+        self, tmp_path: Path, sample_manifest: dict
+    ) -> None:
+        from yarl import URL
+
+        url = f"{BASE_URL}/testkit/manifest.json"
+        cache = BlobCache(root=tmp_path)
+        m = aioresponses()
+        with m:
+            m.get(url, payload=sample_manifest, headers={"ETag": '"v1"'})
+            m.get(url, status=304, headers={"ETag": '"v1"'})
+            async with RemoteClient(cache=cache) as client:
+                first = await client.fetch_manifest(BASE_URL, "testkit")
+                second = await client.fetch_manifest(BASE_URL, "testkit")
+
+            calls = m.requests[("GET", URL(url))]
+            assert "If-None-Match" not in calls[0].kwargs["headers"]
+            assert calls[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+        assert second.name == "testkit"
+        # Same bytes -> the validated model is reused, not rebuilt
+        assert second is first
+        assert cache.read_ref(url)["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_validated_manifest_reused_across_clients(
+        self, tmp_path: Path, sample_manifest: dict, monkeypatch
+    ) -> None:
+        from multikit.models.kit import Manifest
+
+        url = f"{BASE_URL}/testkit/manifest.json"
+        payload = {
+            **sample_manifest,
+            "templates": [
+                {"agent": "testkit.design", "src": "a.md", "dest": ".github/a.md"}
+            ],
+            "archive": {"path": "1.0.0.tar.gz"},
+        }
+        cache = BlobCache(root=tmp_path)
+        m = aioresponses()
+        with m:
+            m.get(url, payload=payload, headers={"ETag": '"v1"'})
+            m.get(url, status=304, headers={"ETag": '"v1"'})
+            async with RemoteClient(cache=cache) as client:
+                first = await client.fetch_manifest(BASE_URL, "testkit")
+            assert cache.read_ref(url)["validated"]["model"].startswith("Manifest@")
+
+            # A later run (new client) rebuilds the model without pydantic
+            def _no_validation(*_args, **_kwargs):
+                raise AssertionError("validated again")
+
+            monkeypatch.setattr(Manifest, "model_validate_json", _no_validation)
+            async with RemoteClient(cache=cache) as client:
+                second = await client.fetch_manifest(BASE_URL, "testkit")
+
+        assert second is not first
+        assert second == first
+        assert second.template_files[0][2].dest == ".github/a.md"
+        assert second.archive is not None and second.archive.path == "1.0.0.tar.gz"
+        assert cache.read_ref(url)["validated"]
+
+    @pytest.mark.asyncio
+    async def test_new_body_drops_validated_marker(
+        self, tmp_path: Path, sample_manifest: dict
+    ) -> None:
+        url = f"{BASE_URL}/testkit/manifest.json"
+        cache = BlobCache(root=tmp_path)
+        m = aioresponses()
+        with m:
+            m.get(url, payload=sample_manifest, headers={"ETag": '"v1"'})
+            m.get(
+                url,
+                payload={**sample_manifest, "version": "2.0.0"},
+                headers={"ETag": '"v2"'},
+            )
+            async with RemoteClient(cache=cache) as client:
+                await client.fetch_manifest(BASE_URL, "testkit")
+            async with RemoteClient(cache=cache) as client:
+                manifest = await client.fetch_manifest(BASE_URL, "testkit")
+
+        assert manifest.version == "2.0.0"
+        entry = cache.read_ref(url)
+        assert entry["etag"] == '"v2"'
+        # Revalidated once, then marked again for the new blob
+        assert entry["validated"]["sha256"] != entry["sha256"]
+
+    @pytest.mark.asyncio
+    async def test_registry_revalidated_with_last_modified(
+        self, tmp_path: Path, sample_registry: dict
+    ) -> None:
+        from yarl import URL
+
+        url = f"{BASE_URL}/registry.json"
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        cache = BlobCache(root=tmp_path)
+        m = aioresponses()
+        with m:
+            m.get(url, payload=sample_registry, headers={"Last-Modified": stamp})
+            m.get(url, status=304)
+            async with RemoteClient(cache=cache) as client:
+                await client.fetch_registry(BASE_URL)
+                registry = await client.fetch_registry(BASE_URL)
+
+            calls = m.requests[("GET", URL(url))]
+            assert calls[1].kwargs["headers"]["If-Modified-Since"] == stamp
+
+        assert len(registry.kits) == 2
+        assert cache.read_ref(url)["last_modified"] == stamp
+
+    @pytest.mark.asyncio
+    async def test_304_with_evicted_blob_refetches(
+        self, tmp_path: Path, sample_registry: dict
+    ) -> None:
+        url = f"{BASE_URL}/registry.json"
+        cache = BlobCache(root=tmp_path)
+        cache.write_ref(url, "0" * 64, etag='"gone"')
+        m = aioresponses()
+        with m:
+            m.get(url, status=304)
+            m.get(url, payload=sample_registry, headers={"ETag": '"v2"'})
+            async with RemoteClient(cache=cache) as client:
+                registry = await client.fetch_registry(BASE_URL)
+
+        assert len(registry.kits) == 2
+        assert cache.read_ref(url)["etag"] == '"v2"'
+
+
+class TestCachedRegistry:
+    """Stale-while-revalidate reads of registry.json."""
+
+    URL = f"{BASE_URL}/registry.json"
+
+    @staticmethod
+    def _seed(cache: BlobCache, registry: dict, age: float = 0) -> None:
+        import json
+        import time
+
+        cache.store(TestCachedRegistry.URL, json.dumps(registry).encode())
+        if age:
+            ref = cache._ref_path(TestCachedRegistry.URL)
+            entry = json.loads(ref.read_text())
+            entry["fetched_at"] = time.time() - age
+            ref.write_text(json.dumps(entry))
+
+    @pytest.mark.asyncio
+    async def test_fresh_copy_needs_no_request(
+        self, tmp_path: Path, sample_registry: dict
+    ) -> None:
+        cache = BlobCache(root=tmp_path, registry_ttl=60)
+        self._seed(cache, sample_registry)
+        m = aioresponses()
+        with m:
+            async with RemoteClient(cache=cache) as client:
+                registry = client.cached_registry(BASE_URL)
+            assert not m.requests
+
+        assert [kit.name for kit in registry.kits] == ["testkit", "gitkit"]
+
+    @pytest.mark.asyncio
+    async def test_stale_copy_served_then_revalidated_on_close(
+        self, tmp_path: Path, sample_registry: dict
+    ) -> None:
+        cache = BlobCache(root=tmp_path, registry_ttl=60)
+        self._seed(cache, sample_registry, age=120)
+        updated = {"kits": [{"name": "newkit", "version": "2.0.0"}]}
+        m = aioresponses()
+        with m:
+            m.get(self.URL, payload=updated)
+            async with RemoteClient(cache=cache) as client:
+                registry = client.cached_registry(BASE_URL)
+                # Returned before the revalidation completes
+                assert len(registry.kits) == 2
+
+        async with RemoteClient(cache=cache) as client:
+            refreshed = client.cached_registry(BASE_URL, revalidate=False)
+        assert [kit.name for kit in refreshed.kits] == ["newkit"]
+        assert cache.is_fresh(cache.read_ref(self.URL), cache.registry_ttl)
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_stale_copy(
+        self, tmp_path: Path, sample_registry: dict
+    ) -> None:
+        cache = BlobCache(root=tmp_path, registry_ttl=60)
+        self._seed(cache, sample_registry, age=120)
+        m = aioresponses()
+        with m:
+            m.get(self.URL, status=404)
+            async with RemoteClient(cache=cache) as client:
+                assert client.cached_registry(BASE_URL) is not None
+
+        assert not cache.is_fresh(cache.read_ref(self.URL), cache.registry_ttl)
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self, tmp_path: Path) -> None:
+        async with RemoteClient(cache=BlobCache(root=tmp_path)) as client:
+            assert client.cached_registry(BASE_URL) is None
+        async with RemoteClient() as client:
+            assert client.cached_registry(BASE_URL) is None
+
+    @pytest.mark.asyncio
+    async def test_slow_revalidation_cut_off_on_close(
+        self, tmp_path: Path, sample_registry: dict, monkeypatch
+    ) -> None:
+        import asyncio
+        import time
+
+        from multikit.registry import remote
+
+        monkeypatch.setattr(remote, "REVALIDATE_GRACE", 0.05)
+        cache = BlobCache(root=tmp_path, registry_ttl=60)
+        self._seed(cache, sample_registry, age=120)
+
+        async def _hang(*_args, **_kwargs):
+            await asyncio.sleep(30)
+
+        m = aioresponses()
+        with m:
+            m.get(self.URL, callback=_hang)
+            started = time.monotonic()
+            async with RemoteClient(cache=cache) as client:
+                registry = client.cached_registry(BASE_URL)
+            elapsed = time.monotonic() - started
+
+        assert len(registry.kits) == 2
+        assert elapsed < 1.0
+        # Cut off before it landed: the stale copy stays for the next run
+        assert not cache.is_fresh(cache.read_ref(self.URL), cache.registry_ttl)
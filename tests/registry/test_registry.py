@@ -109,6 +109,42 @@ class TestRemoteClient:
         finally:
             m.stop()
 
+    @pytest.mark.asyncio
+    async def test_download_archive_verifies_sha256(self, tmp_path) -> None:
+        import hashlib
+
+        from multikit.models.kit import KitArchive
+
+        body = b"archive-bytes"
+        good = KitArchive(path="1.0.0.tar.gz", sha256=hashlib.sha256(body).hexdigest())
+        bad = KitArchive(path="1.0.0.tar.gz", sha256="0" * 64)
+        dest = tmp_path / "bundle.tar.gz"
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/1.0.0.tar.gz", body=body)
+            m.get(f"{BASE_URL}/testkit/1.0.0.tar.gz", body=body)
+            async with RemoteClient(base_url=BASE_URL) as client:
+                digest = await client.download_archive(BASE_URL, "testkit", good, dest)
+                assert digest == good.sha256
+                assert dest.read_bytes() == body
+                with pytest.raises(RemoteFetchError, match="sha256 mismatch"):
+                    await client.download_archive(BASE_URL, "testkit", bad, dest)
+                assert not dest.exists()
+
+    @pytest.mark.asyncio
+    async def test_download_file_streams_to_disk(self, tmp_path) -> None:
+        import hashlib
+
+        body = b"x" * (3 * 64 * 1024 + 17)
+        dest = tmp_path / "agents" / "big.agent.md"
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/testkit/agents/big.agent.md", body=body)
+            async with RemoteClient(base_url=BASE_URL) as client:
+                digest = await client.download_file(
+                    BASE_URL, "testkit", "agents", "big.agent.md", dest
+                )
+        assert dest.read_bytes() == body
+        assert digest == hashlib.sha256(body).hexdigest()
+
 
 class TestHostUnreachable:
     """Tests for HostUnreachableError logic in RemoteClient."""
@@ -680,3 +716,124 @@ class TestExternalSession:
         assert not external_session.closed
         # Clean up
         await external_session.close()
+
+
+class TestPooledClient:
+    """Tests for the per-command pooled client."""
+
+    @pytest.mark.asyncio
+    async def test_session_uses_keepalive_pool_from_network_config(self) -> None:
+        """Connector limits and timeouts come from NetworkConfig; no force_close."""
+        network = NetworkConfig(
+            max_concurrency=4, connect_timeout=5.0, request_timeout=20.0
+        )
+        async with RemoteClient(network_config=network) as client:
+            session = await client._get_session()
+            assert session.connector is not None
+            assert session.connector.limit == 4
+            assert session.connector.limit_per_host == 4
+            assert session.connector.force_close is False
+            assert session.timeout.total == 20.0
+            assert session.timeout.connect == 5.0
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_fetches(self) -> None:
+        """Every fetch through one client goes through the same session."""
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/agents/a.agent.md", body="a")
+            m.get(f"{BASE_URL}/testkit/agents/b.agent.md", body="b")
+            async with RemoteClient() as client:
+                await client.fetch_file(BASE_URL, "testkit", "agents", "a.agent.md")
+                first = client._session
+                await client.fetch_file(BASE_URL, "testkit", "agents", "b.agent.md")
+                assert client._session is first
+
+    @pytest.mark.asyncio
+    async def test_module_helper_borrows_client_without_closing(self) -> None:
+        """Module-level helpers reuse a passed client and leave it open."""
+        from multikit.registry.remote import fetch_file
+
+        m = aioresponses()
+        with m:
+            m.get(f"{BASE_URL}/testkit/agents/a.agent.md", body="a")
+            async with RemoteClient() as client:
+                result = await fetch_file(
+                    BASE_URL, "testkit", "agents", "a.agent.md", client=client
+                )
+                assert result == "a"
+                assert client._session is not None
+                assert not client._session.closed
+
+
+class TestLocalRegistry:
+    """Plain paths and file:// URLs are read from disk without HTTP."""
+
+    @pytest.fixture
+    def local_registry(self, tmp_path, sample_registry: dict, sample_manifest: dict):
+        import json
+
+        root = tmp_path / "kits"
+        (root / "testkit" / "agents").mkdir(parents=True)
+        (root / "registry.json").write_text(json.dumps(sample_registry))
+        (root / "testkit" / "manifest.json").write_text(json.dumps(sample_manifest))
+        (root / "testkit" / "agents" / "a.agent.md").write_text("# A\n")
+        return root
+
+    @pytest.mark.asyncio
+    async def test_fetch_registry_from_path(self, local_registry) -> None:
+        async with RemoteClient() as client:
+            registry = await client.fetch_registry(str(local_registry))
+            assert registry.kits[0].name == "testkit"
+            assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_manifest_from_file_url(self, local_registry) -> None:
+        async with RemoteClient() as client:
+            manifest = await client.fetch_manifest(local_registry.as_uri(), "testkit")
+            assert manifest.name == "testkit"
+
+    @pytest.mark.asyncio
+    async def test_download_file_copies_and_verifies(
+        self, local_registry, tmp_path
+    ) -> None:
+        import hashlib
+
+        digest = hashlib.sha256(b"# A\n").hexdigest()
+        dest = tmp_path / "out" / "a.agent.md"
+        async with RemoteClient() as client:
+            result = await client.download_file(
+                str(local_registry), "testkit", "agents", "a.agent.md", dest, digest
+            )
+            assert result == digest
+            assert dest.read_bytes() == b"# A\n"
+
+            with pytest.raises(RemoteFetchError, match="sha256 mismatch"):
+                await client.download_file(
+                    str(local_registry),
+                    "testkit",
+                    "agents",
+                    "a.agent.md",
+                    dest,
+                    "0" * 64,
+                )
+            assert not dest.exists()
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_404(self, local_registry) -> None:
+        async with RemoteClient() as client:
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await client.fetch_manifest(str(local_registry), "nokit")
+            assert exc_info.value.status == 404
+            assert "nokit" in str(exc_info.value)
+
+    def test_local_registry_path(self) -> None:
+        from pathlib import Path
+
+        from multikit.registry.remote import local_registry_path
+
+        assert local_registry_path(BASE_URL) is None
+        assert local_registry_path("http://localhost:8000/kits") is None
+        assert local_registry_path("./kits") == Path("./kits")
+        assert local_registry_path("file:///srv/kits") == Path("/srv/kits")
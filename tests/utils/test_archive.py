@@ -0,0 +1,85 @@
+"""Tests for kit archive extraction."""
+
+from __future__ import annotations
+
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from multikit.utils.archive import ArchiveError, extract_archive_members
+
+
+def _tar_gz(path: Path, members: dict[str, bytes]) -> Path:
+    with tarfile.open(path, mode="w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path
+
+
+def _zip(path: Path, members: dict[str, bytes]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+class TestExtractArchiveMembers:
+    """Tests for extract_archive_members."""
+
+    def test_tar_gz_extracts_wanted_members(self, tmp_path: Path) -> None:
+        archive = _tar_gz(
+            tmp_path / "1.0.0.tar.gz",
+            {"agents/a.agent.md": b"a", "prompts/a.prompt.md": b"p"},
+        )
+        out = tmp_path / "out"
+        found = extract_archive_members(archive, out, {"agents/a.agent.md"})
+        assert found == {"agents/a.agent.md"}
+        assert (out / "agents" / "a.agent.md").read_bytes() == b"a"
+        assert not (out / "prompts").exists()
+
+    def test_zip_extracts_wanted_members(self, tmp_path: Path) -> None:
+        archive = _zip(
+            tmp_path / "1.0.0.zip",
+            {"agents/a.agent.md": b"a", "prompts/a.prompt.md": b"p"},
+        )
+        out = tmp_path / "out"
+        found = extract_archive_members(
+            archive, out, {"agents/a.agent.md", "prompts/a.prompt.md"}
+        )
+        assert found == {"agents/a.agent.md", "prompts/a.prompt.md"}
+        assert (out / "prompts" / "a.prompt.md").read_bytes() == b"p"
+
+    def test_leading_dot_slash_is_normalized(self, tmp_path: Path) -> None:
+        archive = _tar_gz(tmp_path / "1.0.0.tar.gz", {"./agents/a.agent.md": b"a"})
+        found = extract_archive_members(
+            archive, tmp_path / "out", {"agents/a.agent.md"}
+        )
+        assert found == {"agents/a.agent.md"}
+
+    def test_undeclared_members_are_not_written(self, tmp_path: Path) -> None:
+        archive = _tar_gz(
+            tmp_path / "1.0.0.tar.gz",
+            {"../escape.md": b"x", "agents/a.agent.md": b"a"},
+        )
+        out = tmp_path / "out"
+        found = extract_archive_members(archive, out, {"agents/a.agent.md"})
+        assert found == {"agents/a.agent.md"}
+        assert not (tmp_path / "escape.md").exists()
+
+    def test_missing_members_are_absent(self, tmp_path: Path) -> None:
+        archive = _tar_gz(tmp_path / "1.0.0.tar.gz", {"agents/a.agent.md": b"a"})
+        assert (
+            extract_archive_members(archive, tmp_path, {"agents/b.agent.md"}) == set()
+        )
+
+    @pytest.mark.parametrize("name", ["1.0.0.tar.gz", "1.0.0.zip"])
+    def test_corrupt_archive_raises(self, tmp_path: Path, name: str) -> None:
+        archive = tmp_path / name
+        archive.write_bytes(b"not an archive")
+        with pytest.raises(ArchiveError):
+            extract_archive_members(archive, tmp_path, {"agents/a.agent.md"})
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import random
+import re
+
+import pytest
+
 from multikit.utils.diff import (
+    DIFF_ENGINES,
+    diff_stat,
     generate_diff,
     print_colored_diff,
     prompt_overwrite,
@@ -43,6 +50,83 @@ class TestGenerateDiff:
         assert any("+modified" in line for line in result)
 
 
+def _apply(old: str, diff_lines: list[str]) -> str:
+    """Apply a unified diff to ``old`` and return the patched text."""
+    src = old.splitlines(keepends=True)
+    out: list[str] = []
+    pos = 0
+    for line in diff_lines[2:]:
+        hunk = re.match(r"@@ -(\d+)(?:,(\d+))? ", line)
+        if hunk:
+            start = int(hunk.group(1))
+            start = start if hunk.group(2) == "0" else start - 1
+            out += src[pos:start]
+            pos = start
+        elif line[0] == " ":
+            out.append(line[1:])
+            pos += 1
+        elif line[0] == "-":
+            pos += 1
+        else:
+            out.append(line[1:])
+    return "".join(out + src[pos:])
+
+
+class TestDiffEngines:
+    """The patience engine must produce valid unified diffs like difflib."""
+
+    def test_matches_difflib_on_simple_change(self) -> None:
+        old, new = "a\nb\nc\n", "a\nx\nc\n"
+        assert generate_diff(old, new) == generate_diff(old, new, engine="difflib")
+
+    @pytest.mark.parametrize("engine", sorted(DIFF_ENGINES))
+    def test_random_edits_round_trip(self, engine: str) -> None:
+        rng = random.Random(0)
+        for _ in range(300):
+            alphabet = rng.choice(["ab", "abcdefgh"])
+            old, new = (
+                "".join(f"{rng.choice(alphabet)}\n" for _ in range(rng.randint(0, 40)))
+                for _ in range(2)
+            )
+            assert _apply(old, generate_diff(old, new, engine=engine)) == new
+
+    def test_large_repetitive_file(self) -> None:
+        old_lines = [f"- name: item-{i}\n  enabled: true\n\n" for i in range(20_000)]
+        new_lines = list(old_lines)
+        new_lines[10_000] = "- name: changed\n  enabled: false\n\n"
+        old, new = "".join(old_lines), "".join(new_lines)
+        diff = generate_diff(old, new)
+        assert "-- name: item-10000\n" in diff
+        assert "+- name: changed\n" in diff
+        assert _apply(old, diff) == new
+
+    def test_engine_from_environment(self, monkeypatch) -> None:
+        calls: list[str] = []
+
+        def recording(a, b):
+            calls.append("custom")
+            return DIFF_ENGINES["difflib"](a, b)
+
+        monkeypatch.setitem(DIFF_ENGINES, "custom", recording)
+        monkeypatch.setenv("MULTIKIT_DIFF_ENGINE", "custom")
+        assert generate_diff("old\n", "new\n")
+        assert calls == ["custom"]
+
+    def test_unknown_engine(self) -> None:
+        with pytest.raises(ValueError, match="Unknown diff engine"):
+            generate_diff("old\n", "new\n", engine="nope")
+
+
+class TestDiffStat:
+    """Tests for diff_stat."""
+
+    def test_counts_lines(self) -> None:
+        assert diff_stat("a\nb\nc\n", "a\nB\nc\nd\n") == (2, 1)
+
+    def test_identical(self) -> None:
+        assert diff_stat("same\n", "same\n") == (0, 0)
+
+
 class TestPrintColoredDiff:
     """Tests for print_colored_diff."""
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+
 import pytest
 from pathlib import Path
 
@@ -11,9 +13,10 @@ from multikit.utils.files import (
     async_move_file,
     async_read_file,
     async_write_file,
+    commit_file,
     delete_kit_files,
-    move_staged_files,
-    stage_file,
+    file_matches,
+    file_sha256,
 )
 
 
@@ -30,6 +33,14 @@ class TestAtomicStaging:
             path = staging_dir
         assert not path.exists()
 
+    def test_staging_dir_inside_parent(self, tmp_path: Path) -> None:
+        parent = tmp_path / ".github"
+        with atomic_staging(parent=parent) as staging_dir:
+            assert staging_dir.parent == parent
+            assert staging_dir.name.startswith(f".multikit-staging-{os.getpid()}-")
+            assert staging_dir.stat().st_dev == parent.stat().st_dev
+        assert list(parent.iterdir()) == []
+
     def test_staging_dir_cleaned_on_error(self) -> None:
         path = None
         try:
@@ -42,126 +53,6 @@ class TestAtomicStaging:
         assert not path.exists()
 
 
-class TestStageFile:
-    """Tests for stage_file."""
-
-    def test_stage_file(self) -> None:
-        with atomic_staging() as staging_dir:
-            path = stage_file(staging_dir, "agents", "test.agent.md", "content")
-            assert path.exists()
-            assert path.read_text(encoding="utf-8") == "content"
-
-    def test_stage_creates_subdirs(self) -> None:
-        with atomic_staging() as staging_dir:
-            path = stage_file(staging_dir, "deep/nested", "file.md", "data")
-            assert path.exists()
-
-
-class TestMoveStaged:
-    """Tests for move_staged_files."""
-
-    def test_move_files(self, tmp_path: Path) -> None:
-        target = tmp_path / "target"
-        target.mkdir()
-
-        with atomic_staging() as staging_dir:
-            stage_file(staging_dir, "agents", "a.agent.md", "agent content")
-            stage_file(staging_dir, "prompts", "p.prompt.md", "prompt content")
-
-            installed = move_staged_files(
-                staging_dir,
-                target,
-                [("agents", "a.agent.md"), ("prompts", "p.prompt.md")],
-            )
-
-        assert len(installed) == 2
-        assert (target / "agents" / "a.agent.md").read_text(
-            encoding="utf-8"
-        ) == "agent content"
-
-    def test_move_skips_missing(self, tmp_path: Path) -> None:
-        target = tmp_path / "target"
-        target.mkdir()
-
-        with atomic_staging() as staging_dir:
-            installed = move_staged_files(
-                staging_dir,
-                target,
-                [("agents", "nonexistent.agent.md")],
-            )
-
-        assert installed == []
-
-    def test_move_partial_failure(self, tmp_path: Path, monkeypatch) -> None:
-        """If shutil.move fails for one file, others still move and exception propagates."""
-        target = tmp_path / "target"
-        target.mkdir()
-
-        # create two staged files
-        with atomic_staging() as staging_dir:
-            stage_file(staging_dir, "agents", "a.agent.md", "a")
-            stage_file(staging_dir, "agents", "b.agent.md", "b")
-            # monkeypatch shutil.move to raise on second file
-            import shutil
-
-            orig_move = shutil.move
-
-            def fake_move(src, dst):
-                if src.endswith("b.agent.md"):
-                    raise PermissionError("deny")
-                return orig_move(src, dst)
-
-            monkeypatch.setattr(shutil, "move", fake_move)
-
-            with pytest.raises(PermissionError):
-                move_staged_files(
-                    staging_dir,
-                    target,
-                    [("agents", "a.agent.md"), ("agents", "b.agent.md")],
-                )
-
-            # first file should have moved before the error
-            assert (target / "agents" / "a.agent.md").exists()
-            # second file should remain in staging dir
-            assert (staging_dir / "agents" / "b.agent.md").exists()
-
-    def test_move_cross_device(self, tmp_path: Path, monkeypatch) -> None:
-        """Simulate cross-device link error and ensure subsequent files are untouched."""
-        target = tmp_path / "target"
-        target.mkdir()
-
-        with atomic_staging() as staging_dir:
-            stage_file(staging_dir, "agents", "a.agent.md", "a")
-            stage_file(staging_dir, "agents", "b.agent.md", "b")
-
-            import shutil
-
-            orig_move = shutil.move
-
-            def fake_move(src, dst):
-                if src.endswith("a.agent.md"):
-                    # simulate cross-device link error
-                    raise OSError(18, "Cross-device link")
-                return orig_move(src, dst)
-
-            monkeypatch.setattr(shutil, "move", fake_move)
-
-            with pytest.raises(OSError):
-                move_staged_files(
-                    staging_dir,
-                    target,
-                    [("agents", "a.agent.md"), ("agents", "b.agent.md")],
-                )
-
-            # first file should still exist in staging (move never succeeded)
-            assert (staging_dir / "agents" / "a.agent.md").exists()
-            # second file should likewise remain untouched in staging
-            assert (staging_dir / "agents" / "b.agent.md").exists()
-            # target directory may contain empty directories (created before move)
-            # but no actual file should have been copied
-            assert not any(f.is_file() for f in target.rglob("*"))
-
-
 class TestDeleteKitFiles:
     """Tests for delete_kit_files."""
 
@@ -257,3 +148,45 @@ class TestAsyncFileOperations:
         result = await async_delete_file(file_path)
 
         assert result is False
+
+
+class TestFileHashing:
+    """Tests for file_sha256 and file_matches."""
+
+    def test_file_sha256(self, tmp_path: Path) -> None:
+        import hashlib
+
+        path = tmp_path / "a.md"
+        path.write_bytes(b"hello\n")
+        assert file_sha256(path) == hashlib.sha256(b"hello\n").hexdigest()
+
+    def test_file_matches(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.md"
+        path.write_bytes(b"hello\n")
+        digest = file_sha256(path)
+        assert file_matches(path, digest)
+        assert file_matches(path, digest, size=6)
+        assert not file_matches(path, digest, size=7)
+        assert not file_matches(path, "0" * 64)
+
+    def test_file_matches_missing_file(self, tmp_path: Path) -> None:
+        assert not file_matches(tmp_path / "missing.md", "0" * 64)
+
+
+class TestCommitFile:
+    """Tests for commit_file."""
+
+    def test_replaces_existing_file_by_rename(self, tmp_path: Path) -> None:
+        with atomic_staging(parent=tmp_path) as staging_dir:
+            staged = staging_dir / "a.agent.md"
+            staged.write_text("new", encoding="utf-8")
+            inode = staged.stat().st_ino
+            dst = tmp_path / "agents" / "a.agent.md"
+            dst.parent.mkdir()
+            dst.write_text("old", encoding="utf-8")
+
+            commit_file(staged, dst)
+
+        assert dst.read_text(encoding="utf-8") == "new"
+        # Same inode: the staged file was renamed, not copied
+        assert dst.stat().st_ino == inode
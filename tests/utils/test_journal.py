@@ -0,0 +1,256 @@
+"""Tests for the transaction journal and crash recovery."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from multikit.models.config import InstalledKit, MultikitConfig
+from multikit.utils import journal
+from multikit.utils.journal import (
+    Transaction,
+    has_pending_journal,
+    journal_path,
+    recover,
+    sweep_stale_files,
+)
+from multikit.utils.toml_io import ConfigSession, load_config, save_config
+
+
+class _Crash(BaseException):
+    """Stands in for the process being killed mid-commit."""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    (root / ".github" / "agents").mkdir(parents=True)
+    save_config(root, MultikitConfig())
+    (root / ".github" / "agents" / "old.agent.md").write_text("old\n")
+    return root
+
+
+def _plan(txn: Transaction, project: Path, names: list[str]) -> None:
+    """Stage ``names`` (new content) and plan their moves into agents/."""
+    for name in names:
+        staged = txn.staging_dir / "kit" / name
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        staged.write_text(f"new {name}\n")
+        txn.add(staged, project / ".github" / "agents" / name)
+
+
+def _crash_commit(project: Path, monkeypatch, names: list[str], after: int) -> None:
+    """Run a commit that dies after ``after`` renames, leaving the journal."""
+    real_commit = journal.commit_file
+    done: list[Path] = []
+
+    def crashing(src: Path, dst: Path) -> None:
+        if len(done) == after:
+            raise _Crash
+        real_commit(src, dst)
+        done.append(dst)
+
+    def no_rollback(*_args) -> None:
+        raise _Crash
+
+    monkeypatch.setattr(journal, "commit_file", crashing)
+    monkeypatch.setattr(journal, "_rollback", no_rollback)
+    session = ConfigSession(project)
+    session.set_kit("kit", InstalledKit(version="2.0.0", files=names))
+    with pytest.raises(_Crash), Transaction(project, session) as txn:
+        _plan(txn, project, names)
+        txn.commit()
+    monkeypatch.undo()
+
+
+class TestTransaction:
+    def test_commit_moves_files_and_records_config(self, project: Path) -> None:
+        session = ConfigSession(project)
+        with Transaction(project, session) as txn:
+            _plan(txn, project, ["a.agent.md", "old.agent.md"])
+            session.set_kit("kit", InstalledKit(version="1.0.0"))
+            txn.commit()
+
+        agents = project / ".github" / "agents"
+        assert (agents / "a.agent.md").read_text() == "new a.agent.md\n"
+        assert (agents / "old.agent.md").read_text() == "new old.agent.md\n"
+        assert load_config(project).is_installed("kit")
+        assert not has_pending_journal(project)
+        assert not list((project / ".github").glob(".multikit-staging-*"))
+        # The emptied journal directory does not linger in the project
+        assert not (project / ".multikit").exists()
+
+    def test_commit_recorded_by_profiler(self, project: Path) -> None:
+        from multikit.utils import profiling
+
+        profiling.enable()
+        try:
+            session = ConfigSession(project)
+            with Transaction(project, session) as txn:
+                _plan(txn, project, ["a.agent.md", "b.agent.md"])
+                txn.commit()
+        finally:
+            profiler = profiling.disable()
+
+        assert profiler is not None
+        (span,) = [s for s in profiler.spans if s.phase == "commit"]
+        assert span.name == "install"
+        assert span.args == {"files": 2}
+
+    def test_leaving_without_commit_changes_nothing(self, project: Path) -> None:
+        session = ConfigSession(project)
+        with Transaction(project, session) as txn:
+            _plan(txn, project, ["a.agent.md"])
+            session.set_kit("kit", InstalledKit(version="1.0.0"))
+
+        assert not (project / ".github" / "agents" / "a.agent.md").exists()
+        assert not load_config(project).is_installed("kit")
+        assert not list((project / ".github").glob(".multikit-staging-*"))
+
+    def test_failed_commit_rolls_back(self, project: Path, monkeypatch) -> None:
+        real_flush = ConfigSession.flush
+
+        def failing_flush(self) -> None:
+            real_flush(self)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(ConfigSession, "flush", failing_flush)
+        session = ConfigSession(project)
+        session.set_kit("kit", InstalledKit(version="1.0.0"))
+        with pytest.raises(OSError), Transaction(project, session) as txn:
+            _plan(txn, project, ["a.agent.md", "old.agent.md"])
+            txn.commit()
+
+        agents = project / ".github" / "agents"
+        assert not (agents / "a.agent.md").exists()
+        assert (agents / "old.agent.md").read_text() == "old\n"
+        assert not load_config(project).is_installed("kit")
+        assert not has_pending_journal(project)
+
+    def test_replaced_file_backed_up_by_hard_link(
+        self, project: Path, monkeypatch
+    ) -> None:
+        old = project / ".github" / "agents" / "old.agent.md"
+        inode = old.stat().st_ino
+        _crash_commit(project, monkeypatch, ["old.agent.md", "b.agent.md"], after=1)
+
+        backups = list((project / ".github").glob(".multikit-staging-*/.rollback/0"))
+        assert len(backups) == 1
+        assert backups[0].stat().st_ino == inode
+
+
+class TestRecover:
+    def test_nothing_to_recover(self, project: Path) -> None:
+        assert recover(project) is None
+
+    def test_finishes_interrupted_commit(self, project: Path, monkeypatch) -> None:
+        names = ["a.agent.md", "old.agent.md", "c.agent.md"]
+        _crash_commit(project, monkeypatch, names, after=1)
+        assert has_pending_journal(project)
+
+        assert recover(project) == ("install", "finished")
+
+        agents = project / ".github" / "agents"
+        for name in names:
+            assert (agents / name).read_text() == f"new {name}\n"
+        assert load_config(project).get_kit("kit").version == "2.0.0"
+        assert not has_pending_journal(project)
+        assert not list((project / ".github").glob(".multikit-staging-*"))
+        assert not (project / ".multikit").exists()
+
+    def test_rollback_restores_previous_state(self, project: Path, monkeypatch) -> None:
+        names = ["a.agent.md", "old.agent.md", "c.agent.md"]
+        _crash_commit(project, monkeypatch, names, after=2)
+
+        assert recover(project, rollback=True) == ("install", "rolled back")
+
+        agents = project / ".github" / "agents"
+        assert sorted(p.name for p in agents.iterdir()) == ["old.agent.md"]
+        assert (agents / "old.agent.md").read_text() == "old\n"
+        assert not load_config(project).is_installed("kit")
+        assert not has_pending_journal(project)
+
+    def test_rolls_back_when_staged_file_is_lost(
+        self, project: Path, monkeypatch
+    ) -> None:
+        _crash_commit(project, monkeypatch, ["a.agent.md", "b.agent.md"], after=1)
+        (staging,) = (project / ".github").glob(".multikit-staging-*")
+        (staging / "kit" / "b.agent.md").unlink()
+
+        assert recover(project) == ("install", "rolled back")
+        assert not (project / ".github" / "agents" / "a.agent.md").exists()
+
+    def test_finishes_batch_over_existing_files(
+        self, project: Path, monkeypatch
+    ) -> None:
+        agents = project / ".github" / "agents"
+        names = ["a.agent.md", "b.agent.md", "c.agent.md"]
+        for name in names:
+            (agents / name).write_text("old\n")
+        _crash_commit(project, monkeypatch, names, after=1)
+
+        assert recover(project) == ("install", "finished")
+        for name in names:
+            assert (agents / name).read_text() == f"new {name}\n"
+
+    def test_rolls_back_when_staged_file_over_existing_is_lost(
+        self, project: Path, monkeypatch
+    ) -> None:
+        agents = project / ".github" / "agents"
+        names = ["a.agent.md", "b.agent.md", "c.agent.md"]
+        for name in names:
+            (agents / name).write_text("old\n")
+        _crash_commit(project, monkeypatch, names, after=1)
+        (staging,) = (project / ".github").glob(".multikit-staging-*")
+        (staging / "kit" / "c.agent.md").unlink()
+
+        assert recover(project) == ("install", "rolled back")
+        for name in names:
+            assert (agents / name).read_text() == "old\n"
+        assert not load_config(project).is_installed("kit")
+        assert not has_pending_journal(project)
+
+    def test_unreadable_journal_raises(self, project: Path) -> None:
+        path = journal_path(project)
+        path.parent.mkdir()
+        path.write_text("{not json")
+        with pytest.raises(ValueError, match="journal"):
+            recover(project)
+
+
+class TestSweepStaleFiles:
+    def _dead_pid(self) -> int:
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        return proc.pid
+
+    def test_removes_leftovers_of_dead_processes(self, project: Path) -> None:
+        pid = self._dead_pid()
+        github = project / ".github"
+        stale = github / f".multikit-staging-{pid}-abc"
+        (stale / "kit").mkdir(parents=True)
+        live = github / f".multikit-staging-{os.getpid()}-def"
+        live.mkdir()
+        tmp = project / f".multikit.toml.{pid}.1a2b3c4d.tmp"
+        tmp.write_text("partial")
+
+        assert sweep_stale_files(project) == 2
+        assert not stale.exists()
+        assert not tmp.exists()
+        assert live.exists()
+
+    def test_keeps_staging_while_journal_pending(
+        self, project: Path, monkeypatch
+    ) -> None:
+        _crash_commit(project, monkeypatch, ["a.agent.md"], after=0)
+        (staging,) = (project / ".github").glob(".multikit-staging-*")
+        # Pretend the crashed process was another, now dead, one
+        dead = staging.with_name(f".multikit-staging-{self._dead_pid()}-x")
+        staging.rename(dead)
+
+        assert sweep_stale_files(project) == 0
+        assert dead.exists()
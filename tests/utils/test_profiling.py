@@ -0,0 +1,125 @@
+"""Tests for the opt-in profiling layer."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from aioresponses import aioresponses
+
+from multikit.registry.remote import RemoteClient
+from multikit.utils import profiling
+from multikit.utils.profiling import Profiler, percentile, timed
+
+BASE_URL = "https://raw.githubusercontent.com/devcomfort/multikit/main/kits"
+
+
+@pytest.fixture
+def profiler():
+    active = profiling.enable()
+    yield active
+    profiling.disable()
+
+
+class TestPercentile:
+    def test_nearest_rank(self) -> None:
+        ordered = [float(n) for n in range(1, 101)]
+        assert percentile(ordered, 50) == 50.0
+        assert percentile(ordered, 90) == 90.0
+        assert percentile(ordered, 99) == 99.0
+
+    def test_single_sample(self) -> None:
+        assert percentile([0.25], 99) == 0.25
+
+
+class TestProfiler:
+    def test_disabled_records_nothing(self) -> None:
+        calls: list[int] = []
+
+        @timed("stage")
+        def work() -> int:
+            calls.append(1)
+            return 7
+
+        assert profiling.active() is None
+        with profiling.span("stage"):
+            assert work() == 7
+        assert calls == [1]
+
+    def test_timed_and_span_record_phases(self, profiler: Profiler) -> None:
+        @timed("config")
+        def load() -> None:
+            pass
+
+        load()
+        load()
+        with profiling.span("diff", "x.md"):
+            pass
+
+        totals = profiler.phase_totals()
+        assert totals["config"][0] == 2
+        assert totals["diff"][0] == 1
+        assert [s.name for s in profiler.spans] == ["load", "load", "x.md"]
+
+    def test_report_lists_phases_and_hosts(self, profiler: Profiler, capsys) -> None:
+        profiler.add("http", "GET /a", 0.0, 0.010)
+        profiler.record_request("example.com", 0.010)
+        profiler.record_request("example.com", 0.030)
+        profiling.disable()
+
+        profiler.print_report(sys.stdout)
+        out = capsys.readouterr().out
+        assert "http" in out
+        assert "example.com" in out
+        assert "30.0" in out  # max / p90 in ms
+
+    def test_chrome_trace_format(self, profiler: Profiler, tmp_path: Path) -> None:
+        with profiling.span("stage", "a.md", bytes=3):
+            pass
+        trace_path = tmp_path / "trace.json"
+        profiler.write_chrome_trace(trace_path)
+
+        trace = json.loads(trace_path.read_text(encoding="utf-8"))
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert complete[0]["name"] == "a.md"
+        assert complete[0]["cat"] == "stage"
+        assert complete[0]["args"] == {"bytes": 3}
+        assert complete[0]["dur"] >= 0
+        assert any(e["ph"] == "M" for e in trace["traceEvents"])
+
+
+class TestRemoteInstrumentation:
+    @pytest.mark.asyncio
+    async def test_fetch_records_http_and_validation(
+        self, profiler: Profiler, sample_registry: dict
+    ) -> None:
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", payload=sample_registry)
+            async with RemoteClient(base_url=BASE_URL) as client:
+                await client.fetch_registry(BASE_URL)
+
+        phases = profiler.phase_totals()
+        assert phases["http"][0] == 1
+        assert phases["validate"][0] == 1
+        assert list(profiler.requests) == ["raw.githubusercontent.com"]
+
+    @pytest.mark.asyncio
+    async def test_retry_wait_is_recorded(
+        self, profiler: Profiler, sample_registry: dict, monkeypatch
+    ) -> None:
+        async def no_sleep(_delay: float) -> None:
+            return None
+
+        monkeypatch.setattr("multikit.registry.remote.asyncio.sleep", no_sleep)
+        with aioresponses() as m:
+            m.get(f"{BASE_URL}/registry.json", status=503)
+            m.get(f"{BASE_URL}/registry.json", payload=sample_registry)
+            async with RemoteClient(base_url=BASE_URL) as client:
+                await client.fetch_registry(BASE_URL)
+
+        phases = profiler.phase_totals()
+        assert phases["http"][0] == 2
+        assert phases["retry_wait"][0] == 1
+        assert len(profiler.requests["raw.githubusercontent.com"]) == 2
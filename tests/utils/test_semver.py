@@ -0,0 +1,45 @@
+"""Tests for SemVer parsing and precedence."""
+
+from __future__ import annotations
+
+import pytest
+
+from multikit.utils.semver import is_newer, parse_version
+
+
+class TestParseVersion:
+    def test_release(self) -> None:
+        assert parse_version("1.2.3") == (1, 2, 3, True, ())
+
+    def test_leading_v_and_build_metadata(self) -> None:
+        assert parse_version("v1.2.3+build.7") == parse_version("1.2.3")
+
+    @pytest.mark.parametrize("version", ["1.2", "01.2.3", "1.2.3-", "latest", ""])
+    def test_invalid(self, version: str) -> None:
+        assert parse_version(version) is None
+
+
+class TestIsNewer:
+    @pytest.mark.parametrize(
+        ("candidate", "current"),
+        [
+            ("1.10.0", "1.9.0"),
+            ("2.0.0", "1.99.99"),
+            ("1.0.0", "1.0.0-rc.1"),
+            ("1.0.0-rc.2", "1.0.0-rc.1"),
+            ("1.0.0-rc.10", "1.0.0-rc.2"),
+            ("1.0.0-beta", "1.0.0-alpha.1"),
+            ("1.0.0-alpha.beta", "1.0.0-alpha.1"),
+            ("1.0.0-alpha.1", "1.0.0-alpha"),
+        ],
+    )
+    def test_semver_precedence(self, candidate: str, current: str) -> None:
+        assert is_newer(candidate, current)
+        assert not is_newer(current, candidate)
+
+    def test_equal_versions(self) -> None:
+        assert not is_newer("1.0.0", "1.0.0+build.5")
+
+    def test_unparsable_versions_differ(self) -> None:
+        assert is_newer("2024-06", "2024-05")
+        assert not is_newer("nightly", "nightly")
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
+import pytest
+
 from multikit.models.config import InstalledKit, MultikitConfig, NetworkConfig
+from multikit.models.lock import LockedFile, LockedKit, Lockfile
+from multikit.utils import toml_io
 from multikit.utils.toml_io import (
+    CONFIG_LOCK_NAME,
+    STATE_DIR,
+    ConfigSession,
+    config_lock,
     load_config,
+    load_lock,
     read_toml,
     save_config,
+    save_lock,
     write_toml,
 )
 
@@ -288,3 +300,246 @@ class TestBackupNonExistentConfig:
         # Verify no backup files created
         backups = list(tmp_path.glob("*.corrupted.*"))
         assert backups == []
+
+
+class TestLockfile:
+    """Tests for multikit.lock load/save."""
+
+    def test_missing_lock_returns_none(self, tmp_path: Path) -> None:
+        assert load_lock(tmp_path) is None
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        lock = Lockfile(
+            kits={
+                "testkit": LockedKit(
+                    version="1.0.0",
+                    registry_url="https://example.com/kits",
+                    files=[
+                        LockedFile(
+                            path=".github/agents/testkit.design.agent.md",
+                            source="agents/testkit.design.agent.md",
+                            sha256="a" * 64,
+                            size=12,
+                        )
+                    ],
+                )
+            }
+        )
+        save_lock(tmp_path, lock)
+        text = (tmp_path / "multikit.lock").read_text(encoding="utf-8")
+        assert text.startswith("# This file is generated by multikit")
+        assert load_lock(tmp_path) == lock
+
+    def test_corrupted_lock_raises(self, tmp_path: Path) -> None:
+        (tmp_path / "multikit.lock").write_text("not = [valid", encoding="utf-8")
+        with pytest.raises(ValueError, match="multikit.lock"):
+            load_lock(tmp_path)
+
+
+class TestAtomicWrites:
+    """multikit.toml / multikit.lock are replaced, never rewritten in place."""
+
+    def test_failed_write_keeps_previous_file(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        save_config(tmp_path, MultikitConfig(registry_url="https://before.example"))
+
+        def _boom(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("multikit.utils.toml_io.os.replace", _boom)
+        with pytest.raises(OSError):
+            save_config(tmp_path, MultikitConfig(registry_url="https://after.example"))
+
+        assert load_config(tmp_path).registry_url == "https://before.example"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["multikit.toml"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_write_honours_umask(self, tmp_path: Path) -> None:
+        old = os.umask(0o022)
+        try:
+            save_config(tmp_path, MultikitConfig())
+        finally:
+            os.umask(old)
+        assert (tmp_path / "multikit.toml").stat().st_mode & 0o777 == 0o644
+
+
+class TestConfigLock:
+    """Advisory locking around read-modify-write."""
+
+    def test_reentrant(self, tmp_path: Path) -> None:
+        with config_lock(tmp_path):
+            with config_lock(tmp_path):
+                save_config(tmp_path, MultikitConfig())
+            assert (tmp_path / STATE_DIR / CONFIG_LOCK_NAME).exists()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows keeps the file")
+    def test_lock_file_removed_on_release(self, tmp_path: Path) -> None:
+        with config_lock(tmp_path):
+            pass
+        assert not (tmp_path / STATE_DIR).exists()
+
+    def test_lock_keeps_other_state_files(self, tmp_path: Path) -> None:
+        (tmp_path / STATE_DIR).mkdir()
+        (tmp_path / STATE_DIR / "journal").write_text("{}", encoding="utf-8")
+        with config_lock(tmp_path):
+            pass
+        assert (tmp_path / STATE_DIR / "journal").exists()
+
+    def test_threads_are_serialised(self, tmp_path: Path) -> None:
+        import threading
+
+        save_config(tmp_path, MultikitConfig())
+
+        def add_kits(worker: int) -> None:
+            for i in range(10):
+                with config_lock(tmp_path):
+                    config = load_config(tmp_path)
+                    config.kits[f"kit-{worker}-{i}"] = InstalledKit(version="1.0.0")
+                    save_config(tmp_path, config)
+
+        threads = [threading.Thread(target=add_kits, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(load_config(tmp_path).kits) == 40
+
+    def test_processes_do_not_lose_updates(self, tmp_path: Path) -> None:
+        """Parallel CLI-style processes each add kits; none are lost."""
+        import subprocess
+
+        save_config(tmp_path, MultikitConfig())
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from multikit.models.config import InstalledKit\n"
+            "from multikit.utils.toml_io import config_lock, load_config, save_config\n"
+            "root, worker = Path(sys.argv[1]), sys.argv[2]\n"
+            "for i in range(10):\n"
+            "    with config_lock(root):\n"
+            "        config = load_config(root)\n"
+            "        config.kits[f'kit-{worker}-{i}'] = InstalledKit(version='1.0.0')\n"
+            "        save_config(root, config)\n"
+        )
+        src_dir = Path(__file__).resolve().parents[2] / "src"
+        env = {**os.environ, "PYTHONPATH": str(src_dir)}
+        procs = [
+            subprocess.Popen(
+                [sys.executable, "-c", script, str(tmp_path), str(n)], env=env
+            )
+            for n in range(4)
+        ]
+        assert all(proc.wait(timeout=60) == 0 for proc in procs)
+
+        assert len(load_config(tmp_path).kits) == 40
+
+
+def _locked(version: str = "1.0.0") -> LockedKit:
+    return LockedKit(version=version, registry_url="https://example.com/kits")
+
+
+class TestConfigSession:
+    """One parse and at most one write of each file per command."""
+
+    def _count(self, monkeypatch, name: str) -> list[Path]:
+        calls: list[Path] = []
+        real = getattr(toml_io, name)
+
+        def counting(project_dir, *args):
+            calls.append(project_dir)
+            return real(project_dir, *args)
+
+        monkeypatch.setattr(toml_io, name, counting)
+        return calls
+
+    def test_parses_once_and_flushes_once(self, tmp_path: Path, monkeypatch) -> None:
+        save_config(tmp_path, MultikitConfig())
+        loads = self._count(monkeypatch, "load_config")
+        saves = self._count(monkeypatch, "save_config")
+        lock_saves = self._count(monkeypatch, "save_lock")
+
+        with ConfigSession(tmp_path) as session:
+            for i in range(5):
+                assert not session.config.is_installed(f"kit{i}")
+                session.set_kit(f"kit{i}", InstalledKit(version="1.0.0"), _locked())
+
+        assert (len(loads), len(saves), len(lock_saves)) == (1, 1, 1)
+        assert sorted(load_config(tmp_path).kits) == [f"kit{i}" for i in range(5)]
+        assert sorted(load_lock(tmp_path).kits) == [f"kit{i}" for i in range(5)]
+
+    def test_clean_session_writes_nothing(self, tmp_path: Path, monkeypatch) -> None:
+        save_config(tmp_path, MultikitConfig())
+        saves = self._count(monkeypatch, "save_config")
+
+        with ConfigSession(tmp_path) as session:
+            assert not session.dirty
+
+        assert saves == []
+        assert not (tmp_path / "multikit.lock").exists()
+
+    def test_flush_merges_concurrent_changes(self, tmp_path: Path) -> None:
+        save_config(tmp_path, MultikitConfig())
+        session = ConfigSession(tmp_path)
+        session.set_kit("mine", InstalledKit(version="1.0.0"))
+
+        # Another process records a kit after this session parsed the file
+        other = load_config(tmp_path)
+        other.kits["theirs"] = InstalledKit(version="2.0.0")
+        save_config(tmp_path, other)
+
+        session.flush()
+        assert sorted(load_config(tmp_path).kits) == ["mine", "theirs"]
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path, monkeypatch) -> None:
+        save_config(tmp_path, MultikitConfig())
+        session = ConfigSession(tmp_path)
+        loads = self._count(monkeypatch, "load_config")
+
+        session.set_kit("a", InstalledKit(version="1.0.0"))
+        session.flush()
+        session.set_kit("b", InstalledKit(version="1.0.0"))
+        session.flush()
+
+        assert loads == []
+        assert sorted(load_config(tmp_path).kits) == ["a", "b"]
+
+    def test_remove_kit_updates_config_and_lock(self, tmp_path: Path) -> None:
+        save_config(tmp_path, MultikitConfig(kits={"a": InstalledKit(version="1")}))
+        save_lock(tmp_path, Lockfile(kits={"a": _locked(), "b": _locked()}))
+
+        with ConfigSession(tmp_path) as session:
+            session.remove_kit("a")
+            assert not session.config.is_installed("a")
+
+        assert load_config(tmp_path).kits == {}
+        assert list(load_lock(tmp_path).kits) == ["b"]
+
+    def test_corrupted_lock_kept_on_removal(self, tmp_path: Path) -> None:
+        save_config(tmp_path, MultikitConfig(kits={"a": InstalledKit(version="1")}))
+        (tmp_path / "multikit.lock").write_text("not = [valid", encoding="utf-8")
+
+        with ConfigSession(tmp_path) as session:
+            session.remove_kit("a")
+
+        assert (tmp_path / "multikit.lock").read_text() == "not = [valid"
+
+    def test_corrupted_lock_rewritten_with_new_pins(
+        self, tmp_path: Path, capsys
+    ) -> None:
+        (tmp_path / "multikit.lock").write_text("not = [valid", encoding="utf-8")
+
+        with ConfigSession(tmp_path) as session:
+            session.set_kit("a", InstalledKit(version="1.0.0"), _locked())
+
+        assert list(load_lock(tmp_path).kits) == ["a"]
+        assert "Rewriting" in capsys.readouterr().err
+
+    def test_flushes_when_command_fails(self, tmp_path: Path) -> None:
+        with pytest.raises(SystemExit):
+            with ConfigSession(tmp_path) as session:
+                session.set_kit("a", InstalledKit(version="1.0.0"))
+                sys.exit(1)
+
+        assert load_config(tmp_path).is_installed("a")